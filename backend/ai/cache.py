@@ -0,0 +1,139 @@
+# backend/ai/cache.py
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+
+def normalize_text(text: str) -> str:
+    """נרמול טקסט לפני גיבוב: NFKC, רווחים מאוחדים, בלי רווחים בקצוות."""
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+def enrichment_key(text: str, model: str) -> str:
+    """מפתח תוכן (content-addressed) לתוצאת העשרה: hash של הטקסט המנורמל + שם המודל."""
+    payload = f"{model}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class MongoCacheStore:
+    """
+    שכבה שנייה של ה-cache שנשמרת במונגו ושורדת ריסטארט.
+    כל רשומה: {_id: key, value: {...}, used_at: epoch}. פינוי לפי גודל – הכי פחות בשימוש יוצא.
+    הבנאי לא פונה למונגו (נבנה בזמן import); האינדקס נוצר ב-ensure_indexes או בכתיבה הראשונה.
+    """
+
+    def __init__(self, collection, max_entries: int = 100_000):
+        self.collection = collection
+        self.max_entries = max_entries
+        self._indexed = False
+
+    def ensure_indexes(self) -> List[str]:
+        if not self._indexed:
+            self.collection.create_index("used_at", name="used_at")
+            self._indexed = True
+        return ["used_at"]
+
+    def get_many(self, keys: List[str]) -> Dict[str, dict]:
+        if not keys:
+            return {}
+        docs = self.collection.find({"_id": {"$in": keys}}, {"value": 1})
+        found = {d["_id"]: d["value"] for d in docs}
+        if found:
+            self.collection.update_many({"_id": {"$in": list(found)}},
+                                        {"$set": {"used_at": time.time()}})
+        return found
+
+    def put_many(self, items: Dict[str, dict]) -> int:
+        """שומר ומחזיר כמה רשומות פונו כדי לשמור על max_entries."""
+        if not items:
+            return 0
+        from pymongo import UpdateOne
+        self.ensure_indexes()
+        now = time.time()
+        self.collection.bulk_write(
+            [UpdateOne({"_id": k}, {"$set": {"value": v, "used_at": now}}, upsert=True)
+             for k, v in items.items()],
+            ordered=False,
+        )
+        excess = self.collection.estimated_document_count() - self.max_entries
+        if excess <= 0:
+            return 0
+        old = self.collection.find({}, {"_id": 1}).sort("used_at", 1).limit(excess)
+        res = self.collection.delete_many({"_id": {"$in": [d["_id"] for d in old]}})
+        return res.deleted_count
+
+
+class EnrichmentCache:
+    """
+    cache לתוצאות NLP (topic/score/entities) לפי מפתח תוכן.
+    שכבה 1: LRU בזיכרון. שכבה 2 (אופציונלית): store חיצוני, למשל MongoCacheStore.
+    """
+
+    def __init__(self, max_entries: int = 5000, store: Optional[MongoCacheStore] = None):
+        self.max_entries = max_entries
+        self.store = store
+        self._lru: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, dict] = {}
+        with self._lock:
+            for k in keys:
+                if k in self._lru:
+                    self._lru.move_to_end(k)
+                    found[k] = self._lru[k]
+        missing = [k for k in keys if k not in found]
+
+        from_store: Dict[str, dict] = {}
+        if missing and self.store is not None:
+            try:
+                from_store = self.store.get_many(missing)
+            except Exception as e:
+                print("⚠️ NLP cache store unavailable:", e)
+
+        with self._lock:
+            for k, v in from_store.items():
+                self._remember(k, v)
+            self.hits += len(found) + len(from_store)
+            self.store_hits += len(from_store)
+            self.misses += len(missing) - len(from_store)
+        found.update(from_store)
+        return found
+
+    def put_many(self, items: Dict[str, dict]) -> None:
+        with self._lock:
+            for k, v in items.items():
+                self._remember(k, v)
+        if items and self.store is not None:
+            try:
+                self.evictions += self.store.put_many(items)
+            except Exception as e:
+                print("⚠️ NLP cache store write failed:", e)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._lru),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "store": type(self.store).__name__ if self.store is not None else None,
+        }
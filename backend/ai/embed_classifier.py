@@ -0,0 +1,91 @@
+# backend/ai/embed_classifier.py
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+from transformers import AutoModel, AutoTokenizer
+
+from backend.models.schemas import CATEGORIES
+
+ENCODER_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# כמה ניסוחים לכל קטגוריה; ה-prototype הוא הממוצע המנורמל של ה-embeddings שלהם
+LABEL_PROMPTS: Dict[str, List[str]] = {
+    "Politics": [
+        "politics, government and elections",
+        "parliament passes a new law",
+        "the president and ministers announce a policy",
+        "diplomacy, war and international relations",
+    ],
+    "Finance": [
+        "finance, markets and the economy",
+        "stocks and shares rise on Wall Street",
+        "company earnings, banks and interest rates",
+        "business deals, trade and inflation",
+    ],
+    "Science": [
+        "science, research and discovery",
+        "scientists publish a new study",
+        "space, astronomy and physics",
+        "technology, medicine and health research",
+    ],
+    "Culture": [
+        "culture, arts and entertainment",
+        "a new film, music album or book is released",
+        "a festival, museum exhibition or theatre show",
+        "celebrities, fashion and television",
+    ],
+    "Sport": [
+        "sports news and match results",
+        "the team wins the championship game",
+        "football, basketball, tennis and the olympics",
+        "a player signs with a new club",
+    ],
+}
+
+
+class PrototypeClassifier:
+    """
+    מסווג נושא מהיר: embedding אחד לכל כתבה (מקודד משפטים קטן),
+    ואז cosine מול prototype קבוע לכל קטגוריה – מכפלת מטריצות אחת + argmax לכל הבאצ'.
+    """
+
+    def __init__(self, tokenizer, model, temperature: float = 0.05):
+        self.tokenizer = tokenizer
+        self.model = model.eval()
+        self.temperature = temperature
+        self.labels = list(CATEGORIES)
+        self.prototypes = self._build_prototypes()   # (num_labels, dim), מנורמל
+
+    @classmethod
+    def load(cls, model_name: str = ENCODER_MODEL) -> "PrototypeClassifier":
+        return cls(AutoTokenizer.from_pretrained(model_name), AutoModel.from_pretrained(model_name))
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """embeddings מנורמלים (mean pooling), מטריצה (n, dim)."""
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            batch = self.tokenizer(texts[start:start + batch_size], padding=True,
+                                   truncation=True, return_tensors="pt")
+            with torch.no_grad():
+                hidden = self.model(**batch).last_hidden_state
+            mask = batch["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(1) / mask.sum(1).clamp(min=1e-9)
+            chunks.append(pooled.numpy())
+        vectors = np.concatenate(chunks) if chunks else np.zeros((0, 0), dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+
+    def _build_prototypes(self) -> np.ndarray:
+        protos = np.stack([self.embed(LABEL_PROMPTS[label]).mean(axis=0) for label in self.labels])
+        return protos / np.linalg.norm(protos, axis=1, keepdims=True)
+
+    def classify(self, texts: List[str], batch_size: Optional[int] = None) -> List[Tuple[str, float]]:
+        """אותו חוזה כמו zero-shot: (label, score) לכל טקסט, score = softmax על ה-cosines."""
+        if not texts:
+            return []
+        sims = self.embed(list(texts), batch_size or 32) @ self.prototypes.T
+        logits = sims / self.temperature
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+        best = probs.argmax(axis=1)
+        return [(self.labels[i], float(probs[row, i])) for row, i in enumerate(best)]
@@ -0,0 +1,225 @@
+# backend/ai/inference_pool.py
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+TASKS = ("topic", "entities")
+
+
+class PoolClosed(RuntimeError):
+    """ה-pool נסגר (shutdown) לפני שהבקשה טופלה."""
+
+
+def _fail(futures: List[Future], err: BaseException) -> None:
+    for f in futures:
+        if not f.done():
+            f.set_exception(err)
+
+
+def _init_worker(torch_threads: int) -> None:
+    """רץ פעם אחת בכל תהליך worker: מגביל threads של torch וטוען את המודלים מראש."""
+    import torch
+    torch.set_num_threads(torch_threads)
+
+    from backend.ai.registry import registry
+    from backend.ai import nlp  # noqa: F401 – רושם את המודלים
+    registry.preload()
+
+
+def _run_batch(task: str, texts: List[str]) -> Tuple[List[Any], Tuple[int, int]]:
+    """
+    מריץ באצ' אחד בתוך תהליך ה-worker (ישירות על ה-pipelines, לא דרך ה-pool).
+    מחזיר גם (real, padded) טוקנים כדי שתהליך האב יוכל לדווח יעילות padding.
+    """
+    from backend.ai import nlp
+    counter = nlp.PaddingCounter()
+    if task == "topic":
+        results = nlp._classify_inline(texts, counter=counter)
+    else:
+        results = nlp._extract_inline(texts, counter=counter)
+    return results, counter.snapshot()
+
+
+class InferencePool:
+    """
+    שירות inference מחוץ לתהליך ה-API: תור לכל משימה, thread שמקבץ בקשות
+    ל-micro-batches (עד max_batch פריטים או max_wait שניות מהפריט הראשון),
+    ושולח כל באצ' ל-ProcessPoolExecutor. כל בקשה מקבלת Future משלה.
+    """
+
+    def __init__(self, processes: int = 2, torch_threads: int = 1, max_batch: int = 32,
+                 max_wait_ms: int = 20, start_method: str = "spawn"):
+        self.processes = processes
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(torch_threads,),
+        )
+        self._queues: Dict[str, "queue.Queue"] = {t: queue.Queue() for t in TASKS}
+        self._stats = {t: {"items": 0, "batches": 0} for t in TASKS}
+        from backend.ai.nlp import PaddingCounter
+        self.padding = PaddingCounter()
+        self._ready = False
+        # שגיאת טעינה של worker ב-warm_up – מוצגת ב-status() (וכך ב-/ready)
+        self._error: Optional[str] = None
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._dispatch_loop, args=(t,), name=f"inference-{t}", daemon=True)
+            for t in TASKS
+        ]
+        for th in self._threads:
+            th.start()
+
+    # ---------- API ----------
+    def submit(self, task: str, text: str) -> Future:
+        fut: Future = Future()
+        if self._closed:
+            fut.set_exception(PoolClosed("inference pool is shut down"))
+            return fut
+        self._queues[task].put((text, fut))
+        return fut
+
+    def map(self, task: str, texts: List[str]) -> List[Any]:
+        """שולח את כל הטקסטים ומחכה לתוצאות, בסדר המקורי."""
+        futures = [self.submit(task, t) for t in texts]
+        return [f.result() for f in futures]
+
+    def warm_up(self) -> None:
+        """מעיר את כל תהליכי ה-worker (טעינת מודלים) בלי לחסום את הקורא."""
+        def _run():
+            try:
+                futures = [self._executor.submit(_run_batch, "topic", ["warm up"])
+                           for _ in range(self.processes)]
+                for f in futures:
+                    f.result()
+            except Exception as e:
+                # בלי זה החריגה נבלעת ב-thread, ו-/ready מחזיר 503 לנצח בלי שום סיבה
+                self._error = f"{type(e).__name__}: {e}"
+                print("❌ Inference pool warm-up failed:", self._error)
+                return
+            self._ready = True
+        threading.Thread(target=_run, name="inference-warmup", daemon=True).start()
+
+    def status(self) -> dict:
+        return {
+            "ready": self._ready,
+            "error": self._error,
+            "processes": self.processes,
+            "max_batch": self.max_batch,
+            "max_wait_ms": int(self.max_wait * 1000),
+            "queued": {t: q.qsize() for t, q in self._queues.items()},
+            "tasks": {
+                t: {**s, "avg_batch": round(s["items"] / s["batches"], 2) if s["batches"] else 0.0}
+                for t, s in self._stats.items()
+            },
+        }
+
+    def shutdown(self) -> None:
+        """עוצר את ה-pool; בקשות שעוד בתור או בדרך נכשלות עם PoolClosed, כדי שאף map() לא ייתקע."""
+        self._closed = True
+        err = PoolClosed("inference pool is shut down")
+        for q in self._queues.values():
+            while True:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    _fail([item[1]], err)
+            q.put(None)
+        # באצ'ים שעוד לא התחילו מבוטלים – ה-callback שלהם מכשיל את ה-futures של הקוראים
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- micro-batching ----------
+    def _dispatch_loop(self, task: str) -> None:
+        q = self._queues[task]
+        while True:
+            first = q.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._send(task, batch)
+            if stop:
+                return
+
+    def _send(self, task: str, batch: list) -> None:
+        texts = [text for text, _ in batch]
+        futures = [fut for _, fut in batch]
+        if self._closed:
+            # באצ' שנאסף כש-shutdown נקרא
+            _fail(futures, PoolClosed("inference pool is shut down"))
+            return
+        self._stats[task]["items"] += len(batch)
+        self._stats[task]["batches"] += 1
+
+        def _done(result_future: Future) -> None:
+            if result_future.cancelled():
+                _fail(futures, PoolClosed("inference pool is shut down"))
+                return
+            err = result_future.exception()
+            if err is not None:
+                _fail(futures, err)
+                return
+            results, (real, padded) = result_future.result()
+            self.padding.add(real, padded)
+            for f, res in zip(futures, results):
+                f.set_result(res)
+
+        try:
+            self._executor.submit(_run_batch, task, texts).add_done_callback(_done)
+        except Exception as e:
+            # למשל executor שכבר נסגר ב-shutdown
+            _fail(futures, e)
+
+
+_pool: Optional[InferencePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> Optional[InferencePool]:
+    """ה-pool המשותף, או None אם INFERENCE_PROCESSES=0 (inference בתוך התהליך)."""
+    global _pool
+    from backend.config import (INFERENCE_MAX_BATCH, INFERENCE_MAX_WAIT_MS, INFERENCE_PROCESSES,
+                                INFERENCE_START_METHOD, INFERENCE_TORCH_THREADS)
+    if INFERENCE_PROCESSES <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = InferencePool(
+                processes=INFERENCE_PROCESSES,
+                torch_threads=INFERENCE_TORCH_THREADS,
+                max_batch=INFERENCE_MAX_BATCH,
+                max_wait_ms=INFERENCE_MAX_WAIT_MS,
+                start_method=INFERENCE_START_METHOD,
+            )
+            print(f"🧵 Inference pool started ({INFERENCE_PROCESSES} processes)")
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
@@ -0,0 +1,77 @@
+# backend/ai/neardup.py
+import hashlib
+import random
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from backend.ai.cache import normalize_text
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """קבוצת רצפי מילים חופפים (word n-grams) מהטקסט המנורמל, באותיות קטנות."""
+    words = _WORD.findall(normalize_text(text).lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if (a or b) else 0.0
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHashLSH:
+    """
+    MinHash + LSH ברצועות: חתימה של bands×rows ערכי minhash, וכל רצועה (rows ערכים)
+    מגובבת למפתח אחד. טקסטים עם דמיון Jaccard גבוה חולקים מפתח רצועה בהסתברות גבוהה,
+    ואילו טקסטים שונים כמעט אף פעם – כך שחיפוש מועמדים לפי מפתחות (אינדקס multikey
+    במונגו) נוגע רק בכמה מסמכים גם באוסף של מיליונים. המועמדים מאומתים ב-Jaccard מדויק.
+    """
+
+    def __init__(self, bands: int = 20, rows: int = 4, threshold: float = 0.6, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        # פרמוטציות (a*x + b) mod p קבועות – כדי שמפתחות שנשמרו יישארו תקפים בין ריצות
+        rnd = random.Random(seed)
+        self._perms = [(rnd.randrange(1, _PRIME), rnd.randrange(0, _PRIME)) for _ in range(bands * rows)]
+
+    def signature(self, sh: Set[str]) -> List[int]:
+        hashes = [_hash64(s) for s in sh] or [0]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms]
+
+    def band_keys(self, sh: Set[str]) -> List[str]:
+        sig = self.signature(sh)
+        keys = []
+        for i in range(self.bands):
+            chunk = ",".join(map(str, sig[i * self.rows:(i + 1) * self.rows]))
+            keys.append(f"{i}:{hashlib.blake2b(chunk.encode(), digest_size=8).hexdigest()}")
+        return keys
+
+
+class NearDupIndex:
+    """אינדקס LSH בזיכרון (מפתח רצועה → מסמכים) – לזיהוי כפילויות בתוך ריצה אחת."""
+
+    def __init__(self, lsh: MinHashLSH):
+        self.lsh = lsh
+        self._buckets: Dict[str, List[Tuple[Set[str], Any]]] = {}
+
+    def add(self, sh: Set[str], keys: List[str], payload: Any) -> None:
+        for key in keys:
+            self._buckets.setdefault(key, []).append((sh, payload))
+
+    def query(self, sh: Set[str], keys: List[str]) -> Optional[Any]:
+        """payload של המסמך הדומה ביותר מעל הסף, או None."""
+        best, best_sim = None, self.lsh.threshold
+        for key in keys:
+            for other, payload in self._buckets.get(key, ()):
+                sim = jaccard(sh, other)
+                if sim >= best_sim:
+                    best, best_sim = payload, sim
+        return best
@@ -1,22 +1,224 @@
+import threading
+from typing import Callable, List, Optional, Tuple
 from transformers import pipeline
+from backend.config import (NLP_BATCH_SIZE, NLP_NER_MAX_TOKENS, NLP_QUANTIZE,
+                            NLP_TOPIC_MAX_TOKENS, TOPIC_CLASSIFIER)
 from backend.models.schemas import CATEGORIES
+from backend.ai.registry import registry
+from backend.ai.inference_pool import get_pool
+
+ZERO_SHOT_MODEL = "valhalla/distilbart-mnli-12-1"
+NER_MODEL = "dslim/bert-base-NER"
+
+_WARMUP_TEXT = "Markets rally as parliament passes the new science budget."
+
+
+def quantize(model):
+    """קוונטיזציה דינמית int8 לשכבות ה-Linear (CPU בלבד); ללא NLP_QUANTIZE מחזיר כמו שהוא."""
+    if NLP_QUANTIZE != "int8":
+        return model
+    import torch
+    # inplace: השכבות מוחלפות במודל עצמו – בלי עותק מקוונטז לצד משקולות ה-fp32
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def load_zero_shot():
+    p = pipeline("zero-shot-classification", model=ZERO_SHOT_MODEL)
+    p.model = quantize(p.model)
+    return p
+
+
+def load_ner():
+    p = pipeline("ner", model=NER_MODEL, grouped_entities=True)
+    p.model = quantize(p.model)
+    return p
+
+
+def load_encoder():
+    from backend.ai.embed_classifier import PrototypeClassifier
+    c = PrototypeClassifier.load()
+    # ה-prototypes חושבו לפני הקוונטיזציה – מחשבים מחדש כדי שיתאימו למודל המקוונטז
+    if NLP_QUANTIZE == "int8":
+        c.model = quantize(c.model)
+        c.prototypes = c._build_prototypes()
+    return c
+
+
+# המודלים נטענים דרך ה-registry (lazy / warm-up ברקע) ולא בזמן import.
+# נרשם רק המסווג שנבחר ב-TOPIC_CLASSIFIER, כדי לא להחזיק בזיכרון מודל שלא בשימוש.
+if TOPIC_CLASSIFIER == "embedding":
+    registry.register("encoder", load_encoder, warmup=lambda c: c.classify([_WARMUP_TEXT]))
+else:
+    registry.register("zero_shot", load_zero_shot, warmup=lambda p: p(_WARMUP_TEXT, CATEGORIES))
+registry.register("ner", load_ner, warmup=lambda p: p(_WARMUP_TEXT))
+
+
+def model_signature() -> str:
+    """מזהה את הגדרת המודלים הנוכחית – חלק ממפתח ה-cache של ההעשרה."""
+    suffix = f":{NLP_QUANTIZE}" if NLP_QUANTIZE else ""
+    if TOPIC_CLASSIFIER == "embedding":
+        from backend.ai.embed_classifier import ENCODER_MODEL
+        return f"embedding:{ENCODER_MODEL}|{NER_MODEL}{suffix}"
+    return f"{ZERO_SHOT_MODEL}|{NER_MODEL}{suffix}"
+
+
+class PaddingCounter:
+    """סופר טוקנים אמיתיים מול טוקנים אחרי padding, לחישוב יעילות ה-padding."""
+
+    def __init__(self):
+        self.real = 0
+        self.padded = 0
+        self._lock = threading.Lock()
+
+    def add(self, real: int, padded: int) -> None:
+        with self._lock:
+            self.real += real
+            self.padded += padded
+
+    def snapshot(self) -> Tuple[int, int]:
+        return self.real, self.padded
+
+
+_padding = PaddingCounter()
+
+
+def padding_snapshot() -> Tuple[int, int]:
+    """(real, padded) מצטבר – כולל באצ'ים שרצו ב-inference pool."""
+    real, padded = _padding.snapshot()
+    pool = get_pool()
+    if pool is not None:
+        p_real, p_padded = pool.padding.snapshot()
+        real, padded = real + p_real, padded + p_padded
+    return real, padded
+
+
+def padding_efficiency(before: Tuple[int, int], after: Tuple[int, int]) -> Optional[float]:
+    """יחס טוקנים אמיתיים לטוקנים אחרי padding בין שתי דגימות (None אם לא רץ כלום)."""
+    real, padded = after[0] - before[0], after[1] - before[1]
+    return round(real / padded, 4) if padded else None
+
+
+def _truncate(tokenizer, texts: List[str], max_tokens: int) -> Tuple[List[str], List[int]]:
+    """
+    חיתוך לפי תקציב טוקנים של ה-tokenizer של המודל (לא לפי תווים).
+    מחזיר את הטקסטים החתוכים ואורך כל אחד בטוקנים (כולל טוקנים מיוחדים).
+    """
+    enc = tokenizer(list(texts), add_special_tokens=False, truncation=True,
+                    max_length=max_tokens, return_offsets_mapping=True)
+    special = tokenizer.num_special_tokens_to_add()
+    out, lengths = [], []
+    for text, offsets in zip(texts, enc["offset_mapping"]):
+        if len(offsets) >= max_tokens:
+            # חותכים בסוף הטוקן האחרון שנכנס לתקציב
+            text = text[:offsets[-1][1]]
+        out.append(text)
+        lengths.append(len(offsets) + special)
+    return out, lengths
+
+
+def _bucketed(texts: List[str], lengths: List[int], batch_size: int,
+              run: Callable[[List[str]], list], counter: PaddingCounter) -> list:
+    """
+    בונה באצ'ים מטקסטים באורך דומה (מיון לפי אורך בטוקנים), מריץ כל באצ'
+    ומחזיר את התוצאות בסדר המקורי. כך כתבה ארוכה אחת לא מרפדת באצ' שלם.
+    """
+    order = sorted(range(len(texts)), key=lambda i: lengths[i])
+    results: list = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        idx = order[start:start + batch_size]
+        bucket_lengths = [lengths[i] for i in idx]
+        counter.add(sum(bucket_lengths), max(bucket_lengths) * len(idx))
+        for i, res in zip(idx, run([texts[i] for i in idx])):
+            results[i] = res
+    return results
+
 
-# הטעינה הראשונה יכולה לקחת זמן – תקין
-_zero_shot = pipeline("zero-shot-classification", model="valhalla/distilbart-mnli-12-1")
-_ner = pipeline("ner", model="dslim/bert-base-NER", grouped_entities=True)
- 
 def classify_topic(text: str):
-    res = _zero_shot(text, CATEGORIES)
-    label = res["labels"][0]
-    score = float(res["scores"][0])
-    return label, score
+    return classify_topics([text])[0]
 
 
-# פונקציה שמחלצת ישויות מטקסט
-def extract_entities(text: str, max_chars: int = 800):
-    ents = _ner(text[:max_chars])
+def classify_topics(texts: List[str], batch_size: Optional[int] = None) -> List[Tuple[str, float]]:
+    """
+    מסווג רשימת טקסטים בקריאה אחת (באצ'ים של batch_size),
+    במקום forward נפרד לכל כתבה. המסווג נבחר לפי TOPIC_CLASSIFIER.
+    אם מוגדר INFERENCE_PROCESSES – העבודה נשלחת ל-inference pool.
+    """
+    if not texts:
+        return []
+    pool = get_pool()
+    if pool is not None:
+        return pool.map("topic", list(texts))
+    return _classify_inline(texts, batch_size)
+
+
+def _classify_inline(texts: List[str], batch_size: Optional[int] = None,
+                     counter: Optional[PaddingCounter] = None) -> List[Tuple[str, float]]:
+    batch_size = batch_size or NLP_BATCH_SIZE
+    if TOPIC_CLASSIFIER == "embedding":
+        encoder = registry.get("encoder")
+        tokenizer = encoder.tokenizer
+        run = lambda bucket: encoder.classify(bucket, len(bucket))
+    else:
+        zero_shot = registry.get("zero_shot")
+        tokenizer = zero_shot.tokenizer
+        run = lambda bucket: zero_shot_classify(zero_shot, bucket, len(bucket))
+    truncated, lengths = _truncate(tokenizer, texts, NLP_TOPIC_MAX_TOKENS)
+    return _bucketed(truncated, lengths, batch_size, run, counter or _padding)
+
+
+def zero_shot_classify(zero_shot, texts: List[str], batch_size: int) -> List[Tuple[str, float]]:
+    results = zero_shot(list(texts), CATEGORIES, batch_size=batch_size)
+    # עבור קלט בודד ה-pipeline מחזיר dict ולא רשימה
+    if isinstance(results, dict):
+        results = [results]
+    return [(res["labels"][0], float(res["scores"][0])) for res in results]
+
+
+def _entity_words(ents) -> List[str]:
     out = []
     for e in ents:
         w = e.get("word") or e.get("entity_group") or ""
         if w: out.append(w)
     return out
+
+
+# פונקציה שמחלצת ישויות מטקסט
+def extract_entities(text: str):
+    return extract_entities_batch([text])[0]
+
+
+def extract_entities_batch(texts: List[str], batch_size: Optional[int] = None) -> List[List[str]]:
+    """
+    מחלץ ישויות לכל הטקסטים בריצה אחת של ה-NER pipeline (או דרך ה-inference pool).
+    כל טקסט נחתך ל-NLP_NER_MAX_TOKENS טוקנים.
+    """
+    if not texts:
+        return []
+    pool = get_pool()
+    if pool is not None:
+        return pool.map("entities", list(texts))
+    return _extract_inline(texts, batch_size)
+
+
+def _extract_inline(texts: List[str], batch_size: Optional[int] = None,
+                    counter: Optional[PaddingCounter] = None) -> List[List[str]]:
+    ner = registry.get("ner")
+
+    def run(bucket: List[str]) -> List[List[str]]:
+        results = ner(bucket, batch_size=len(bucket))
+        # עבור טקסט בודד מתקבלת רשימת ישויות שטוחה
+        if len(bucket) == 1 and (not results or isinstance(results[0], dict)):
+            results = [results]
+        return [_entity_words(ents) for ents in results]
+
+    truncated, lengths = _truncate(ner.tokenizer, texts, NLP_NER_MAX_TOKENS)
+    return _bucketed(truncated, lengths, batch_size or NLP_BATCH_SIZE, run, counter or _padding)
+
+
+def readiness() -> Tuple[bool, dict]:
+    """מצב מוכנות ה-NLP: של ה-inference pool אם פעיל, אחרת של המודלים בתהליך."""
+    pool = get_pool()
+    if pool is not None:
+        status = pool.status()
+        return status["ready"], {"inference_pool": status}
+    return registry.is_ready(), {"models": registry.status()}
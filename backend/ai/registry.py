@@ -0,0 +1,85 @@
+# backend/ai/registry.py
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class _ModelEntry:
+    def __init__(self, loader: Callable[[], Any], warmup: Optional[Callable[[Any], Any]]):
+        self.loader = loader
+        self.warmup = warmup
+        self.model: Any = None
+        self.state = "idle"          # idle → loading → ready / error
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    מרשם מודלים: כל מודל נטען פעם אחת, לפי דרישה (lazy) או ברקע (warm-up),
+    כולל inference דמה כדי שהקריאה האמיתית הראשונה לא תשלם על אתחול.
+    preload() נועד לריצה בתהליך האב לפני fork – כך ה-workers חולקים את המשקולות (copy-on-write).
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any],
+                 warmup: Optional[Callable[[Any], Any]] = None) -> None:
+        self._entries[name] = _ModelEntry(loader, warmup)
+
+    def get(self, name: str) -> Any:
+        """מחזיר את המודל; אם עוד לא נטען – טוען עכשיו (או מחכה לטעינה שכבר רצה)."""
+        entry = self._entries[name]
+        if entry.state == "ready":
+            return entry.model
+        with entry.lock:
+            if entry.state != "ready":
+                self._load(name, entry)
+        if entry.state != "ready":
+            raise RuntimeError(f"model '{name}' failed to load: {entry.error}")
+        return entry.model
+
+    def _load(self, name: str, entry: _ModelEntry) -> None:
+        entry.state = "loading"
+        entry.error = None
+        started = time.perf_counter()
+        try:
+            model = entry.loader()
+            if entry.warmup is not None:
+                entry.warmup(model)
+            entry.model = model
+            entry.state = "ready"
+            entry.load_seconds = round(time.perf_counter() - started, 2)
+            print(f"✅ Model '{name}' ready in {entry.load_seconds}s")
+        except Exception as e:
+            entry.state = "error"
+            entry.error = str(e)
+            print(f"❌ Model '{name}' failed to load:", e)
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """טעינה סינכרונית של כל המודלים (או של names)."""
+        for name in (names or list(self._entries)):
+            try:
+                self.get(name)
+            except RuntimeError:
+                pass
+
+    def warm_up_background(self) -> threading.Thread:
+        """מריץ preload ב-thread רקע כדי לא לחסום את עליית השרת."""
+        t = threading.Thread(target=self.preload, name="model-warmup", daemon=True)
+        t.start()
+        return t
+
+    def is_ready(self) -> bool:
+        return all(e.state == "ready" for e in self._entries.values())
+
+    def status(self) -> Dict[str, dict]:
+        return {
+            name: {"state": e.state, "load_seconds": e.load_seconds, "error": e.error}
+            for name, e in self._entries.items()
+        }
+
+
+registry = ModelRegistry()
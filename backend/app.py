@@ -1,51 +1,54 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from backend import config_cloudinary
 from backend.controllers.news_controller import router as news_router
+from backend.ai.registry import registry
+from backend.ai.inference_pool import get_pool, shutdown_pool
+from backend.config import INGEST_SCHEDULER_ENABLED, NLP_LOAD_MODE, RETENTION_DAYS
+from backend.services.scheduler import retention, scheduler
+from backend.services.jobs import jobs
+from backend.services import news_service
 
-app = FastAPI(title="Cloud News Aggregator - MVC Gateway")
-app.include_router(news_router)
 
-from backend.controllers import media_controller
-app.include_router(media_controller.router)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    עליית השרת: אינדקסים במונגו, אינדקסי החיפוש והישויות, טעינת מודלים + הפעלת ה-scheduler שמביא חדשות לבד
+    (ריצה ראשונה אחרי INGEST_INITIAL_DELAY_SECONDS, ואז כל INGEST_INTERVAL_MINUTES),
+    ושל ה-retention אם RETENTION_DAYS מוגדר.
+    ירידת השרת: עצירה מסודרת של ה-schedulers, ה-jobs, ה-client האסינכרוני וה-inference pool.
+    """
 
-import threading, time, requests, schedule
+    news_service.ensure_indexes()
+    news_service.load_indexes()
 
+    # טעינת מודלי ה-NLP: ב-inference pool (תהליכים נפרדים) אם מוגדר,
+    # אחרת בתהליך הזה לפי NLP_LOAD_MODE (אם נטענו כבר לפני fork – זה no-op)
+    pool = get_pool()
+    if pool is not None:
+        pool.warm_up()
+    elif NLP_LOAD_MODE == "eager":
+        registry.preload()
+    elif NLP_LOAD_MODE == "background":
+        registry.warm_up_background()
 
-@app.on_event("startup")
-def startup_event():
-    """
-    מפעיל אוטומטית את /admin/fetch כששרת ה־backend עולה.
-    זה גורם למערכת להביא חדשות לבד ברגע שהכול עלה (כמו gateway קטן).
-    בנוסף, מפעיל לולאת schedule שמביאה חדשות כל 30 דקות.
-    """
+    if INGEST_SCHEDULER_ENABLED:
+        scheduler.start()
+    if RETENTION_DAYS > 0:
+        retention.start()
 
-    def trigger_fetch():
-        """שאיבה ראשונית כששרת ה־backend עולה"""
-        time.sleep(5)  # מוודא שקפקה ו־DB כבר פעילים
-        try:
-            print("🚀 Triggering automatic news fetch from /admin/fetch ...")
-            res = requests.post("http://localhost:8000/admin/fetch", params={"limit": 50})
-            print("✅ Auto-fetch response:", res.json())
-        except Exception as e:
-            print("❌ Failed to trigger automatic fetch:", e)
-
-    def auto_fetch_job():
-        """שאיבה חוזרת אוטומטית כל 30 דקות"""
-        try:
-            print("🕒 Scheduled fetch running ...")
-            res = requests.post("http://localhost:8000/admin/fetch", params={"limit": 50})
-            print("✅ Scheduled auto-fetch result:", res.json())
-        except Exception as e:
-            print("❌ Error in scheduled fetch:", e)
-
-    def schedule_loop():
-        """לולאה שרצה ברקע ומפעילה את המשימות המתוזמנות"""
-        schedule.every(30).minutes.do(auto_fetch_job)
-        print("🕒 Scheduler started (fetch every 30 minutes)")
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
-
-    # מריצים את שתי הפונקציות ברקע בלי לחסום את השרת
-    threading.Thread(target=trigger_fetch).start()
-    threading.Thread(target=schedule_loop, daemon=True).start()
+    yield
+
+    scheduler.stop()
+    retention.stop()
+    jobs.shutdown()
+    await news_service.aclose()
+    shutdown_pool()
+
+
+app = FastAPI(title="Cloud News Aggregator - MVC Gateway", lifespan=lifespan)
+app.include_router(news_router)
+
+from backend.controllers import media_controller
+app.include_router(media_controller.router)
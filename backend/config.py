@@ -7,3 +7,113 @@ if ENV_PATH.exists():
     load_dotenv(ENV_PATH)
 
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "")
+
+# גודל באצ' להעברת טקסטים דרך ה-pipelines של ה-NLP בריצת ingestion אחת
+NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", "16"))
+
+# cache לתוצאות NLP: גודל ה-LRU בזיכרון, ושכבה שנייה במונגו ("mongo") או בלי ("none")
+NLP_CACHE_MAX_ENTRIES = int(os.getenv("NLP_CACHE_MAX_ENTRIES", "5000"))
+NLP_CACHE_STORE = os.getenv("NLP_CACHE_STORE", "mongo")
+NLP_CACHE_STORE_MAX_ENTRIES = int(os.getenv("NLP_CACHE_STORE_MAX_ENTRIES", "100000"))
+
+# טעינת מודלים: "background" (warm-up ברקע בעליית השרת), "eager" (חוסם עד שנטען) או "lazy" (בקריאה הראשונה)
+NLP_LOAD_MODE = os.getenv("NLP_LOAD_MODE", "background")
+
+# מסווג הנושא: "nli" (zero-shot, ברירת מחדל) או "embedding" (prototypes מהירים)
+TOPIC_CLASSIFIER = os.getenv("TOPIC_CLASSIFIER", "nli")
+
+# inference מחוץ לתהליך ה-API: מספר תהליכים (0 = inline), threads של torch לכל תהליך,
+# וגודל/זמן המתנה מקסימלי של micro-batch
+INFERENCE_PROCESSES = int(os.getenv("INFERENCE_PROCESSES", "0"))
+INFERENCE_TORCH_THREADS = int(os.getenv("INFERENCE_TORCH_THREADS", "1"))
+INFERENCE_MAX_BATCH = int(os.getenv("INFERENCE_MAX_BATCH", "32"))
+INFERENCE_MAX_WAIT_MS = int(os.getenv("INFERENCE_MAX_WAIT_MS", "20"))
+INFERENCE_START_METHOD = os.getenv("INFERENCE_START_METHOD", "spawn")
+
+# קוונטיזציה דינמית של המודלים ל-CPU: "int8" או ריק (fp32, ברירת מחדל)
+NLP_QUANTIZE = os.getenv("NLP_QUANTIZE", "").lower()
+
+# תקציב טוקנים לקלט של כל משימה (חיתוך לפי ה-tokenizer של המודל)
+NLP_TOPIC_MAX_TOKENS = int(os.getenv("NLP_TOPIC_MAX_TOKENS", "256"))
+NLP_NER_MAX_TOKENS = int(os.getenv("NLP_NER_MAX_TOKENS", "256"))
+
+# תיקיית ה-cache של הספק (תשובות NewsAPI גולמיות + high-water marks), ומגבלת עמודים לשאילתה
+NEWS_CACHE_DIR = Path(os.getenv("NEWS_CACHE_DIR", str(Path(__file__).parent / ".cache" / "newsapi")))
+NEWSAPI_MAX_PAGES = int(os.getenv("NEWSAPI_MAX_PAGES", "3"))
+
+# מצב משיכה: "single" (top-headlines → everything) או "fanout" (שאילתות מקבילות לכל קטגוריה/מדינה/עמוד)
+NEWS_FETCH_MODE = os.getenv("NEWS_FETCH_MODE", "single")
+NEWSAPI_COUNTRIES = [c.strip() for c in os.getenv("NEWSAPI_COUNTRIES", "us").split(",") if c.strip()]
+NEWSAPI_FANOUT_PAGES = int(os.getenv("NEWSAPI_FANOUT_PAGES", "1"))
+NEWSAPI_CONCURRENCY = int(os.getenv("NEWSAPI_CONCURRENCY", "4"))
+NEWSAPI_REQUEST_BUDGET = int(os.getenv("NEWSAPI_REQUEST_BUDGET", "30"))
+NEWSAPI_RETRIES = int(os.getenv("NEWSAPI_RETRIES", "3"))
+
+# מקורות חדשות פעילים (מופרדים בפסיק): "newsapi", "rss"; ורשימת פידים ל-RSS/Atom
+NEWS_SOURCES = [s.strip() for s in os.getenv("NEWS_SOURCES", "newsapi").split(",") if s.strip()]
+RSS_FEEDS = [u.strip() for u in os.getenv("RSS_FEEDS", "").split(",") if u.strip()]
+
+# צינור ה-ingestion: כמה כתבות בכל באצ' שזורם בין השלבים, וכמה באצ'ים מחכים לכל היותר בכל תור
+INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "32"))
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "4"))
+# כמה מזהי כתבות שנשמרו מוחזרים כדוגמה בסיכום הריצה (הספירה המלאה ב-saved)
+INGEST_REPORT_MAX_IDS = int(os.getenv("INGEST_REPORT_MAX_IDS", "100"))
+
+# זיהוי כמעט-כפילויות (MinHash LSH): דמיון Jaccard מינימלי (על זוגות מילים) שנחשב לאותו סיפור
+NEARDUP_THRESHOLD = float(os.getenv("NEARDUP_THRESHOLD", "0.6"))
+# טקסט עם פחות זוגות מילים מזה לא עובר LSH (טקסטים ריקים/קצרים חולקים את אותם מפתחות),
+# וכמה מועמדים לכל היותר נשלפים ממונגו לכל באצ'
+NEARDUP_MIN_SHINGLES = int(os.getenv("NEARDUP_MIN_SHINGLES", "5"))
+NEARDUP_MAX_CANDIDATES = int(os.getenv("NEARDUP_MAX_CANDIDATES", "500"))
+
+# ingestion מתוזמן בתוך התהליך
+INGEST_SCHEDULER_ENABLED = os.getenv("INGEST_SCHEDULER_ENABLED", "1") not in ("0", "false", "False")
+INGEST_INTERVAL_MINUTES = float(os.getenv("INGEST_INTERVAL_MINUTES", "30"))
+INGEST_INITIAL_DELAY_SECONDS = float(os.getenv("INGEST_INITIAL_DELAY_SECONDS", "5"))
+INGEST_LIMIT = int(os.getenv("INGEST_LIMIT", "50"))
+
+# jobs של ingestion ברקע (POST /admin/fetch): כמה רצים במקביל, כמה מחכים בתור, וכמה נשמרים בהיסטוריה
+INGEST_MAX_JOBS = int(os.getenv("INGEST_MAX_JOBS", "1"))
+INGEST_MAX_QUEUED_JOBS = int(os.getenv("INGEST_MAX_QUEUED_JOBS", "10"))
+INGEST_JOB_HISTORY = int(os.getenv("INGEST_JOB_HISTORY", "100"))
+
+# גודל חתיכה ל-bulk_write במונגו (כמה upserts ב-round trip אחד)
+MONGO_BULK_CHUNK_SIZE = int(os.getenv("MONGO_BULK_CHUNK_SIZE", "500"))
+
+# read-through cache ל-/news ו-/news/{id}: גודל ה-LRU (0 = כבוי), וקובץ מונה הדורות
+# שמשותף לכל ה-workers על המכונה (ריק = מונה בזיכרון של התהליך בלבד)
+READ_CACHE_MAX_ENTRIES = int(os.getenv("READ_CACHE_MAX_ENTRIES", "1024"))
+READ_CACHE_GENERATION_FILE = os.getenv(
+    "READ_CACHE_GENERATION_FILE", str(Path(__file__).parent / ".cache" / "ingest_generation"))
+
+# ה-client האסינכרוני של מונגו (endpoints של קריאה): גודל pool וזמני המתנה מפורשים,
+# כדי שעומס של אלפי קריאות מקבילות ייכשל מהר במקום להיתקע
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_MS = int(os.getenv("MONGO_MAX_IDLE_MS", "60000"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "2000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "10000"))
+
+# hot tier: כמה מהכתבות החדשות ביותר מוחזקות בזיכרון לפני מונגו (0 = כבוי)
+HOT_TIER_CAPACITY = int(os.getenv("HOT_TIER_CAPACITY", "5000"))
+
+# חיפוש טקסט חופשי (GET /search): snapshot של האינדקס, boost לחדשות (משקל וזמן מחצית),
+# וכמה postings לכל מילה נסרקים לכל היותר (מהחדש לישן) כדי שזמן החיפוש לא יגדל עם האוסף –
+# חיפוש שנחתך כך מסומן truncated בתשובה (וה-total בו מוערך)
+SEARCH_SNAPSHOT_PATH = Path(os.getenv("SEARCH_SNAPSHOT_PATH", str(Path(__file__).parent / ".cache" / "search_index.json.gz")))
+SEARCH_RECENCY_WEIGHT = float(os.getenv("SEARCH_RECENCY_WEIGHT", "0.5"))
+SEARCH_RECENCY_HALF_LIFE_DAYS = float(os.getenv("SEARCH_RECENCY_HALF_LIFE_DAYS", "7"))
+SEARCH_MAX_POSTINGS = int(os.getenv("SEARCH_MAX_POSTINGS", "5000"))
+
+# אינדקס הישויות: snapshot, וחלונות ה-trending (לכל חלון מונה דועך עם half-life באורך החלון)
+ENTITY_SNAPSHOT_PATH = Path(os.getenv("ENTITY_SNAPSHOT_PATH", str(Path(__file__).parent / ".cache" / "entity_index.json.gz")))
+ENTITY_TRENDING_WINDOWS = [w.strip() for w in os.getenv("ENTITY_TRENDING_WINDOWS", "1h,24h,7d").split(",") if w.strip()]
+
+# retention: כתבות שפורסמו לפני יותר מ-RETENTION_DAYS ימים עוברות לארכיון (gzip NDJSON)
+# ונמחקות מהאוסף, פעם ב-RETENTION_INTERVAL_HOURS (0 = כבוי)
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "0"))
+RETENTION_ARCHIVE_DIR = Path(os.getenv("RETENTION_ARCHIVE_DIR", str(Path(__file__).parent / ".cache" / "archive")))
+RETENTION_INTERVAL_HOURS = float(os.getenv("RETENTION_INTERVAL_HOURS", "24"))
+RETENTION_INITIAL_DELAY_SECONDS = float(os.getenv("RETENTION_INITIAL_DELAY_SECONDS", "60"))
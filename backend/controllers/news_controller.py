@@ -1,11 +1,14 @@
-from time import time
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
 from typing import List, Optional
 from backend.services import news_service
 from backend.models.schemas import PreferencesIn
-from backend.providers import news_provider
+from backend.ai import nlp
+from backend.services.scheduler import retention, scheduler
+from backend.services.jobs import JobQueueFull, jobs
 
-from backend.views.news_view import render_news, render_list
+from backend.views.news_view import render_news, render_raw, render_raw_list
+from backend.views.responses import OrjsonResponse
 
 router = APIRouter()
 USER_PREFS: dict[str, List[str]] = {}
@@ -14,27 +17,125 @@ USER_PREFS: dict[str, List[str]] = {}
 def health():
     return {"ok": True}
 
+@router.get("/ready")
+def ready():
+    """מוכנות לתעבורה: 200 רק כשכל המודלים נטענו, אחרת 503 עם מצב כל מודל."""
+    ok, detail = nlp.readiness()
+    return JSONResponse({"ready": ok, **detail}, status_code=200 if ok else 503)
+
 @router.post("/users/{user_id}/preferences")
 def save_prefs(user_id: str, prefs: PreferencesIn):
     USER_PREFS[user_id] = prefs.topics
     return {"saved": True, "topics": prefs.topics}
 
-@router.post("/admin/fetch")
+@router.post("/admin/fetch", status_code=202)
 def admin_fetch(limit: int = 5):
-    ids = news_service.pull_and_process(limit=limit)
-    return {"inserted": len(ids), "ids": ids}
+    """
+    מתחיל ingestion ברקע ומחזיר מיד מזהה job; ההתקדמות ב-GET /admin/jobs/{id}.
+    אם ingestion אחר (מתוזמן או ב-worker אחר) כבר רץ – ה-job מסתיים כ-skipped.
+    """
+    try:
+        job = jobs.submit(limit)
+    except JobQueueFull as e:
+        raise HTTPException(429, str(e))
+    return {"job_id": job.id, "status": job.status, "status_url": f"/admin/jobs/{job.id}"}
+
+@router.get("/admin/jobs")
+def list_jobs():
+    return jobs.list()
+
+@router.get("/admin/jobs/{job_id}")
+def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(404, "job not found")
+    return job.to_dict()
+
+@router.get("/admin/scheduler")
+def scheduler_status():
+    """מצב ה-ingestion המתוזמן: מרווח, הריצה הבאה, ומשך/כמויות הריצה האחרונה."""
+    return scheduler.status()
+
+@router.get("/admin/retention")
+def retention_status():
+    """מצב ה-retention: מרווח, הריצה הבאה, וסיכום הריצה האחרונה (ארכוב, כפילויות, מקום שהתפנה)."""
+    return retention.status()
+
+@router.post("/admin/retention")
+def run_retention():
+    """ריצת retention מיידית (סינכרונית); מדולגת אם ריצת retention או ingestion בעיצומה."""
+    retention.run_once()
+    return retention.status()
+
+@router.get("/admin/nlp-cache")
+def nlp_cache_stats():
+    return news_service.enrichment_cache_stats()
+
+@router.get("/admin/read-cache")
+def read_cache_stats():
+    return news_service.read_cache_stats()
+
+@router.get("/search")
+def search(q: str, topic: Optional[str] = None, limit: int = Query(10, ge=1, le=100),
+           offset: int = Query(0, ge=0)):
+    """
+    חיפוש טקסט חופשי ב-title / summary / entities, מדורג ב-BM25 עם boost לכתבות חדשות.
+    truncated=true: למילה נפוצה דורגו רק הכתבות החדשות שלה, ו-total הוא הערכה.
+    """
+    total, hits, truncated = news_service.search_news(q, topic=topic, offset=offset, limit=limit)
+    items = [{**render_raw(doc), "relevance": score} for doc, score in hits]
+    return OrjsonResponse({"q": q, "total": total, "truncated": truncated, "offset": offset,
+                           "limit": limit, "items": items})
+
+@router.get("/admin/search-index")
+def search_index_stats():
+    return news_service.search_index_stats()
+
+@router.get("/admin/entity-index")
+def entity_index_stats():
+    return news_service.entity_index_stats()
+
+@router.get("/entities/trending")
+def trending_entities(window: str = "24h", limit: int = Query(20, ge=1, le=100)):
+    """הישויות החמות בחלון הזמן (1h / 24h / 7d), לפי מונה מוזכרות דועך."""
+    try:
+        items = news_service.trending_entities(window, limit=limit)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return OrjsonResponse({"window": window, "items": items})
+
+@router.get("/entities/{name}/news")
+def entity_news(name: str, limit: int = Query(10, ge=1, le=100), cursor: Optional[str] = None):
+    """כתבות שמזכירות את הישות, החדשות קודם; דפדוף ב-X-Next-Cursor כמו ב-/news."""
+    try:
+        docs, next_cursor = news_service.entity_news(name, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return OrjsonResponse(render_raw_list(docs), headers=headers)
 
 @router.get("/news/{news_id}")
-def get_news(news_id: str):
-    item = news_service.get_news(news_id)
+async def get_news(news_id: str):
+    item = await news_service.aget_news(news_id)
     if not item:
         raise HTTPException(404, "news not found")
     return render_news(item)
 
 @router.get("/news")
-def list_news(topic: Optional[str] = None, limit: int = 10):
-    items = news_service.list_news(topic=topic, limit=limit)
-    return render_list(items)
+async def list_news(topic: Optional[str] = None, limit: int = Query(10, ge=1, le=100),
+                    cursor: Optional[str] = None):
+    """
+    עמוד של כתבות, החדשות ביותר קודם. ה-cursor לעמוד הבא מוחזר ב-header
+    X-Next-Cursor (חסר בעמוד האחרון), כדי שגוף התשובה יישאר רשימה כמו קודם.
+    מסלול רזה: projection במונגו → dict בצורת התשובה → orjson, בלי מודל News.
+    async: ההמתנה למונגו לא תופסת thread מה-threadpool.
+    """
+    try:
+        docs, next_cursor = await news_service.alist_news_page(topic=topic, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return OrjsonResponse(render_raw_list(docs), headers=headers)
 
 
 
@@ -0,0 +1,36 @@
+# backend/gunicorn_conf.py
+# הרצה עם כמה workers שחולקים את משקולות המודלים (copy-on-write):
+#   gunicorn backend.app:app -c backend/gunicorn_conf.py
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+# רק משקולות המודלים נטענות בתהליך האב (on_starting). האפליקציה עצמה נטענת בכל worker
+# אחרי ה-fork: MongoClient ו-KafkaProducer (עם ה-thread של ה-sender) לא שורדים fork
+preload_app = False
+
+
+def on_starting(server):
+    """
+    טוען את מודלי ה-NLP בתהליך האב; ה-workers יורשים את הזיכרון בלי להעתיק.
+    מייבאים כאן רק את שכבת ה-ai – לא את backend.app / news_service, שיוצרים חיבורים.
+    """
+    from backend.ai import nlp  # noqa: F401 – רושם את המודלים ב-registry
+    from backend.ai.registry import registry
+
+    registry.preload()
+    # אובייקטים שנוצרו עד כאן לא ייסרקו יותר ע"י ה-GC בתהליכי הבן,
+    # כך שעדכוני refcount/GC לא "מלכלכים" את הדפים המשותפים
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """מגביל threads של torch לכל worker כדי ש-N workers לא יתחרו על אותן ליבות."""
+    threads = os.getenv("TORCH_THREADS_PER_WORKER")
+    if threads:
+        import torch
+        torch.set_num_threads(int(threads))
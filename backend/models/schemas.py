@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # הקטגוריות הקבועות בפרויקט
 CATEGORIES = ["Politics", "Finance", "Science", "Culture", "Sport"]
@@ -18,4 +18,45 @@ class News(BaseModel):
     entities: List[str] = []
     imageUrl: Optional[str] = None
     score: float = 0.0
+    # hash של title+summary המנורמלים – לזיהוי כתבה שהשתנתה מאז השמירה
+    content_hash: Optional[str] = None
+    # אשכול כמעט-כפילויות (אותו סיפור מכמה מקורות) ומפתחות ה-LSH לחיפוש מועמדים
+    cluster_id: Optional[str] = None
+    lsh_keys: List[str] = []
 
+
+class IngestReport(BaseModel):
+    """סיכום ריצת ingestion אחת (מוחזר מ-pull_and_process)."""
+    # כמה כתבות נשמרו, ודוגמה של עד INGEST_REPORT_MAX_IDS מזהים (הראשונים שנשמרו)
+    saved: int = 0
+    ids: List[str] = []
+    # יחס טוקנים אמיתיים לטוקנים אחרי padding בריצת ה-NLP (None אם הכול הגיע מה-cache)
+    padding_efficiency: Optional[float] = None
+    # סינון לפני העשרה: כתבות חדשות / שתוכנן השתנה / שכבר שמורות כמו שהן
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    near_duplicates: int = 0
+    # תוצאת ה-bulk upsert: כמה נמצאו, כמה השתנו בפועל וכמה נוספו
+    writes: Dict[str, int] = {}
+    # זמן משיכה, כמות ושגיאה לכל מקור חדשות
+    sources: Dict[str, dict] = {}
+    # תפוקה ועומק תור לכל שלב בצינור, וזמן הריצה הכולל
+    stages: Dict[str, dict] = {}
+    seconds: float = 0.0
+
+
+class RetentionReport(BaseModel):
+    """סיכום ריצת retention אחת (מוחזר מ-apply_retention)."""
+    # כתבות שפורסמו לפני cutoff עברו לארכיון ונמחקו מהאוסף
+    cutoff: Optional[str] = None
+    archived: int = 0
+    # עותקים כפולים (אותו url) שנמחקו
+    duplicates: int = 0
+    archive_file: Optional[str] = None
+    archive_bytes: int = 0
+    # storage_stats של האוסף לפני ואחרי, וכמה bytes של נתונים התפנו
+    before: Dict[str, int] = {}
+    after: Dict[str, int] = {}
+    reclaimed_bytes: int = 0
+    seconds: float = 0.0
@@ -0,0 +1,132 @@
+# backend/providers/async_provider.py
+import asyncio
+import logging
+import random
+from typing import Dict, List, Optional
+
+import httpx
+
+from backend.config import (NEWSAPI_CONCURRENCY, NEWSAPI_COUNTRIES, NEWSAPI_FANOUT_PAGES, NEWSAPI_KEY,
+                            NEWSAPI_REQUEST_BUDGET, NEWSAPI_RETRIES)
+from backend.models.schemas import CATEGORIES
+
+log = logging.getLogger("async_provider")
+
+_TOP_HEADLINES_URL = "https://newsapi.org/v2/top-headlines"
+
+# מיפוי הקטגוריות שלנו לקטגוריות של NewsAPI
+NEWSAPI_CATEGORIES = {
+    "Politics": "general",
+    "Finance": "business",
+    "Science": "science",
+    "Culture": "entertainment",
+    "Sport": "sports",
+}
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RequestBudget:
+    """מספר הבקשות המקסימלי לריצה אחת (כולל retries) – כדי לא לשרוף את מכסת ה-API."""
+
+    def __init__(self, total: int):
+        self.remaining = total
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+async def _get_json(client: httpx.AsyncClient, sem: asyncio.Semaphore, budget: RequestBudget,
+                    params: dict, retries: int = NEWSAPI_RETRIES, base_delay: float = 0.5) -> Optional[dict]:
+    """GET עם מגבלת מקביליות, retries עם backoff אקספוננציאלי + jitter, ותקציב בקשות."""
+    for attempt in range(retries + 1):
+        if not budget.take():
+            log.warning("⚠️ request budget exhausted, skipping %s", {k: v for k, v in params.items() if k != "apiKey"})
+            return None
+        async with sem:
+            try:
+                r = await client.get(_TOP_HEADLINES_URL, params=params)
+                if r.status_code == 200:
+                    return r.json()
+                if r.status_code not in _RETRY_STATUS:
+                    log.error("❌ NewsAPI returned %s: %s", r.status_code, r.text[:300])
+                    return None
+            except httpx.TransportError as e:
+                log.warning("⚠️ NewsAPI request failed (attempt %s): %s", attempt + 1, e)
+        if attempt < retries:
+            # full jitter: המתנה אקראית בין 0 ל-base*2^attempt
+            await asyncio.sleep(random.uniform(0, base_delay * 2 ** attempt))
+    return None
+
+
+async def fetch_fanout_async(limit: int, countries: List[str], categories: List[str], pages: int) -> List[Dict]:
+    """
+    מושך במקביל שאילתה לכל (מדינה, קטגוריה, עמוד) דרך AsyncClient אחד עם keep-alive,
+    ומאחד לתוצאה אחת בלי כפילויות URL, מהחדש לישן.
+    """
+    from backend.providers.news_provider import _marks
+
+    sem = asyncio.Semaphore(NEWSAPI_CONCURRENCY)
+    budget = RequestBudget(NEWSAPI_REQUEST_BUDGET)
+    page_size = min(limit, 100)
+    queries = [
+        (f"top-headlines:{country}:{NEWSAPI_CATEGORIES[cat]}", {
+            "country": country,
+            "category": NEWSAPI_CATEGORIES[cat],
+            "pageSize": page_size,
+            "page": page,
+            "apiKey": NEWSAPI_KEY,
+        })
+        for country in countries for cat in categories for page in range(1, pages + 1)
+    ]
+
+    limits = httpx.Limits(max_connections=NEWSAPI_CONCURRENCY, max_keepalive_connections=NEWSAPI_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=20, limits=limits) as client:
+        responses = await asyncio.gather(*(_get_json(client, sem, budget, params) for _, params in queries))
+
+    merged: Dict[str, Dict] = {}
+    # לכל שאילתה (כל העמודים שלה): הכתבות הטריות, והאם ראינו את כל התוצאות
+    fresh: Dict[str, List[Dict]] = {}
+    complete: Dict[str, bool] = {}
+    for (query, params), data in zip(queries, responses):
+        fresh.setdefault(query, [])
+        if data is None:
+            complete[query] = False
+            continue
+        got = data.get("articles") or []
+        # כל העמודים שהוגדרו לשאילתה נטענו – זה החלון שמושכים בכל ריצה, וה-mark מתקדם;
+        # עמוד שנכשל (למעלה) משאיר את ה-mark במקום
+        complete.setdefault(query, True)
+        since = _marks.get(query)
+        for a in got:
+            if since and (a.get("publishedAt") or "") < since:
+                continue
+            if a.get("url"):
+                fresh[query].append(a)
+                merged.setdefault(a["url"], a)
+
+    articles = sorted(merged.values(), key=lambda a: a.get("publishedAt") or "", reverse=True)[:limit]
+    # ה-marks מתקדמים רק לפי מה שמוחזר בפועל – כתבה טרייה שנחתכה ב-limit תימשך שוב
+    returned = {a["url"] for a in articles}
+    for query, items in fresh.items():
+        _marks.advance(query,
+                       [a.get("publishedAt") for a in items if a["url"] in returned],
+                       [a.get("publishedAt") for a in items if a["url"] not in returned],
+                       complete=complete.get(query, False))
+    print(f"🌐 fan-out: {len(queries)} queries, {NEWSAPI_REQUEST_BUDGET - budget.remaining} requests, "
+          f"{len(articles)} articles")
+    return [{
+        "title": a.get("title") or "",
+        "url": a.get("url"),
+        "summary": a.get("description"),
+        "published_at": a.get("publishedAt"),
+        "imageUrl": a.get("urlToImage"),
+    } for a in articles]
+
+
+def fetch_fanout(limit: int = 10) -> List[Dict]:
+    """עטיפה סינכרונית ל-fetch_fanout_async (נקראת מתוך pull_and_process)."""
+    return asyncio.run(fetch_fanout_async(limit, NEWSAPI_COUNTRIES, list(CATEGORIES), NEWSAPI_FANOUT_PAGES))
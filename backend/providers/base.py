@@ -0,0 +1,20 @@
+# backend/providers/base.py
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List
+
+# כל מקור מחזיר כתבות גולמיות בפורמט האחיד:
+# {title, url, summary, published_at, imageUrl}
+RawArticle = Dict
+
+
+class NewsSource(ABC):
+    """ממשק למקור חדשות. מקור חדש = מחלקה שמממשת iter_articles ונרשמת ב-registry."""
+
+    name: str = "source"
+
+    @abstractmethod
+    def iter_articles(self, limit: int) -> Iterator[RawArticle]:
+        """מחזיר כתבות אחת-אחת (עד limit), כדי שמקורות גדולים לא יישבו בזיכרון בבת אחת."""
+
+    def fetch(self, limit: int) -> List[RawArticle]:
+        return list(self.iter_articles(limit))
@@ -0,0 +1,114 @@
+# backend/providers/http_cache.py
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+import requests
+
+log = logging.getLogger("http_cache")
+
+
+class DiskHttpCache:
+    """
+    cache לתשובות HTTP גולמיות על הדיסק, עם revalidation לפי ETag / Last-Modified.
+    אם השרת מחזיר 304 – משתמשים בגוף השמור ולא מורידים שוב.
+    """
+
+    def __init__(self, directory: Path, session: Optional[requests.Session] = None,
+                 ignore_params: tuple = ("apiKey",)):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.session = session or requests.Session()
+        self.ignore_params = ignore_params
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, url: str, params: dict) -> Path:
+        # מפתח בלי המפתח הסודי, כדי שלא ייכתב לדיסק ושהחלפתו לא תשבור את ה-cache
+        public = sorted((k, str(v)) for k, v in params.items() if k not in self.ignore_params)
+        key = hashlib.sha256(json.dumps([url, public]).encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def get_json(self, url: str, params: dict, timeout: float = 20) -> Optional[dict]:
+        """GET עם revalidation. מחזיר את גוף ה-JSON, או None אם הבקשה נכשלה."""
+        path = self._path(url, params)
+        cached = None
+        if path.exists():
+            try:
+                cached = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                cached = None
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        if r.status_code == 304 and cached:
+            self.hits += 1
+            return cached["body"]
+        if r.status_code != 200:
+            log.error("❌ %s returned %s: %s", url, r.status_code, r.text[:300])
+            return None
+
+        self.misses += 1
+        body = r.json()
+        if r.headers.get("ETag") or r.headers.get("Last-Modified"):
+            path.write_text(json.dumps({
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "body": body,
+            }), encoding="utf-8")
+        return body
+
+
+class HighWaterMarks:
+    """
+    ה-publishedAt החדש ביותר שנראה לכל שאילתה, נשמר בקובץ JSON.
+    עדכונים נאספים כ-pending ונכתבים רק ב-commit() – אחרי שהריצה נשמרה בהצלחה.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._marks = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        self._pending: dict = {}
+
+    def get(self, query: str) -> Optional[str]:
+        return self._marks.get(query)
+
+    def observe(self, query: str, published_at: Optional[str]) -> None:
+        # מחרוזות ISO-8601 ב-UTC ממוינות נכון גם כהשוואת מחרוזות
+        if published_at and published_at > (self._pending.get(query) or self._marks.get(query) or ""):
+            self._pending[query] = published_at
+
+    def advance(self, query: str, returned: Iterable[Optional[str]],
+                dropped: Iterable[Optional[str]] = (), complete: bool = True) -> None:
+        """
+        מקדם את ה-mark אחרי ריצה רק עד נקודה שלא מדלגת על כתבות שלא הוחזרו
+        (בריצה הבאה מסננים publishedAt >= mark): אם כל הכתבות הטריות הוחזרו – עד
+        החדשה שבהן; אם חלק נחתכו (limit) – עד הישנה שבחתוכות; אם לא ראינו את כל
+        התוצאות (עמודים שלא נמשכו / קריאה שנכשלה) – ה-mark לא זז.
+        """
+        if not complete:
+            return
+        dropped = list(dropped)
+        if dropped:
+            self.observe(query, min(p or "" for p in dropped))
+            return
+        for published_at in returned:
+            self.observe(query, published_at)
+
+    def commit(self) -> None:
+        if not self._pending:
+            return
+        self._marks.update(self._pending)
+        self._pending = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._marks, indent=2), encoding="utf-8")
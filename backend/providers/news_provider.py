@@ -101,9 +101,10 @@
 
 # backend/providers/news_provider.py
 import logging
-from typing import List, Dict, Optional
-import requests
-from backend.config import NEWSAPI_KEY
+from typing import List, Dict, Optional, Tuple
+from backend.config import NEWSAPI_KEY, NEWSAPI_MAX_PAGES, NEWS_CACHE_DIR, NEWS_FETCH_MODE
+from backend.providers.base import NewsSource
+from backend.providers.http_cache import DiskHttpCache, HighWaterMarks
 
 log = logging.getLogger("news_provider")
 
@@ -146,16 +147,24 @@ def _repeat_to_limit(base: List[Dict], limit: int) -> List[Dict]:
     return (base * ((limit + len(base) - 1) // len(base)))[:limit]
 
 
+# תשובות גולמיות נשמרות על הדיסק (revalidation לפי ETag/Last-Modified),
+# ולכל שאילתה נשמר ה-publishedAt החדש ביותר שכבר נמשך
+_http = DiskHttpCache(NEWS_CACHE_DIR / "responses")
+_marks = HighWaterMarks(NEWS_CACHE_DIR / "high_water_marks.json")
+
+_TOP_HEADLINES_URL = "https://newsapi.org/v2/top-headlines"
+_EVERYTHING_URL = "https://newsapi.org/v2/everything"
+_EVERYTHING_QUERY = "technology OR science OR politics OR sports OR culture"
+
+
 def _safe_call(url: str, params: dict) -> Optional[dict]:
     """קריאה בטוחה ל-NewsAPI עם לוג שגיאה כשיש בעיות"""
     try:
-        r = requests.get(url, params=params, timeout=20)
-        if r.status_code != 200:
-            log.error("❌ NewsAPI %s returned %s: %s", url, r.status_code, r.text[:300])
+        data = _http.get_json(url, params, timeout=20)
+        if data is None:
             return None
-        data = r.json()
 
-        if not data or not data.get("articles"):
+        if not data.get("articles"):
             log.warning("⚠️ NewsAPI returned no articles for %s params=%s", url, params)
 
         return data
@@ -165,9 +174,55 @@ def _safe_call(url: str, params: dict) -> Optional[dict]:
         return None
 
 
+def _fetch_pages(url: str, params: dict, limit: int, since: Optional[str],
+                 sorted_by_date: bool) -> Optional[Tuple[List[Dict], bool, List[Dict], bool]]:
+    """
+    מושך עמוד אחרי עמוד רק כתבות שפורסמו מאז ה-high-water mark (since).
+    מחזיר (כתבות חדשות עד limit, האם הוחזרו כתבות בכלל, כתבות חדשות שנחתכו,
+    האם מותר לקדם את ה-mark), או None אם הקריאה הראשונה נכשלה. לא מקדמים רק כשעמוד
+    נכשל, או כשנשארו עמודים שלא נקראו בתוצאות שאינן ממוינות לפי תאריך.
+    """
+    page_size = min(limit, 100)
+    out: List[Dict] = []
+    seen_any = False
+    complete = False
+    for page in range(1, NEWSAPI_MAX_PAGES + 1):
+        data = _safe_call(url, {**params, "pageSize": page_size, "page": page})
+        if data is None:
+            if page == 1:
+                return None
+            break
+
+        articles = data.get("articles") or []
+        seen_any = seen_any or bool(articles)
+        fresh = [a for a in articles if not since or (a.get("publishedAt") or "") >= since]
+        out.extend(fresh)
+
+        if len(articles) < page_size or page * page_size >= (data.get("totalResults") or 0):
+            complete = True
+            break
+        # בתוצאות ממוינות לפי תאריך – ברגע שהגענו לכתבות ישנות אין טעם בעמוד הבא
+        if sorted_by_date and len(fresh) < len(articles):
+            complete = True
+            break
+        if len(out) >= limit:
+            # ממוין מהחדש לישן – עצירה ב-limit היא חיתוך נקי: כל מה שלא נקרא ישן יותר
+            # ממה שהוחזר. בלי מיון לפי תאריך נשארו עמודים שלא נקראו – ה-mark לא זז
+            complete = sorted_by_date
+            break
+    if not sorted_by_date:
+        # top-headlines לא ממוין לפי תאריך – חותכים אחרי מיון, כך שנשמרות החדשות ביותר
+        out.sort(key=lambda a: a.get("publishedAt") or "", reverse=True)
+    return out[:limit], seen_any, out[limit:], complete
+
+
+def commit_high_water_marks() -> None:
+    """נקרא אחרי שהריצה נשמרה – רק אז מקדמים את ה-high-water marks."""
+    _marks.commit()
+
+
 def fetch_latest(limit: int = 10) -> List[Dict]:
     print("🔥 נכנסנו ל־fetch_latest")
-    print("🔥 NEWSAPI_KEY ב-fetch_latest:", NEWSAPI_KEY)
 
     # אם אין KEY — מחזירים דמה
     if not NEWSAPI_KEY:
@@ -176,39 +231,50 @@ def fetch_latest(limit: int = 10) -> List[Dict]:
 
     print("🔑 משתמשים ב־NEWSAPI_KEY:", NEWSAPI_KEY[:5], "...")
 
-    # 1) ניסיון ראשון: top-headlines מארה״ב
-    url1 = "https://newsapi.org/v2/top-headlines"
+    # מצב fan-out: כל הקטגוריות/מדינות במקביל (async)
+    if NEWS_FETCH_MODE == "fanout":
+        from backend.providers.async_provider import fetch_fanout
+        return fetch_fanout(limit)
+
+    # 1) ניסיון ראשון: top-headlines מארה״ב (ה-API לא תומך ב-from, מסננים לפי ה-mark)
+    query = "top-headlines:us"
+    since = _marks.get(query)
     p1 = {
         "country": "us",   # אפשר לשנות ל־"il"
-        "pageSize": limit,
         "apiKey": NEWSAPI_KEY,
     }
+    res = _fetch_pages(_TOP_HEADLINES_URL, p1, limit, since, sorted_by_date=False)
 
-    data = _safe_call(url1, p1)
-
-    # 2) fallback — everything
-    if not data or not data.get("articles"):
+    # 2) fallback — everything (רק אם top-headlines נכשל או ריק לגמרי, לא כשאין חדש)
+    if res is None or not res[1]:
         print("⚠️ top-headlines ריק — מנסה everything")
 
-        url2 = "https://newsapi.org/v2/everything"
+        query = f"everything:{_EVERYTHING_QUERY}"
+        since = _marks.get(query)
         p2 = {
-            "q": "technology OR science OR politics OR sports OR culture",
+            "q": _EVERYTHING_QUERY,
             "language": "en",
             "sortBy": "publishedAt",
-            "pageSize": limit,
             "apiKey": NEWSAPI_KEY,
         }
+        if since:
+            p2["from"] = since
 
-        data = _safe_call(url2, p2)
+        res = _fetch_pages(_EVERYTHING_URL, p2, limit, since, sorted_by_date=True)
 
-    # 3) אם עדיין אין — דמה
-    if not data or not data.get("articles"):
+    # 3) אם הקריאות נכשלו — דמה
+    if res is None:
         print("❗ לא התקבלו כתבות — מחזירים דמה")
         return _repeat_to_limit(_DUMMY, limit)
 
+    articles, _, dropped, complete = res
+    # ה-mark מתקדם רק לפי מה שמוחזר בפועל – כתבה שנחתכה ב-limit לא הולכת לאיבוד
+    _marks.advance(query, [a.get("publishedAt") for a in articles],
+                   [a.get("publishedAt") for a in dropped], complete=complete)
+
     # 4) מיפוי נתונים לפורמט אחיד
     out: List[Dict] = []
-    for a in data.get("articles", [])[:limit]:
+    for a in articles:
         out.append({
             "title": a.get("title") or "",
             "url": a.get("url"),
@@ -217,5 +283,14 @@ def fetch_latest(limit: int = 10) -> List[Dict]:
             "imageUrl": a.get("urlToImage"),
         })
 
-    print("✅ Results ready:", len(out))
+    print(f"✅ Results ready: {len(out)} new since {since}")
     return out
+
+
+class NewsApiSource(NewsSource):
+    """NewsAPI כמקור ב-registry (top-headlines / everything / fan-out, לפי ההגדרות)."""
+
+    name = "newsapi"
+
+    def iter_articles(self, limit: int):
+        return iter(fetch_latest(limit))
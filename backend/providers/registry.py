@@ -0,0 +1,120 @@
+# backend/providers/registry.py
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple
+
+from backend.config import NEWS_SOURCES, RSS_FEEDS
+from backend.providers.base import NewsSource, RawArticle
+
+
+class SourceRegistry:
+    """מחזיק את מקורות החדשות הפעילים ומושך מכולם במקביל."""
+
+    def __init__(self):
+        self._sources: Dict[str, NewsSource] = {}
+
+    def register(self, source: NewsSource) -> None:
+        # שם כפול היה מחליף בשקט את המקור הקודם (והסטטיסטיקות שלהם מתערבבות)
+        if source.name in self._sources:
+            raise ValueError(f"news source '{source.name}' is already registered")
+        self._sources[source.name] = source
+
+    @property
+    def sources(self) -> List[NewsSource]:
+        return list(self._sources.values())
+
+    def fetch_all(self, limit: int) -> Tuple[List[RawArticle], Dict[str, dict]]:
+        """
+        מושך עד limit כתבות מכל מקור, כל המקורות במקביל.
+        מחזיר את הכתבות (בלי כפילויות URL) ותזמון/כמות/שגיאה לכל מקור.
+        """
+        timings: Dict[str, dict] = {}
+        items = list(self.iter_all(limit, timings))
+        return items, timings
+
+    def iter_all(self, limit: int, timings: Dict[str, dict], queue_size: int = 256,
+                 max_seen: int = 10_000) -> Iterator[RawArticle]:
+        """
+        גרסת streaming של fetch_all: כל מקור רץ ב-thread משלו ודוחף לתור חסום,
+        והכתבות יוצאות מיד כשהן מגיעות (בלי כפילויות URL). timings מתמלא בסוף כל מקור.
+        סינון הכפילויות זוכר רק את max_seen ה-URLs האחרונים (LRU), כך שהזיכרון לא
+        גדל עם הריצה; כפילות ישנה יותר נתפסת ב-dedup מול מונגו.
+        """
+        q: queue.Queue = queue.Queue(maxsize=queue_size)
+        done = object()
+        # נקבע כשהצרכן מפסיק לקרוא (סיום, חריגה או close של ה-generator)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # put עם timeout: thread של מקור לא נתקע לנצח על תור מלא שאף אחד לא קורא
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.2)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(source: NewsSource) -> None:
+            started = time.perf_counter()
+            count, error = 0, None
+            articles = None
+            try:
+                articles = source.iter_articles(limit)
+                for it in articles:
+                    if not put(it):
+                        break
+                    count += 1
+            except Exception as e:
+                print(f"❌ source '{source.name}' failed:", e)
+                error = str(e)
+            finally:
+                # generator של מקור שנעצר באמצע משחרר את החיבורים שלו
+                close = getattr(articles, "close", None)
+                if close is not None:
+                    close()
+                timings[source.name] = {"seconds": round(time.perf_counter() - started, 3),
+                                        "items": count, "error": error}
+                put(done)
+
+        for source in self.sources:
+            threading.Thread(target=run, args=(source,), name=f"source-{source.name}", daemon=True).start()
+
+        remaining = len(self._sources)
+        seen: "OrderedDict[str, None]" = OrderedDict()
+        try:
+            while remaining:
+                it = q.get()
+                if it is done:
+                    remaining -= 1
+                    continue
+                url = it.get("url")
+                if url in seen:
+                    seen.move_to_end(url)
+                    continue
+                seen[url] = None
+                if len(seen) > max_seen:
+                    seen.popitem(last=False)
+                yield it
+        finally:
+            stop.set()
+
+
+def build_registry() -> SourceRegistry:
+    """בונה את ה-registry לפי NEWS_SOURCES (למשל "newsapi,rss") ו-RSS_FEEDS."""
+    from backend.providers.news_provider import NewsApiSource
+    from backend.providers.rss_provider import RssSource
+
+    reg = SourceRegistry()
+    if "newsapi" in NEWS_SOURCES:
+        reg.register(NewsApiSource())
+    if "rss" in NEWS_SOURCES:
+        # אותו פיד שהופיע פעמיים ב-RSS_FEEDS נרשם פעם אחת
+        for url in dict.fromkeys(RSS_FEEDS):
+            reg.register(RssSource(url))
+    return reg
+
+
+sources = build_registry()
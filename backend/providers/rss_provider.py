@@ -0,0 +1,97 @@
+# backend/providers/rss_provider.py
+import logging
+import xml.etree.ElementTree as ET
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+
+import requests
+
+from backend.providers.base import NewsSource, RawArticle
+
+log = logging.getLogger("rss_provider")
+
+
+def _local(tag: str) -> str:
+    """שם התגית בלי namespace: '{http://www.w3.org/2005/Atom}entry' → 'entry'."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _to_iso(value: Optional[str]) -> Optional[str]:
+    """RSS משתמש ב-RFC 822 (pubDate), Atom ב-ISO 8601 – מחזירים תמיד ISO ב-UTC."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return value
+
+
+def _parse_entry(elem: ET.Element) -> RawArticle:
+    """ממפה <item> (RSS) או <entry> (Atom) לפורמט האחיד."""
+    out = {"title": "", "url": None, "summary": None, "published_at": None, "imageUrl": None}
+    for child in elem:
+        tag = _local(child.tag)
+        text = (child.text or "").strip()
+        if tag == "title":
+            out["title"] = text
+        elif tag == "link":
+            # Atom: <link rel="alternate" href="..."/>, RSS: <link>...</link>
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                out["url"] = href
+            elif text and not out["url"]:
+                out["url"] = text
+        elif tag in ("description", "summary") or (tag == "content" and not child.get("url")):
+            out["summary"] = out["summary"] or text or None
+        elif tag in ("pubDate", "published", "updated", "date"):
+            out["published_at"] = out["published_at"] or _to_iso(text)
+        elif tag in ("content", "thumbnail", "enclosure"):
+            # media:content / media:thumbnail / enclosure של תמונה
+            url = child.get("url")
+            kind = child.get("type") or child.get("medium") or "image"
+            if url and "image" in kind and not out["imageUrl"]:
+                out["imageUrl"] = url
+    return out
+
+
+class RssSource(NewsSource):
+    """
+    מקור RSS/Atom. הפיד נקרא כ-stream ומפוענח עם iterparse –
+    כל <item>/<entry> מטופל ומשוחרר מיד, כך שגם פיד ענק לא נטען לזיכרון בשלמותו.
+    """
+
+    def __init__(self, url: str, timeout: float = 20, session: Optional[requests.Session] = None):
+        self.url = url
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        # לפי ה-URL המלא: כמה פידים מאותו אתר (פיד לכל מדור) הם מקורות נפרדים
+        self.name = f"rss:{url}"
+
+    def iter_articles(self, limit: int) -> Iterator[RawArticle]:
+        with self.session.get(self.url, stream=True, timeout=self.timeout) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True   # gzip/deflate מפוענחים תוך כדי קריאה
+            count = 0
+            stack = []   # שרשרת ההורים של האלמנט הנוכחי
+            for event, elem in ET.iterparse(r.raw, events=("start", "end")):
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if _local(elem.tag) not in ("item", "entry"):
+                    continue
+                article = _parse_entry(elem)
+                # משחררים את האלמנט שכבר טופל, כולל ההפניה אליו מה-<channel>/<feed>
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+                if article["url"]:
+                    yield article
+                    count += 1
+                    if count >= limit:
+                        return
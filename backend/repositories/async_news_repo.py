@@ -0,0 +1,88 @@
+# backend/repositories/async_news_repo.py
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from backend.config import (MONGO_CONNECT_TIMEOUT_MS, MONGO_MAX_IDLE_MS, MONGO_MAX_POOL_SIZE,
+                            MONGO_MIN_POOL_SIZE, MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                            MONGO_SOCKET_TIMEOUT_MS, MONGO_WAIT_QUEUE_TIMEOUT_MS)
+from backend.models.schemas import News
+from backend.repositories.news_repo import (LIST_PROJECTION, LIST_SORT, NewsRepository,
+                                            list_query)
+
+
+class AsyncNewsRepository(ABC):
+    """
+    הצד של הקריאה ב-NewsRepository בגרסה אסינכרונית (אותם שמות ואותה התנהגות),
+    ל-endpoints שרצים על ה-event loop במקום ב-threadpool.
+    """
+    @abstractmethod
+    async def get(self, news_id: str) -> Optional[News]: ...
+    @abstractmethod
+    async def list(self, topic: str | None = None, limit: int = 10,
+                   after: Optional[Tuple[str, str]] = None) -> List[News]: ...
+    @abstractmethod
+    async def list_raw(self, topic: str | None = None, limit: int = 10,
+                       after: Optional[Tuple[str, str]] = None) -> List[dict]: ...
+    async def close(self) -> None:
+        pass
+
+
+class AsyncRepositoryAdapter(AsyncNewsRepository):
+    """עוטף repository סינכרוני שלא חוסם (למשל InMemoryNewsRepository) בממשק האסינכרוני."""
+
+    def __init__(self, repo: NewsRepository):
+        self.repo = repo
+
+    async def get(self, news_id: str) -> Optional[News]:
+        return self.repo.get(news_id)
+
+    async def list(self, topic: str | None = None, limit: int = 10,
+                   after: Optional[Tuple[str, str]] = None) -> List[News]:
+        return self.repo.list(topic, limit, after)
+
+    async def list_raw(self, topic: str | None = None, limit: int = 10,
+                       after: Optional[Tuple[str, str]] = None) -> List[dict]:
+        return self.repo.list_raw(topic, limit, after)
+
+
+class AsyncMongoNewsRepository(AsyncNewsRepository):
+    """
+    קריאות דרך ה-client האסינכרוני של PyMongo: המתנה למונגו לא תופסת thread,
+    כך שמספר הקריאות המקבילות חסום רק ב-pool החיבורים (MONGO_MAX_POOL_SIZE).
+    בקשה שמחכה לחיבור יותר מ-MONGO_WAIT_QUEUE_TIMEOUT_MS נכשלת במקום להיתקע.
+    """
+
+    def __init__(self):
+        from pymongo import AsyncMongoClient
+
+        mongo_url = os.getenv("MONGO_URL", "mongodb://mongo:27017")
+        self.client = AsyncMongoClient(
+            mongo_url,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+            serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+        )
+        self.db = self.client[os.getenv("MONGO_DB", "newsdb")]
+        self.collection = self.db["news"]
+
+    async def get(self, news_id: str) -> Optional[News]:
+        doc = await self.collection.find_one({"id": news_id}, {"_id": 0})
+        return News(**doc) if doc else None
+
+    async def list(self, topic: str | None = None, limit: int = 10,
+                   after: Optional[Tuple[str, str]] = None) -> List[News]:
+        cursor = self.collection.find(list_query(topic, after), {"_id": 0}).sort(LIST_SORT).limit(limit)
+        return [News(**d) for d in await cursor.to_list(length=limit)]
+
+    async def list_raw(self, topic: str | None = None, limit: int = 10,
+                       after: Optional[Tuple[str, str]] = None) -> List[dict]:
+        cursor = self.collection.find(list_query(topic, after), LIST_PROJECTION).sort(LIST_SORT).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def close(self) -> None:
+        await self.client.close()
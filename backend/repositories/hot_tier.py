@@ -0,0 +1,233 @@
+# backend/repositories/hot_tier.py
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.models.schemas import CATEGORIES
+from backend.repositories.news_repo import LIST_FIELDS
+
+# published_at ריק / לא תקין – נמוך מכל תאריך, כמו "" במיון של מונגו
+_NO_DATE = np.iinfo(np.int32).min
+_ID_DTYPE = "U64"
+
+
+def _date_code(published_at: Optional[str]) -> int:
+    """'YYYY-MM-DD...' → ימים מאז 1970 (int32), כדי להשוות ולמיין וקטורית."""
+    try:
+        day = np.datetime64((published_at or "")[:10], "D")
+    except ValueError:
+        return _NO_DATE
+    # "" מתפרש כ-NaT
+    return _NO_DATE if np.isnat(day) else int(day.astype(np.int64))
+
+
+class HotRecord:
+    """ה-payload של כתבה ב-hot tier: רק LIST_FIELDS, בלי dict לכל רשומה."""
+    __slots__ = LIST_FIELDS
+
+    def __init__(self, doc: dict):
+        for f in LIST_FIELDS:
+            setattr(self, f, doc.get(f))
+
+    def to_raw(self) -> dict:
+        return {f: getattr(self, f) for f in LIST_FIELDS}
+
+
+class HotTier:
+    """
+    N הכתבות החדשות ביותר בזיכרון, בעמודות numpy: published_at (ימים), score,
+    קוד topic ו-id (לשבירת שוויון). סינון, מיון ו-top-k נעשים וקטורית על העמודות;
+    ה-payload נשמר ב-HotRecord. מעבר ל-capacity יוצאת הכתבה הישנה ביותר.
+
+    floor הוא המפתח (published_at, id) הנמוך ביותר שנשמר: כל כתבה מעליו נמצאת כאן.
+    None אומר שה-tier מכיל את כל האוסף. query מחזיר None כשאין מספיק תוצאות
+    מעל ה-floor – ואז צריך לפנות למונגו.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._published = np.full(capacity, _NO_DATE, dtype=np.int32)
+        self._score = np.zeros(capacity, dtype=np.float32)
+        self._topic = np.full(capacity, -1, dtype=np.int16)
+        self._ids = np.zeros(capacity, dtype=_ID_DTYPE)
+        self._valid = np.zeros(capacity, dtype=bool)
+        self._records: List[Optional[HotRecord]] = [None] * capacity
+        self._by_id: Dict[str, int] = {}
+        self._by_url: Dict[str, int] = {}
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._topics: Dict[str, int] = {t: i for i, t in enumerate(CATEGORIES)}
+        self.floor: Optional[Tuple[int, str]] = None
+        # דור ה-ingestion שה-tier משקף (ראו IngestGeneration)
+        self.generation: Optional[int] = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _topic_code(self, topic: Optional[str], create: bool = False) -> int:
+        if topic not in self._topics and create:
+            self._topics[topic] = len(self._topics)
+        return self._topics.get(topic, -2)
+
+    # ---- כתיבה ----
+
+    def load(self, docs: Iterable[dict]) -> None:
+        """
+        בונה מחדש מ-docs = הכתבות החדשות ביותר (למשל list_raw(limit=capacity)).
+        אם הגיעו פחות מ-capacity – זה כל האוסף (floor=None).
+        """
+        docs = list(docs)
+        with self._lock:
+            self._valid[:] = False
+            self._records = [None] * self.capacity
+            self._by_id.clear()
+            self._by_url.clear()
+            self._free = list(range(self.capacity - 1, -1, -1))
+            self.floor = None
+            for doc in docs[:self.capacity]:
+                self._put(doc)
+            if len(docs) >= self.capacity and self._by_id:
+                self.floor = self._min_key()
+
+    def upsert_many(self, docs: Iterable[dict]) -> None:
+        with self._lock:
+            for doc in docs:
+                key = (_date_code(doc.get("published_at")), doc["id"])
+                if self.floor is not None and key < self.floor:
+                    # מתחת לחלון – לא שייכת ל-tier; גרסה קודמת שלה (עם תאריך חדש יותר) יוצאת
+                    self._discard(doc)
+                    continue
+                self._put(doc)
+
+    def remove(self, news_ids: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for news_id in news_ids:
+                slot = self._by_id.get(news_id)
+                if slot is not None:
+                    self._drop(slot)
+                    removed += 1
+        return removed
+
+    def _discard(self, doc: dict) -> None:
+        """מוציא את הגרסה השמורה של אותה כתבה (לפי id או url), אם יש."""
+        slot = self._by_id.get(doc["id"])
+        if slot is None:
+            slot = self._by_url.get(doc.get("url"))
+        if slot is not None:
+            self._drop(slot)
+
+    def _put(self, doc: dict) -> None:
+        # אותה כתבה (לפי id או url) – דורסים במקום
+        self._discard(doc)
+        evicted = not self._free
+        if evicted:
+            key = (_date_code(doc.get("published_at")), doc["id"])
+            oldest = self._min_key()
+            if key < oldest:
+                # ישנה מכל מה שבמלאי (למשל כתבה שהגיעה באיחור) – לא נכנסת, וה-tier
+                # כבר לא מכסה את כל האוסף: הכול מ-oldest ומעלה עדיין כאן
+                self.floor = oldest
+                return
+            self._evict_oldest()
+        slot = self._free.pop()
+        self._published[slot] = _date_code(doc.get("published_at"))
+        self._score[slot] = doc.get("score") or 0.0
+        self._topic[slot] = self._topic_code(doc.get("topic"), create=True)
+        self._ids[slot] = doc["id"]
+        self._valid[slot] = True
+        self._records[slot] = HotRecord(doc)
+        self._by_id[doc["id"]] = slot
+        if doc.get("url"):
+            self._by_url[doc["url"]] = slot
+        if evicted:
+            # מה שיצא כבר לא מכוסה: ה-floor עולה למפתח הנמוך שנשאר (כולל הכתבה החדשה)
+            self.floor = self._min_key()
+
+    def _drop(self, slot: int) -> None:
+        record = self._records[slot]
+        self._by_id.pop(record.id, None)
+        if self._by_url.get(record.url) == slot:
+            del self._by_url[record.url]
+        self._records[slot] = None
+        self._valid[slot] = False
+        self._free.append(slot)
+
+    def _oldest_slot(self) -> int:
+        valid = np.flatnonzero(self._valid)
+        pub = self._published[valid]
+        ties = valid[pub == pub.min()]
+        return int(ties[self._ids[ties].argmin()])
+
+    def _min_key(self) -> Tuple[int, str]:
+        slot = self._oldest_slot()
+        return int(self._published[slot]), str(self._ids[slot])
+
+    def _evict_oldest(self) -> None:
+        self._drop(self._oldest_slot())
+        self.evictions += 1
+
+    # ---- קריאה ----
+
+    def get(self, news_id: str) -> Optional[dict]:
+        with self._lock:
+            slot = self._by_id.get(news_id)
+            return self._records[slot].to_raw() if slot is not None else None
+
+    def query(self, topic: Optional[str] = None, limit: int = 10,
+              after: Optional[Tuple[str, str]] = None, order: str = "published_at") -> Optional[List[dict]]:
+        """
+        עד limit כתבות לפי published_at (ואז id) או לפי score, בסדר יורד.
+        after = (published_at, id) כמו ב-keyset של list. לפי תאריך: None אם ה-tier
+        לא יכול לענות בוודאות (פחות מ-limit תוצאות מעל ה-floor). לפי score התשובה
+        היא תמיד מתוך החלון של ה-tier.
+        """
+        with self._lock:
+            mask = self._valid.copy()
+            if topic and topic != "all":
+                mask &= self._topic == self._topic_code(topic)
+            if after is not None:
+                a_pub, a_id = _date_code(after[0]), after[1]
+                mask &= (self._published < a_pub) | ((self._published == a_pub) & (self._ids < a_id))
+            idx = np.flatnonzero(mask)
+
+            if order != "score" and len(idx) < limit and self.floor is not None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+            if order == "score":
+                idx = self._top_k(idx, self._score[idx], limit)
+                ranked = idx[np.lexsort((self._ids[idx], self._published[idx], self._score[idx]))[::-1]]
+            else:
+                idx = self._top_k(idx, self._published[idx], limit)
+                ranked = idx[np.lexsort((self._ids[idx], self._published[idx]))[::-1]]
+            return [self._records[i].to_raw() for i in ranked[:limit]]
+
+    @staticmethod
+    def _top_k(idx: np.ndarray, values: np.ndarray, k: int) -> np.ndarray:
+        """
+        מצמצם ל-k הגבוהים (argpartition, O(n)) לפני המיון המלא.
+        שומר את כל מי ששווה לערך ה-k, כדי ששבירת השוויון לפי id תישאר נכונה.
+        """
+        if len(idx) <= k or k <= 0:
+            return idx
+        kth = values[np.argpartition(-values, k - 1)[k - 1]]
+        return idx[values >= kth]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "complete": self.floor is None,
+            "generation": self.generation,
+        }
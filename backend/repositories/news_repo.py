@@ -1,33 +1,157 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from abc import ABC, abstractmethod
+from backend.config import MONGO_BULK_CHUNK_SIZE
 from backend.models.schemas import News
 
+# השדות ש-GET /news מחזיר – ה-projection של מסלול הקריאה הרזה
+LIST_FIELDS = ("id", "title", "summary", "url", "published_at", "topic", "entities", "score", "imageUrl")
+
 class NewsRepository(ABC):
     @abstractmethod
     def save(self, item: News) -> None: ...
     @abstractmethod
+    def save_many(self, items: Iterable[News]) -> Dict[str, int]:
+        """שמירה באצ'ית (upsert לפי url); מחזיר {"matched", "modified", "upserted"}."""
+    @abstractmethod
     def get(self, news_id: str) -> Optional[News]: ...
     @abstractmethod
-    def list(self, topic: str | None = None, limit: int = 10) -> List[News]: ...
+    def list(self, topic: str | None = None, limit: int = 10,
+             after: Optional[Tuple[str, str]] = None) -> List[News]:
+        """
+        הכתבות החדשות ביותר לפי (published_at, id) בסדר יורד.
+        after = (published_at, id) של הפריט האחרון בעמוד הקודם (keyset pagination).
+        """
+    @abstractmethod
+    def list_raw(self, topic: str | None = None, limit: int = 10,
+                 after: Optional[Tuple[str, str]] = None) -> List[dict]:
+        """כמו list, אבל dict-ים גולמיים עם LIST_FIELDS בלבד (בלי מודל News לכל כתבה)."""
+    @abstractmethod
+    def list_by_ids(self, news_ids: List[str]) -> List[dict]:
+        """dict-ים גולמיים (LIST_FIELDS) לכתבות לפי id, באותו סדר; id שלא נמצא מדולג."""
+    @abstractmethod
+    def scan_raw(self, fields: Iterable[str]) -> Iterable[dict]:
+        """
+        מעבר על כל הכתבות עם השדות המבוקשים בלבד (לבניית אינדקסים מחדש), מהישנה
+        לחדשה לפי (published_at, id) – האינדקסים בזיכרון מניחים שהחדשה נכנסת אחרונה.
+        """
+    @abstractmethod
+    def find_by_urls(self, urls: List[str]) -> Dict[str, dict]:
+        """מחזיר {url: {"id", "content_hash", "cluster_id"}} לכתבות שכבר שמורות."""
+    @abstractmethod
+    def find_near_duplicates(self, lsh_keys: List[str], limit: int = 500) -> List[dict]:
+        """כתבות שחולקות לפחות מפתח LSH אחד (מועמדות לכמעט-כפילות), עד limit."""
+    @abstractmethod
+    def scan_older_than(self, cutoff: str) -> Iterable[dict]:
+        """מסמכים מלאים (בלי _id) של כתבות עם published_at לפני cutoff – לארכוב."""
+    @abstractmethod
+    def delete_by_ids(self, news_ids: List[str]) -> int:
+        """מחיקה לפי id; מחזיר כמה נמחקו."""
+    @abstractmethod
+    def remove_duplicates(self) -> List[str]:
+        """מוחק כפילויות לפי url (נשאר העותק האחרון שנכתב); מחזיר את ה-ids שנמחקו."""
+    def storage_stats(self) -> Dict[str, int]:
+        """גודל האוסף: count, data_bytes, storage_bytes, index_bytes (מה שידוע)."""
+        return {}
+    def ensure_indexes(self) -> List[str]:
+        """יצירת האינדקסים המוצהרים (בעליית השרת); מחזיר את שמותיהם."""
+        return []
 
 class InMemoryNewsRepository(NewsRepository):
     def __init__(self):
         self._db: Dict[str, News] = {}
     def save(self, item: News) -> None:
         self._db[item.id] = item
+    def save_many(self, items: Iterable[News]) -> Dict[str, int]:
+        result = {"matched": 0, "modified": 0, "upserted": 0}
+        by_url = {n.url: n.id for n in self._db.values()}
+        for item in items:
+            old_id = by_url.get(item.url)
+            if old_id is None:
+                result["upserted"] += 1
+            else:
+                result["matched"] += 1
+                if self._db[old_id] != item:
+                    result["modified"] += 1
+                del self._db[old_id]
+            self._db[item.id] = item
+            by_url[item.url] = item.id
+        return result
     def get(self, news_id: str) -> Optional[News]:
         return self._db.get(news_id)
-    def list(self, topic: str | None = None, limit: int = 10) -> List[News]:
-        values = list(self._db.values())
-        if topic:
+    def list(self, topic: str | None = None, limit: int = 10,
+             after: Optional[Tuple[str, str]] = None) -> List[News]:
+        key = lambda n: (n.published_at or "", n.id)
+        values = sorted(self._db.values(), key=key, reverse=True)
+        if topic and topic != "all":
             values = [n for n in values if n.topic == topic]
+        if after is not None:
+            values = [n for n in values if key(n) < tuple(after)]
         return values[:limit]
+    def list_raw(self, topic: str | None = None, limit: int = 10,
+                 after: Optional[Tuple[str, str]] = None) -> List[dict]:
+        return [{f: getattr(n, f) for f in LIST_FIELDS} for n in self.list(topic, limit, after)]
+    def list_by_ids(self, news_ids: List[str]) -> List[dict]:
+        return [{f: getattr(self._db[i], f) for f in LIST_FIELDS} for i in news_ids if i in self._db]
+    def scan_raw(self, fields: Iterable[str]) -> Iterable[dict]:
+        fields = list(fields)
+        items = sorted(self._db.values(), key=lambda n: (n.published_at or "", n.id))
+        return [{f: getattr(n, f) for f in fields} for n in items]
+    def find_by_urls(self, urls: List[str]) -> Dict[str, dict]:
+        wanted = set(urls)
+        return {n.url: {"id": n.id, "content_hash": n.content_hash, "cluster_id": n.cluster_id}
+                for n in self._db.values() if n.url in wanted}
+    def find_near_duplicates(self, lsh_keys: List[str], limit: int = 500) -> List[dict]:
+        wanted = set(lsh_keys)
+        return [n.dict() for n in self._db.values() if wanted.intersection(n.lsh_keys)][:limit]
+    def scan_older_than(self, cutoff: str) -> Iterable[dict]:
+        return [n.dict() for n in list(self._db.values()) if "" < (n.published_at or "") < cutoff]
+    def delete_by_ids(self, news_ids: List[str]) -> int:
+        return sum(self._db.pop(i, None) is not None for i in news_ids)
+    def remove_duplicates(self) -> List[str]:
+        # save_many כבר שומר url אחד לכל כתבה
+        return []
+    def storage_stats(self) -> Dict[str, int]:
+        return {"count": len(self._db)}
 
 
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient, UpdateOne
+from pymongo.errors import OperationFailure
 import os
+
+# האינדקסים של אוסף החדשות, מוצהרים במקום אחד ונוצרים ב-ensure_indexes בעליית השרת.
+# id משמש כשובר שוויון ב-published_at, כך שהמיון יציב ומגיע כולו מהאינדקס.
+NEWS_INDEXES = [
+    IndexModel([("url", ASCENDING)], name="url_unique", unique=True),
+    # covering ל-find_by_urls (בכל באץ' של ingestion): התשובה כולה מהאינדקס, בלי לקרוא מסמכים
+    IndexModel([("url", ASCENDING), ("id", ASCENDING), ("content_hash", ASCENDING), ("cluster_id", ASCENDING)],
+               name="url_lookup_covering"),
+    IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    IndexModel([("topic", ASCENDING), ("published_at", DESCENDING), ("id", DESCENDING)],
+               name="topic_published_at"),
+    IndexModel([("published_at", DESCENDING), ("id", DESCENDING)], name="published_at"),
+    # multikey על מפתחות ה-LSH – חיפוש כמעט-כפילויות בלי לסרוק את כל האוסף
+    IndexModel([("lsh_keys", ASCENDING)], name="lsh_keys_1"),
+]
+LIST_SORT = [("published_at", DESCENDING), ("id", DESCENDING)]
+LIST_PROJECTION = {"_id": 0, **{f: 1 for f in LIST_FIELDS}}
+
+
+def list_query(topic: str | None = None, after: Optional[Tuple[str, str]] = None) -> dict:
+    """פילטר השאילתה של list / list_raw (משותף למימוש הסינכרוני ולאסינכרוני)."""
+    query = {}
+    if topic and topic != "all":
+        query["topic"] = topic
+    if after is not None:
+        # keyset: ממשיכים מיד אחרי (published_at, id) של העמוד הקודם – טווח על
+        # האינדקס במקום skip, כך שעמוד עמוק עולה כמו העמוד הראשון
+        published_at, news_id = after
+        query["$or"] = [
+            {"published_at": {"$lt": published_at}},
+            {"published_at": published_at, "id": {"$lt": news_id}},
+        ]
+    return query
 class MongoNewsRepository(NewsRepository):
-    def __init__(self):
+    def __init__(self, chunk_size: int = MONGO_BULK_CHUNK_SIZE):
         mongo_url = os.getenv("MONGO_URL", "mongodb://mongo:27017")
         print("🔗 CONNECTING TO MONGO:", mongo_url)
         client = MongoClient(mongo_url)
@@ -37,6 +161,7 @@ class MongoNewsRepository(NewsRepository):
 
         # שם הקולקציה
         self.collection = self.db["news"]
+        self.chunk_size = chunk_size
 
     def save(self, item: News) -> None:
         data = item.dict()
@@ -47,23 +172,118 @@ class MongoNewsRepository(NewsRepository):
         # עדכון אם קיים, הוספה אם לא
         self.collection.update_one(unique_key, {"$set": data}, upsert=True)
 
+    def save_many(self, items: Iterable[News]) -> Dict[str, int]:
+        # bulk_write לא מסודר בחתיכות של chunk_size – round trip אחד לחתיכה במקום לכל כתבה
+        result = {"matched": 0, "modified": 0, "upserted": 0}
+        ops = [UpdateOne({"url": n.url}, {"$set": n.dict()}, upsert=True) for n in items]
+        for start in range(0, len(ops), self.chunk_size):
+            res = self.collection.bulk_write(ops[start:start + self.chunk_size], ordered=False)
+            result["matched"] += res.matched_count
+            result["modified"] += res.modified_count
+            result["upserted"] += res.upserted_count
+        return result
+
+    def ensure_indexes(self) -> List[str]:
+        names = []
+        for model in NEWS_INDEXES:
+            # אינדקס שנכשל (למשל unique על אוסף עם כפילויות ישנות) לא מפיל את השרת
+            try:
+                names += self.collection.create_indexes([model])
+            except OperationFailure as e:
+                print(f"⚠️ index {model.document['name']} not created:", e)
+        print("🗂️ news indexes:", names)
+        return names
+
     def get(self, news_id: str) -> Optional[News]:
-        doc = self.collection.find_one({"_id": news_id})
+        # ה-id של הכתבה שמור בשדה id (ה-_id הוא ObjectId של מונגו) – חיפוש דרך id_unique
+        doc = self.collection.find_one({"id": news_id}, {"_id": 0})
         return News(**doc) if doc else None
 
-    def list(self, topic: str | None = None, limit: int = 10) -> List[News]:
-        query = {}
-        if topic and topic != "all":
-            query["topic"] = topic
+    def _list_cursor(self, topic: str | None = None, limit: int = 10,
+                     after: Optional[Tuple[str, str]] = None, projection: Optional[dict] = None):
+        return self.collection.find(list_query(topic, after), projection or {"_id": 0}) \
+            .sort(LIST_SORT).limit(limit)
+
+    def list(self, topic: str | None = None, limit: int = 10,
+             after: Optional[Tuple[str, str]] = None) -> List[News]:
+        return [News(**d) for d in self._list_cursor(topic, limit, after)]
+
+    def list_raw(self, topic: str | None = None, limit: int = 10,
+                 after: Optional[Tuple[str, str]] = None) -> List[dict]:
+        # בלי lsh_keys / content_hash וכו' – פחות bytes מהשרת ופחות עבודת BSON
+        return list(self._list_cursor(topic, limit, after, LIST_PROJECTION))
 
-        docs = (
-            self.collection
-            .find(query)
-            .sort("published_at", -1)
-            .limit(limit)
+    def list_by_ids(self, news_ids: List[str]) -> List[dict]:
+        if not news_ids:
+            return []
+        by_id = {d["id"]: d for d in self.collection.find({"id": {"$in": list(news_ids)}}, LIST_PROJECTION)}
+        return [by_id[i] for i in news_ids if i in by_id]
+
+    def scan_raw(self, fields: Iterable[str]) -> Iterable[dict]:
+        # המיון ההפוך ל-LIST_SORT – סריקה לאחור על האינדקס published_at, בלי SORT בזיכרון
+        return self.collection.find({}, {"_id": 0, **{f: 1 for f in fields}}, batch_size=1000).sort(
+            [("published_at", ASCENDING), ("id", ASCENDING)])
+
+    def find_by_urls(self, urls: List[str]) -> Dict[str, dict]:
+        # שאילתת $in אחת לכל הריצה במקום בדיקה לכל כתבה
+        if not urls:
+            return {}
+        docs = self.collection.find(
+            {"url": {"$in": list(urls)}},
+            {"_id": 0, "url": 1, "id": 1, "content_hash": 1, "cluster_id": 1},
         )
+        return {d["url"]: {"id": d.get("id"), "content_hash": d.get("content_hash"),
+                           "cluster_id": d.get("cluster_id")} for d in docs}
+
+    def find_near_duplicates(self, lsh_keys: List[str], limit: int = 500) -> List[dict]:
+        if not lsh_keys:
+            return []
+        # limit: מפתח "חם" (הרבה כתבות דומות מאוד) לא מושך את כל האוסף לזיכרון
+        return list(self.collection.find(
+            {"lsh_keys": {"$in": list(lsh_keys)}},
+            {"_id": 0, "id": 1, "cluster_id": 1, "title": 1, "summary": 1,
+             "topic": 1, "score": 1, "entities": 1},
+        ).limit(limit))
+
+    def scan_older_than(self, cutoff: str) -> Iterable[dict]:
+        # טווח על האינדקס published_at; "" (בלי תאריך) לא נחשב ישן
+        return self.collection.find({"published_at": {"$gt": "", "$lt": cutoff}}, {"_id": 0},
+                                    batch_size=1000)
+
+    def delete_by_ids(self, news_ids: List[str]) -> int:
+        deleted = 0
+        news_ids = list(news_ids)
+        for start in range(0, len(news_ids), self.chunk_size):
+            res = self.collection.delete_many({"id": {"$in": news_ids[start:start + self.chunk_size]}})
+            deleted += res.deleted_count
+        return deleted
+
+    def remove_duplicates(self) -> List[str]:
+        # רלוונטי לאוספים מלפני url_unique (האינדקס לא נבנה בגלל כפילויות ישנות).
+        # _id יורד = העותק האחרון שנכתב ראשון; כל השאר נמחקים
+        groups = self.collection.aggregate([
+            {"$sort": {"_id": -1}},
+            {"$group": {"_id": "$url", "docs": {"$push": {"_id": "$_id", "id": "$id"}}, "n": {"$sum": 1}}},
+            {"$match": {"n": {"$gt": 1}}},
+        ], allowDiskUse=True)
+        removed, extra = [], []
+        for g in groups:
+            kept = g["docs"][0].get("id")
+            extra += [d["_id"] for d in g["docs"][1:]]
+            # id שנשאר גם בעותק השמור לא "נמחק" מבחינת האינדקסים
+            removed += [d["id"] for d in g["docs"][1:] if d.get("id") and d["id"] != kept]
+        for start in range(0, len(extra), self.chunk_size):
+            self.collection.delete_many({"_id": {"$in": extra[start:start + self.chunk_size]}})
+        return removed
 
-        return [News(**d) for d in docs]
+    def storage_stats(self) -> Dict[str, int]:
+        try:
+            stats = next(self.collection.aggregate([{"$collStats": {"storageStats": {}}}]))["storageStats"]
+        except (OperationFailure, StopIteration) as e:
+            print("⚠️ collection stats unavailable:", e)
+            return {"count": self.collection.estimated_document_count()}
+        return {"count": stats.get("count", 0), "data_bytes": stats.get("size", 0),
+                "storage_bytes": stats.get("storageSize", 0), "index_bytes": stats.get("totalIndexSize", 0)}
 
 
 # class MongoNewsRepository(NewsRepository):
@@ -0,0 +1,188 @@
+# backend/scripts/bench_async_reads.py
+# השוואת עומס בין GET /news האסינכרוני (event loop + client אסינכרוני) לבין
+# מסלול סינכרוני (def + PyMongo חוסם ב-threadpool של Starlette, 40 threads).
+# השרת רץ בתהליך נפרד, וכל לקוח מקבילי הוא חיבור keep-alive משלו; ה-cache של הקריאות כבוי כדי שכל בקשה תגיע ל-repository.
+# --latency-ms מוסיף השהיה לכל שאילתה (כמו round trip ל-Atlas), שם ה-threadpool נגמר.
+#   python -m backend.scripts.bench_async_reads [--backend memory|mongo] [--latency-ms 50]
+#                                               [--concurrency 100,1000,3000] [--requests 6000]
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+PATHS = {"sync": "/sync/news", "async": "/news"}
+
+
+class _SlowRepo:
+    """מוסיף השהיה חוסמת לפני כל קריאה ל-repository הסינכרוני."""
+
+    def __init__(self, repo, latency_s: float):
+        self.repo, self.latency_s = repo, latency_s
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    def list_raw(self, *args, **kwargs):
+        time.sleep(self.latency_s)
+        return self.repo.list_raw(*args, **kwargs)
+
+
+class _AsyncSlowRepo:
+    """מוסיף השהיה לא-חוסמת לפני כל קריאה ל-repository האסינכרוני."""
+
+    def __init__(self, repo, latency_s: float):
+        self.repo, self.latency_s = repo, latency_s
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    async def list_raw(self, *args, **kwargs):
+        await asyncio.sleep(self.latency_s)
+        return await self.repo.list_raw(*args, **kwargs)
+
+
+def build_app(backend: str, latency_ms: float):
+    from fastapi import FastAPI
+    from backend.controllers.news_controller import router
+    from backend.models.schemas import News
+    from backend.repositories.news_repo import InMemoryNewsRepository
+    from backend.services import news_service
+    from backend.views.news_view import render_raw_list
+    from backend.views.responses import OrjsonResponse
+
+    if backend == "memory":
+        repo = InMemoryNewsRepository()
+        repo.save_many(News(id=f"{i:06d}", title=f"title {i}", summary="summary " * 20,
+                            url=f"https://example.com/{i}", published_at=f"2026-10-{i % 28 + 1:02d}",
+                            topic="Finance", entities=["Reuters"], score=0.9) for i in range(2000))
+        news_service._repo = repo
+
+    app = FastAPI()
+    app.include_router(router)
+
+    @app.get("/sync/news")
+    def sync_list_news(topic: str | None = None, limit: int = 10, cursor: str | None = None):
+        docs, next_cursor = news_service.list_news_page(topic=topic, limit=limit, cursor=cursor)
+        return OrjsonResponse(render_raw_list(docs),
+                              headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
+
+    @app.on_event("startup")
+    async def _slow_repos():
+        latency_s = latency_ms / 1000
+        async_repo = news_service._get_async_repo()
+        if latency_s:
+            news_service._repo = _SlowRepo(news_service._repo, latency_s)
+            news_service._async_repo = _AsyncSlowRepo(async_repo, latency_s)
+
+    return app
+
+
+def serve(args) -> None:
+    import uvicorn
+    uvicorn.run(build_app(args.backend, args.latency_ms), host="127.0.0.1", port=args.port,
+                log_level="warning", backlog=8192, limit_concurrency=None)
+
+
+async def _client(host: str, port: int, path: str, count: int, latencies: list) -> int:
+    """
+    לקוח keep-alive מינימלי על asyncio: חיבור אחד, count בקשות ברצף.
+    (httpx עם אלפי חיבורים צורך בעצמו יותר CPU מהשרת הנמדד.)
+    """
+    errors = done = 0
+    request = f"GET {path}?limit=20 HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+            done += 1
+            if head.startswith(b"HTTP/1.1 200"):
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+    except (OSError, asyncio.IncompleteReadError):
+        errors += count - done
+    finally:
+        writer.close()
+    return errors
+
+
+async def _load(host: str, port: int, path: str, concurrency: int, total: int) -> dict:
+    per_client = max(1, total // concurrency)
+    latencies: list = []
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(host, port, path, per_client, latencies) for _ in range(concurrency)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - started
+    errors = sum(r if isinstance(r, int) else per_client for r in results)
+
+    latencies.sort()
+    pct = lambda p: 1000 * latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+    return {"rps": len(latencies) / elapsed, "p50": pct(0.5), "p99": pct(0.99), "errors": errors}
+
+
+def _wait_ready(base_url: str, server: subprocess.Popen, timeout: float = 120) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"bench server exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("bench server did not start")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="sync vs async GET /news under concurrent load")
+    ap.add_argument("--backend", choices=["memory", "mongo"], default="memory")
+    ap.add_argument("--latency-ms", type=float, default=50, help="השהיה מדומה לכל שאילתה")
+    ap.add_argument("--concurrency", default="100,1000,3000")
+    ap.add_argument("--requests", type=int, default=6000)
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    env = {**os.environ, "READ_CACHE_MAX_ENTRIES": "0", "READ_CACHE_GENERATION_FILE": "",
+           "NLP_CACHE_STORE": "none", "NLP_LOAD_MODE": "lazy"}
+    if args.backend == "memory":
+        # ה-client של מונגו לא נפתח בכלל, אבל mongodb+srv פותר DNS כבר ביצירה
+        env["MONGO_URL"] = "mongodb://localhost:27017"
+    server = subprocess.Popen([sys.executable, "-m", "backend.scripts.bench_async_reads", "--serve",
+                               "--backend", args.backend, "--latency-ms", str(args.latency_ms),
+                               "--port", str(args.port)], env=env)
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        _wait_ready(base_url, server)
+        print(f"backend={args.backend} latency={args.latency_ms}ms requests={args.requests}")
+        print(f"{'mode':>6} {'conc':>6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            for mode, path in PATHS.items():
+                r = asyncio.run(_load("127.0.0.1", args.port, path, concurrency, args.requests))
+                print(f"{mode:>6} {concurrency:>6} {r['rps']:>9.1f} {r['p50']:>9.1f} "
+                      f"{r['p99']:>9.1f} {r['errors']:>7}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# backend/scripts/bench_list_serialization.py
+# משווה את מסלול GET /news הישן (News לכל מסמך → render_list → encoder ברירת
+# המחדל של FastAPI) מול המסלול הרזה (projection → render_raw_list → orjson),
+# ב-10 / 100 / 1000 כתבות. עם --mongo נמדדת גם הקריאה מהמונגו עצמה.
+#   python -m backend.scripts.bench_list_serialization [--repeat 200] [--mongo]
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend.models.schemas import News
+from backend.repositories.news_repo import LIST_FIELDS
+from backend.views.news_view import render_list, render_raw_list
+from backend.views.responses import OrjsonResponse
+
+SIZES = (10, 100, 1000)
+
+
+def make_docs(n: int) -> list:
+    """מסמכים בצורה שבה הם שמורים במונגו, כולל השדות הפנימיים."""
+    return [{
+        "id": f"{i:08d}-0000-0000-0000-000000000000",
+        "title": f"Markets rally as parliament passes budget number {i}",
+        "summary": "Lawmakers approved the spending plan after a long debate. " * 4,
+        "url": f"https://example.com/news/{i}",
+        "published_at": f"2026-10-{i % 28 + 1:02d}",
+        "topic": "Finance",
+        "entities": ["Parliament", "Treasury", "Reuters"],
+        "imageUrl": f"https://example.com/img/{i}.jpg",
+        "score": 0.8731,
+        "content_hash": "ab" * 32,
+        "cluster_id": f"{i:08d}-0000-0000-0000-000000000000",
+        "lsh_keys": [f"{b}:{i * 31 + b:016x}" for b in range(20)],
+    } for i in range(n)]
+
+
+def old_path(docs: list) -> bytes:
+    items = [News(**d) for d in docs]
+    return JSONResponse(jsonable_encoder(render_list(items))).body
+
+
+def raw_path(docs: list) -> bytes:
+    return OrjsonResponse(render_raw_list(docs)).body
+
+
+def _timed(fn, arg, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return 1000 * (time.perf_counter() - started) / repeat
+
+
+def bench_serialization(repeat: int) -> None:
+    print(f"{'items':>6} {'old ms':>9} {'raw ms':>9} {'speedup':>8}")
+    for n in SIZES:
+        docs = make_docs(n)
+        projected = [{f: d[f] for f in LIST_FIELDS} for d in docs]
+        # שני המסלולים חייבים להחזיר את אותה תשובה
+        assert json.loads(old_path(docs)) == json.loads(raw_path(projected))
+        reps = max(1, repeat * 10 // n)
+        old_ms, raw_ms = _timed(old_path, docs, reps), _timed(raw_path, projected, reps)
+        print(f"{n:>6} {old_ms:>9.3f} {raw_ms:>9.3f} {old_ms / raw_ms:>7.1f}x")
+
+
+def bench_mongo(repeat: int) -> None:
+    from backend.repositories.news_repo import MongoNewsRepository
+    repo = MongoNewsRepository()
+    print(f"\nMongo end-to-end ({repo.collection.estimated_document_count()} docs in collection)")
+    print(f"{'items':>6} {'old ms':>9} {'raw ms':>9} {'speedup':>8}")
+    for n in SIZES:
+        old = lambda _: JSONResponse(jsonable_encoder(render_list(repo.list(limit=n)))).body
+        raw = lambda _: OrjsonResponse(render_raw_list(repo.list_raw(limit=n))).body
+        reps = max(1, repeat // 10)
+        old_ms, raw_ms = _timed(old, None, reps), _timed(raw, None, reps)
+        print(f"{n:>6} {old_ms:>9.3f} {raw_ms:>9.3f} {old_ms / raw_ms:>7.1f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="GET /news serialization: pydantic path vs raw orjson path")
+    ap.add_argument("--repeat", type=int, default=200, help="חזרות לגודל 10 (יחסית פחות לגדלים גדולים)")
+    ap.add_argument("--mongo", action="store_true", help="למדוד גם קריאה מהמונגו (MONGO_URL)")
+    args = ap.parse_args()
+
+    bench_serialization(args.repeat)
+    if args.mongo:
+        bench_mongo(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
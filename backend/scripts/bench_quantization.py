@@ -0,0 +1,97 @@
+# backend/scripts/bench_quantization.py
+# משווה fp32 מול int8 (NLP_QUANTIZE) על קורפוס דוגמה קבוע:
+# latency לכתבה, RSS אחרי טעינת המודלים (אחרי gc) ו-peak RSS, והסכמה בפלטים
+# (label עליון וקבוצת ישויות). כל מצב רץ בתהליך נפרד כדי שמדידת ה-RSS תהיה נקייה.
+# ה-peak כולל את משקולות ה-fp32 שנטענות לפני הקוונטיזציה, ולכן ההשוואה היא על RSS אחרי הטעינה.
+#   python -m backend.scripts.bench_quantization [--repeat 3]
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from backend.scripts.compare_classifiers import DEFAULT_CORPUS, load_texts
+
+MODES = {"fp32": "", "int8": "int8"}
+
+
+def current_rss_mb() -> float:
+    """ה-RSS הנוכחי של התהליך (VmRSS מ-/proc, לינוקס) – לא ה-peak כמו ru_maxrss."""
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    raise RuntimeError("VmRSS not found in /proc/self/status")
+
+
+def run_worker(path: Path, repeat: int) -> dict:
+    """רץ בתהליך הבן: טוען מודלים (לפי NLP_QUANTIZE מהסביבה), מריץ, ומדפיס JSON."""
+    from backend.ai import nlp
+
+    texts = load_texts(path, repeat)
+    started = time.perf_counter()
+    nlp.classify_topic(texts[0])
+    nlp.extract_entities(texts[0])
+    load_s = time.perf_counter() - started
+    gc.collect()
+    loaded_rss_mb = current_rss_mb()
+
+    started = time.perf_counter()
+    topics = nlp.classify_topics(texts)
+    entities = nlp.extract_entities_batch(texts)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "load_s": round(load_s, 2),
+        "ms_per_article": round(1000 * elapsed / len(texts), 2),
+        "rss_mb": loaded_rss_mb,
+        # ru_maxrss בלינוקס הוא ב-KB
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "labels": [t[0] for t in topics],
+        "entities": [sorted(set(e)) for e in entities],
+    }
+
+
+def _spawn(mode: str, args) -> dict:
+    env = {**os.environ, "NLP_QUANTIZE": MODES[mode], "INFERENCE_PROCESSES": "0"}
+    out = subprocess.run(
+        [sys.executable, "-m", "backend.scripts.bench_quantization", "--worker",
+         "--input", str(args.input), "--repeat", str(args.repeat)],
+        env=env, check=True, capture_output=True, text=True,
+    )
+    # המודלים מדפיסים לוגים; ה-JSON הוא השורה האחרונה
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="fp32 vs int8 NLP benchmark")
+    ap.add_argument("--input", type=Path, default=DEFAULT_CORPUS)
+    ap.add_argument("--repeat", type=int, default=1)
+    ap.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.input, args.repeat)))
+        return
+
+    results = {mode: _spawn(mode, args) for mode in MODES}
+    for mode, r in results.items():
+        print(f"{mode:>5}: {r['ms_per_article']:8.2f} ms/article   RSS {r['rss_mb']:8.1f} MB"
+              f"   peak RSS {r['peak_rss_mb']:8.1f} MB   load {r['load_s']}s")
+
+    base, quant = results["fp32"], results["int8"]
+    n = len(base["labels"])
+    same_label = sum(a == b for a, b in zip(base["labels"], quant["labels"]))
+    same_ents = sum(a == b for a, b in zip(base["entities"], quant["entities"]))
+    print(f"🤝 top label agreement: {same_label}/{n} = {same_label / n:.1%}")
+    print(f"🤝 entity set agreement: {same_ents}/{n} = {same_ents / n:.1%}")
+    print(f"⚡ speedup x{base['ms_per_article'] / quant['ms_per_article']:.2f}, "
+          f"RSS −{base['rss_mb'] - quant['rss_mb']:.1f} MB (peak −{base['peak_rss_mb'] - quant['peak_rss_mb']:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# backend/scripts/check_indexes.py
+# יוצר את האינדקסים המוצהרים ובודק עם explain() את השאילתות ש-MongoNewsRepository
+# שולח בפועל: מפעילים את מתודות ה-repository, אוספים את פקודות ה-find שיצאו
+# (command monitoring) ומריצים explain בדיוק עליהן. נכשל אם יש COLLSCAN או SORT
+# בזיכרון, אם נקראו מסמכים שלא הוחזרו, או אם שאילתה שאמורה להיות covered
+# קראה מסמכים בכלל.
+#   python -m backend.scripts.check_indexes
+import sys
+from typing import Callable, List
+
+from pymongo import monitoring
+
+BAD_STAGES = {"COLLSCAN", "SORT"}
+# השדות של פקודת find שרלוונטיים ל-explain (בלי lsid / $db / $clusterTime וכו')
+FIND_FIELDS = ("find", "filter", "projection", "sort", "limit", "skip", "hint", "singleBatch")
+
+
+class FindRecorder(monitoring.CommandListener):
+    """אוסף את פקודות ה-find שה-client שולח בזמן record()."""
+
+    def __init__(self):
+        self.recording = False
+        self.commands: List[dict] = []
+
+    def started(self, event) -> None:
+        if self.recording and event.command_name == "find":
+            self.commands.append({k: event.command[k] for k in FIND_FIELDS if k in event.command})
+
+    def succeeded(self, event) -> None:
+        pass
+
+    def failed(self, event) -> None:
+        pass
+
+    def record(self, call: Callable[[], object]) -> List[dict]:
+        self.commands = []
+        self.recording = True
+        try:
+            call()
+        finally:
+            self.recording = False
+        return self.commands
+
+
+def _stages(plan: dict) -> list:
+    """כל שמות השלבים בעץ ה-winningPlan (כולל הפורמט של SBE עם queryPlan)."""
+    plan = plan.get("queryPlan", plan)
+    out = [plan.get("stage")]
+    for key in ("inputStage", "outerStage", "innerStage"):
+        if key in plan:
+            out += _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        out += _stages(child)
+    return [s for s in out if s]
+
+
+def _index_names(plan: dict) -> list:
+    plan = plan.get("queryPlan", plan)
+    out = [plan["indexName"]] if "indexName" in plan else []
+    for key in ("inputStage", "outerStage", "innerStage"):
+        if key in plan:
+            out += _index_names(plan[key])
+    for child in plan.get("inputStages", []):
+        out += _index_names(child)
+    return out
+
+
+def problems(explain: dict, covered: bool) -> List[str]:
+    """מה לא תקין בתוצאת explain (executionStats) של שאילתה אחת; ריק = תקין."""
+    stages = _stages(explain["queryPlanner"]["winningPlan"])
+    stats = explain["executionStats"]
+    out = [f"stage {s}" for s in sorted(BAD_STAGES.intersection(stages))]
+    if covered:
+        if "PROJECTION_COVERED" not in stages:
+            out.append("not PROJECTION_COVERED")
+        if stats["totalDocsExamined"]:
+            out.append(f"{stats['totalDocsExamined']} docs examined")
+    elif stats["totalDocsExamined"] > stats["nReturned"]:
+        # הסינון והמיון לא נפתרו כולם באינדקס – נקראו מסמכים שנזרקו
+        out.append(f"{stats['totalDocsExamined']} docs examined for {stats['nReturned']} returned")
+    return out
+
+
+def main() -> int:
+    recorder = FindRecorder()
+    # נרשם לפני יצירת ה-MongoClient של ה-repository, כדי שיחול עליו
+    monitoring.register(recorder)
+    from backend.repositories.news_repo import MongoNewsRepository
+
+    repo = MongoNewsRepository()
+    repo.ensure_indexes()
+    col = repo.collection
+    newest = col.find_one({}, {"_id": 0, "id": 1, "url": 1, "topic": 1, "published_at": 1, "lsh_keys": 1},
+                          sort=[("published_at", -1), ("id", -1)]) or {}
+    news_id, topic = newest.get("id", ""), newest.get("topic", "Politics")
+    after = (newest.get("published_at") or "9999-12-31", news_id)
+
+    # (שם, קריאה ל-repository כמו בקוד הייצור, האם חייבת להיות covered)
+    checks = [
+        ("get", lambda: repo.get(news_id), False),
+        ("list_raw (all)", lambda: repo.list_raw(None, 10), False),
+        ("list_raw (topic)", lambda: repo.list_raw(topic, 10), False),
+        ("list_raw (cursor)", lambda: repo.list_raw(None, 10, after), False),
+        ("list_raw (topic, cursor)", lambda: repo.list_raw(topic, 10, after), False),
+        ("list_by_ids", lambda: repo.list_by_ids([news_id]), False),
+        ("find_by_urls", lambda: repo.find_by_urls([newest.get("url", "")]), True),
+        ("find_near_duplicates", lambda: repo.find_near_duplicates((newest.get("lsh_keys") or [""])[:5]), False),
+        ("scan_older_than", lambda: next(iter(repo.scan_older_than(after[0])), None), False),
+        ("scan_raw (rebuild)", lambda: next(iter(repo.scan_raw(("id", "published_at"))), None), False),
+    ]
+
+    failed = 0
+    for name, call, covered in checks:
+        commands = recorder.record(call)
+        if not commands:
+            print(f"❌ {name:26} no find command was sent")
+            failed += 1
+            continue
+        for command in commands:
+            explain = repo.db.command({"explain": command, "verbosity": "executionStats"})
+            plan = explain["queryPlanner"]["winningPlan"]
+            bad = problems(explain, covered)
+            failed += bool(bad)
+            stats = explain["executionStats"]
+            mark = "❌" if bad else "✅"
+            print(f"{mark} {name:26} index={','.join(_index_names(plan)) or '-':24} "
+                  f"keys={stats['totalKeysExamined']} docs={stats['totalDocsExamined']} "
+                  f"returned={stats['nReturned']} stages={' <- '.join(_stages(plan))}"
+                  + (f"  [{'; '.join(bad)}]" if bad else ""))
+
+    print(f"\n{len(checks) - failed}/{len(checks)} repository queries are fully served by an index")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
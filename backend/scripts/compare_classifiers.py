@@ -0,0 +1,57 @@
+# backend/scripts/compare_classifiers.py
+# משווה בין מסווג ה-zero-shot (NLI) למסווג ה-embedding-prototypes:
+# אחוז הסכמה על ה-label, ותפוקה (כתבות לשנייה) לכל אחד.
+#   python -m backend.scripts.compare_classifiers [--input corpus.json] [--repeat 3]
+import argparse
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from backend.ai.nlp import load_encoder, load_zero_shot, zero_shot_classify
+from backend.config import NLP_BATCH_SIZE
+
+DEFAULT_CORPUS = Path(__file__).parent / "sample_corpus.json"
+
+
+def load_texts(path: Path, repeat: int = 1) -> list:
+    items = json.loads(path.read_text(encoding="utf-8"))
+    texts = [f"{it.get('title', '')} {it.get('summary', '')}" for it in items]
+    return texts * repeat
+
+
+def _timed(fn, texts):
+    started = time.perf_counter()
+    out = fn(texts)
+    elapsed = time.perf_counter() - started
+    return out, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description="NLI vs embedding topic classifier")
+    ap.add_argument("--input", type=Path, default=DEFAULT_CORPUS)
+    ap.add_argument("--repeat", type=int, default=1, help="שכפול הקורפוס למדידת תפוקה")
+    ap.add_argument("--batch-size", type=int, default=NLP_BATCH_SIZE)
+    args = ap.parse_args()
+
+    texts = load_texts(args.input, args.repeat)
+    print(f"📚 {len(texts)} texts from {args.input}")
+
+    zero_shot = load_zero_shot()
+    encoder = load_encoder()
+
+    nli, nli_s = _timed(lambda t: zero_shot_classify(zero_shot, t, args.batch_size), texts)
+    emb, emb_s = _timed(lambda t: encoder.classify(t, args.batch_size), texts)
+
+    agree = sum(a[0] == b[0] for a, b in zip(nli, emb))
+    print(f"🤝 agreement: {agree}/{len(texts)} = {agree / len(texts):.1%}")
+    print(f"⏱️ nli:       {nli_s:.2f}s  ({len(texts) / nli_s:.1f} texts/s)")
+    print(f"⏱️ embedding: {emb_s:.2f}s  ({len(texts) / emb_s:.1f} texts/s)  x{nli_s / emb_s:.1f}")
+
+    confusion = Counter((a[0], b[0]) for a, b in zip(nli, emb) if a[0] != b[0])
+    for (a, b), n in confusion.most_common():
+        print(f"   nli={a:<9} embedding={b:<9} ×{n}")
+
+
+if __name__ == "__main__":
+    main()
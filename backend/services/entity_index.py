@@ -0,0 +1,205 @@
+# backend/services/entity_index.py
+import bisect
+import calendar
+import gzip
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.ai.cache import normalize_text
+
+SNAPSHOT_VERSION = 1
+_WINDOW_RE = re.compile(r"^(\d+)([hd])$")
+
+
+def normalize_entity(name: str) -> str:
+    """מפתח לישות: NFKC, רווחים מאוחדים, casefold, בלי שאריות wordpiece (##)."""
+    return normalize_text((name or "").replace("##", "")).casefold()
+
+
+def parse_window(window: str) -> int:
+    """'24h' / '7d' → שניות."""
+    m = _WINDOW_RE.match(window or "")
+    if not m:
+        raise ValueError(f"invalid window {window!r} (expected e.g. 1h, 24h, 7d)")
+    return int(m.group(1)) * (3600 if m.group(2) == "h" else 86400)
+
+
+def _published_ts(published_at: Optional[str]) -> float:
+    """published_at (תאריך) → epoch של אמצע אותו יום ב-UTC; בלי תאריך – עכשיו."""
+    try:
+        return calendar.timegm(time.strptime((published_at or "")[:10], "%Y-%m-%d")) + 43200.0
+    except ValueError:
+        return time.time()
+
+
+class DecayedCounter:
+    """מונה עם דעיכה מעריכית: כל אירוע שווה 1 ודועך בחצי כל half_life שניות."""
+    __slots__ = ("value", "at")
+
+    def __init__(self, value: float = 0.0, at: float = 0.0):
+        self.value, self.at = value, at
+
+    def add(self, t: float, half_life: float) -> None:
+        if t >= self.at:
+            self.value = self.value * 0.5 ** ((t - self.at) / half_life) + 1.0
+            self.at = t
+        else:
+            # אירוע "מהעבר" (למשל בבנייה מחדש) – דועך עד לנקודת הזמן של המונה
+            self.value += 0.5 ** ((self.at - t) / half_life)
+
+    def at_time(self, t: float, half_life: float) -> float:
+        return self.value * 0.5 ** (max(0.0, t - self.at) / half_life)
+
+
+class EntityIndex:
+    """
+    אינדקס הפוך ישות → כתבות. לכל ישות (מנורמלת) posting list ממוינת לפי
+    (published_at, id), כך שעמוד "החדשות ביותר על X" הוא bisect + חיתוך.
+    לכל ישות יש גם מונים דועכים לכל חלון זמן (half-life = החלון) ל-trending,
+    שמתעדכנים בכל הוספה – בלי סריקה או aggregation על כל האוסף.
+    """
+
+    def __init__(self, windows: Iterable[str] = ("1h", "24h", "7d")):
+        self.windows = {w: parse_window(w) for w in windows}
+        self._postings: Dict[str, List[Tuple[str, str]]] = {}
+        self._display: Dict[str, str] = {}
+        self._counters: Dict[str, Dict[str, DecayedCounter]] = {}
+        # id → (published_at, {entity keys}) – להסרה ולעדכון של כתבה
+        self._docs: Dict[str, Tuple[str, frozenset]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    # ---- עדכון ----
+
+    def upsert_many(self, docs: Iterable[dict], now: Optional[float] = None) -> None:
+        """
+        docs עם id / published_at / entities. ישות שנוספה לכתבה נספרת ב-trending
+        בזמן now (ברירת מחדל: עכשיו); כתבה שנשמרת שוב לא נספרת פעמיים.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for doc in docs:
+                names = {normalize_entity(e): e for e in doc.get("entities") or [] if normalize_entity(e)}
+                published = doc.get("published_at") or ""
+                old = self._docs.get(doc["id"])
+                old_keys = old[1] if old else frozenset()
+                if old:
+                    # ישות שנשארת בכתבה שומרת את המונים שלה גם אם ה-posting התרוקן לרגע
+                    self._unlink(doc["id"], old, keep=frozenset(names))
+                for key, display in names.items():
+                    bisect.insort(self._postings.setdefault(key, []), (published, doc["id"]))
+                    self._display[key] = display
+                    if key not in old_keys:
+                        self._count(key, now)
+                self._docs[doc["id"]] = (published, frozenset(names))
+
+    def _count(self, key: str, t: float) -> None:
+        counters = self._counters.setdefault(key, {})
+        for window, seconds in self.windows.items():
+            counters.setdefault(window, DecayedCounter()).add(t, seconds)
+
+    def remove(self, news_ids: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for news_id in news_ids:
+                old = self._docs.pop(news_id, None)
+                if old is not None:
+                    self._unlink(news_id, old)
+                    removed += 1
+        return removed
+
+    def rebuild(self, docs: Iterable[dict]) -> None:
+        """בנייה מכל האוסף (בלי snapshot): ב-trending כל כתבה נספרת לפי published_at שלה."""
+        for doc in docs:
+            self.upsert_many([doc], now=_published_ts(doc.get("published_at")))
+
+    def _unlink(self, news_id: str, old: Tuple[str, frozenset], keep: frozenset = frozenset()) -> None:
+        published, keys = old
+        for key in keys:
+            plist = self._postings.get(key)
+            if plist is None:
+                continue
+            i = bisect.bisect_left(plist, (published, news_id))
+            if i < len(plist) and plist[i] == (published, news_id):
+                del plist[i]
+            if not plist and key not in keep:
+                # ישות בלי כתבות לא נשארת ב-trending
+                del self._postings[key]
+                self._display.pop(key, None)
+                self._counters.pop(key, None)
+
+    # ---- קריאה ----
+
+    def news(self, name: str, limit: int = 10,
+             after: Optional[Tuple[str, str]] = None) -> Tuple[List[str], bool]:
+        """ids של הכתבות על הישות, החדשות קודם, אחרי after (keyset); ו-True אם יש עוד."""
+        with self._lock:
+            plist = self._postings.get(normalize_entity(name), [])
+            end = bisect.bisect_left(plist, tuple(after)) if after is not None else len(plist)
+            start = max(0, end - limit)
+            ids = [news_id for _, news_id in reversed(plist[start:end])]
+            return ids, start > 0
+
+    def trending(self, window: str, limit: int = 20, now: Optional[float] = None) -> List[dict]:
+        if window not in self.windows:
+            raise ValueError(f"unknown window {window!r} (available: {', '.join(self.windows)})")
+        now = time.time() if now is None else now
+        half_life = self.windows[window]
+        with self._lock:
+            scored = ((c[window].at_time(now, half_life), key) for key, c in self._counters.items())
+            top = heapq.nlargest(limit, scored)
+            return [{"entity": self._display[key], "score": round(score, 3),
+                     "articles": len(self._postings.get(key, []))}
+                    for score, key in top if score >= 0.01]
+
+    # ---- snapshot ----
+
+    def save(self, path: Path) -> None:
+        with self._lock:
+            data = {
+                "version": SNAPSHOT_VERSION,
+                "windows": list(self.windows),
+                "docs": [[i, published, sorted(keys)] for i, (published, keys) in self._docs.items()],
+                "display": dict(self._display),
+                "counters": {k: {w: [c.value, c.at] for w, c in cs.items()} for k, cs in self._counters.items()},
+            }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def load(self, path: Path) -> bool:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != SNAPSHOT_VERSION or data.get("windows") != list(self.windows):
+            return False
+        # בונים בצד ומחליפים בבת אחת – קריאות ממשיכות על הישן בזמן הטעינה
+        postings: Dict[str, List[Tuple[str, str]]] = {}
+        docs: Dict[str, Tuple[str, frozenset]] = {}
+        for news_id, published, keys in data["docs"]:
+            for key in keys:
+                postings.setdefault(key, []).append((published, news_id))
+            docs[news_id] = (published, frozenset(keys))
+        for plist in postings.values():
+            plist.sort()
+        counters = {k: {w: DecayedCounter(v, at) for w, (v, at) in cs.items()}
+                    for k, cs in data["counters"].items()}
+        with self._lock:
+            self._postings, self._docs = postings, docs
+            self._display, self._counters = data["display"], counters
+        return True
+
+    def stats(self) -> dict:
+        return {"entities": len(self._postings), "docs": len(self._docs), "windows": list(self.windows)}
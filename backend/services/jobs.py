@@ -0,0 +1,137 @@
+# backend/services/jobs.py
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from backend.config import INGEST_JOB_HISTORY, INGEST_MAX_JOBS, INGEST_MAX_QUEUED_JOBS
+from backend.models.schemas import IngestReport
+from backend.services.pipeline import Pipeline
+from backend.services.scheduler import AlreadyRunning
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class IngestJob:
+    """ריצת ingestion ברקע: מצב, התקדמות חיה מהצינור, זמנים לכל שלב ושגיאות."""
+
+    def __init__(self, limit: int):
+        self.id = str(uuid.uuid4())
+        self.limit = limit
+        self.status = "queued"          # queued → running → succeeded / failed / skipped
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.pipeline: Optional[Pipeline] = None
+        self.report: Optional[IngestReport] = None
+        self.errors: list = []
+
+    def progress(self) -> dict:
+        if self.pipeline is None:
+            return {"fetched": 0, "enriched": 0, "saved": 0}
+        stages = self.pipeline.stages_by_name()
+        return {
+            "fetched": self.pipeline.fetched,
+            "enriched": stages["enrich"].items_out if "enrich" in stages else 0,
+            "saved": stages["persist"].items_out if "persist" in stages else 0,
+        }
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        out = {
+            "id": self.id,
+            "status": self.status,
+            "limit": self.limit,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "seconds": round(end - self.started_at, 3) if self.started_at else 0.0,
+            "progress": self.progress(),
+            "stages": self.pipeline.stats()["stages"] if self.pipeline is not None else {},
+            "errors": self.errors,
+        }
+        if self.report is not None:
+            out["result"] = {
+                "inserted": self.report.saved,
+                "new": self.report.new,
+                "changed": self.report.changed,
+                "unchanged": self.report.unchanged,
+                "near_duplicates": self.report.near_duplicates,
+                "writes": self.report.writes,
+                "padding_efficiency": self.report.padding_efficiency,
+                "sources": self.report.sources,
+            }
+        return out
+
+
+class JobManager:
+    """
+    מריץ jobs של ingestion ב-thread pool: לכל היותר max_running במקביל,
+    ועד max_queued שמחכים בתור (מעבר לזה – JobQueueFull). שומר היסטוריה חסומה.
+    """
+
+    def __init__(self, run: Callable[..., IngestReport], max_running: int = 1,
+                 max_queued: int = 10, history: int = 100):
+        self._run = run
+        self._executor = ThreadPoolExecutor(max_workers=max_running, thread_name_prefix="ingest-job")
+        self.max_queued = max_queued
+        self.history = history
+        self._jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, limit: int) -> IngestJob:
+        with self._lock:
+            queued = sum(1 for j in self._jobs.values() if j.status == "queued")
+            if queued >= self.max_queued:
+                raise JobQueueFull(f"{queued} ingestion jobs already waiting")
+            job = IngestJob(limit)
+            self._jobs[job.id] = job
+            # היסטוריה חסומה: מוחקים את הישנים ביותר שכבר הסתיימו
+            finished = [j.id for j in self._jobs.values() if j.status in ("succeeded", "failed", "skipped")]
+            for old_id in finished[:max(0, len(self._jobs) - self.history)]:
+                del self._jobs[old_id]
+        self._executor.submit(self._execute, job)
+        return job
+
+    def _execute(self, job: IngestJob) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.report = self._run(limit=job.limit, observer=lambda p: setattr(job, "pipeline", p))
+            job.errors.extend(f"source {name}: {t['error']}" for name, t in job.report.sources.items()
+                              if t.get("error"))
+            job.status = "succeeded"
+        except AlreadyRunning as e:
+            # ריצה מתוזמנת (או job ב-worker אחר) כבר רצה – לא מריצים שנייה במקביל
+            job.errors.append(str(e))
+            job.status = "skipped"
+        except Exception as e:
+            job.errors.append(str(e))
+            job.status = "failed"
+            print(f"❌ Ingestion job {job.id} failed:", e)
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list:
+        return [j.to_dict() for j in reversed(self._jobs.values())]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_ingestion(limit: int, observer=None) -> IngestReport:
+    from backend.services import news_service
+    from backend.services.scheduler import scheduler
+    # אותו SingleFlight של ה-scheduler: job ידני וריצה מתוזמנת לא חופפים
+    return scheduler.run_exclusive(news_service.pull_and_process, limit=limit, observer=observer)
+
+
+jobs = JobManager(_run_ingestion, max_running=INGEST_MAX_JOBS,
+                  max_queued=INGEST_MAX_QUEUED_JOBS, history=INGEST_JOB_HISTORY)
@@ -61,33 +61,46 @@ _TOPIC = os.getenv("TOPIC_NEWS_RAW", "news.raw")
 # -------------------------------------------------
 
 _producer = None
+# ה-pid שבו ה-producer נוצר: אחרי fork ה-thread של ה-sender לא קיים בתהליך הבן
+_producer_pid = None
 
-try:
-    if KafkaProducer is not None:
-        _producer = KafkaProducer(
-            bootstrap_servers=os.getenv("KAFKA_BROKER", "localhost:9092"),
-            value_serializer=lambda v: json.dumps(v).encode("utf-8")
-        )
-        print("✅ Kafka producer initialized")
-    else:
-        print("⚠️ kafka-python not installed – Kafka disabled")
-except Exception as e:
-    print("⚠️ Kafka not available – disabling Kafka:", e)
-    _producer = None
+
+def _get_producer():
+    """ה-producer של התהליך הנוכחי – נוצר בשליחה הראשונה (ומחדש אחרי fork)."""
+    global _producer, _producer_pid
+    if KafkaProducer is None:
+        return None
+    if _producer_pid != os.getpid():
+        _producer_pid = os.getpid()
+        try:
+            _producer = KafkaProducer(
+                bootstrap_servers=os.getenv("KAFKA_BROKER", "localhost:9092"),
+                value_serializer=lambda v: json.dumps(v).encode("utf-8")
+            )
+            print("✅ Kafka producer initialized")
+        except Exception as e:
+            print("⚠️ Kafka not available – disabling Kafka:", e)
+            _producer = None
+    return _producer
+
+
+if KafkaProducer is None:
+    print("⚠️ kafka-python not installed – Kafka disabled")
 
 
 # -------------------------------------------------
 #   שליחת הודעות — לא מפיל כלום אם Kafka כבוי
 # -------------------------------------------------
 def publish_batch(articles: list) -> None:
-    if not _producer:
+    producer = _get_producer()
+    if not producer:
         # Kafka כבוי — מדלגים
         return
 
     try:
         for a in articles:
-            _producer.send(_TOPIC, a)
-        _producer.flush(timeout=2)
+            producer.send(_TOPIC, a)
+        producer.flush(timeout=2)
         print(f"✅ נשלחו {len(articles)} כתבות ל־Kafka → {_TOPIC}")
     except Exception as e:
         print(f"❌ שגיאה בשליחה ל־Kafka: {e}")
@@ -1,17 +1,81 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
 import os
+import threading
+import time
 import uuid
-from typing import List, Optional
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 from urllib.parse import quote
 
-from backend.models.schemas import News
-from backend.repositories.news_repo import NewsRepository, InMemoryNewsRepository
-from backend.providers.news_provider import fetch_latest
-from backend.ai.nlp import classify_topic, extract_entities
+from backend.models.schemas import IngestReport, News, RetentionReport
+from backend.repositories.news_repo import LIST_FIELDS, NewsRepository, InMemoryNewsRepository
+from backend.repositories.hot_tier import HotTier
+from backend.providers.news_provider import commit_high_water_marks
+from backend.providers.registry import sources
+from backend.ai.nlp import (classify_topics, extract_entities_batch, model_signature,
+                            padding_efficiency, padding_snapshot)
+from backend.ai.cache import EnrichmentCache, MongoCacheStore, enrichment_key, normalize_text
+from backend.ai.neardup import MinHashLSH, NearDupIndex, shingles
+from backend.config import (ENTITY_SNAPSHOT_PATH, ENTITY_TRENDING_WINDOWS,
+                            HOT_TIER_CAPACITY, INGEST_CHUNK_SIZE, INGEST_REPORT_MAX_IDS, SEARCH_MAX_POSTINGS,
+                            SEARCH_RECENCY_HALF_LIFE_DAYS, SEARCH_RECENCY_WEIGHT, SEARCH_SNAPSHOT_PATH, INGEST_QUEUE_SIZE, NEARDUP_MAX_CANDIDATES, NEARDUP_MIN_SHINGLES, NEARDUP_THRESHOLD, NLP_CACHE_MAX_ENTRIES,
+                            NLP_CACHE_STORE, NLP_CACHE_STORE_MAX_ENTRIES, READ_CACHE_GENERATION_FILE,
+                            READ_CACHE_MAX_ENTRIES, RETENTION_ARCHIVE_DIR, RETENTION_DAYS)
 from backend.services.kafka_producer import publish_batch
+from backend.services.pipeline import Pipeline, Stage
+from backend.services.read_cache import IngestGeneration, ReadThroughCache
+from backend.services.entity_index import EntityIndex
+from backend.services.search_index import SearchIndex
+from backend.services.snapshot import SnapshottedIndex
 
 from backend.repositories.news_repo import MongoNewsRepository
+from backend.repositories.async_news_repo import (AsyncMongoNewsRepository, AsyncNewsRepository,
+                                                  AsyncRepositoryAdapter)
 
 _repo = MongoNewsRepository()
+# ה-repository האסינכרוני ל-endpoints של קריאה – נוצר בקריאה הראשונה, בתוך ה-event loop
+_async_repo: Optional[AsyncNewsRepository] = None
+
+# cache להעשרת NLP – כתבות שכבר סווגו לא עוברות שוב במודלים
+_enrich_cache = EnrichmentCache(
+    max_entries=NLP_CACHE_MAX_ENTRIES,
+    store=(MongoCacheStore(_repo.db["nlp_cache"], max_entries=NLP_CACHE_STORE_MAX_ENTRIES)
+           if NLP_CACHE_STORE == "mongo" else None),
+)
+
+# MinHash LSH לזיהוי אותו סיפור שמגיע מכמה URLs (ידיעות סוכנות וכו')
+_lsh = MinHashLSH(threshold=NEARDUP_THRESHOLD)
+
+# cache לקריאות /news – מתבטל כשמונה הדורות עולה (בכל באץ' שנשמר)
+_generation = IngestGeneration(Path(READ_CACHE_GENERATION_FILE) if READ_CACHE_GENERATION_FILE else None)
+_read_cache = ReadThroughCache(_generation, max_entries=READ_CACHE_MAX_ENTRIES)
+
+# hot tier: הכתבות החדשות ביותר בזיכרון, לפני מונגו ב-list / get.
+# מתעדכן ישירות בתהליך שמריץ ingestion, ונטען מחדש כשהדור זז בתהליך אחר
+_hot = HotTier(HOT_TIER_CAPACITY) if HOT_TIER_CAPACITY > 0 else None
+_hot_lock = threading.Lock()
+_ahot_lock: Optional[asyncio.Lock] = None
+
+# חיפוש טקסט חופשי: אינדקס BM25 שמתעדכן בכל שמירה ונשמר כ-snapshot בסוף כל ריצת ingestion
+_search = SearchIndex(recency_weight=SEARCH_RECENCY_WEIGHT, half_life_days=SEARCH_RECENCY_HALF_LIFE_DAYS,
+                      max_postings=SEARCH_MAX_POSTINGS)
+SEARCH_FIELDS = ("id", "title", "summary", "entities", "topic", "published_at")
+_search_snapshot = SnapshottedIndex(
+    "search", _search, SEARCH_SNAPSHOT_PATH,
+    rebuild=lambda: _search.upsert_many(_repo.scan_raw(SEARCH_FIELDS)))
+
+# ישויות: ישות → כתבות לפי חדשות, ומונים דועכים ל-trending; snapshot כמו לחיפוש
+_entities = EntityIndex(windows=ENTITY_TRENDING_WINDOWS)
+ENTITY_FIELDS = ("id", "entities", "published_at")
+_entity_snapshot = SnapshottedIndex(
+    "entity", _entities, ENTITY_SNAPSHOT_PATH,
+    rebuild=lambda: _entities.rebuild(_repo.scan_raw(ENTITY_FIELDS)))
+
+_snapshotted = (_search_snapshot, _entity_snapshot)
 
 
 # ⚙️ אופציונלי: להשתמש ב-Cloudinary fetch אם יש cloud_name
@@ -44,41 +108,481 @@ def _pick_image_url(item: dict) -> Optional[str]:
 
 
 
-def pull_and_process(limit: int = 10) -> List[str]:
-    
-    raw = fetch_latest(limit)
-    publish_batch(raw)
-    ids: List[str] = []
+def _enrich(texts: List[str]) -> List[dict]:
+    """
+    מחזיר {topic, score, entities} לכל טקסט.
+    קודם בודקים ב-cache, ורק מה שחסר עובר בבאצ' דרך המודלים.
+    """
+    model = model_signature()
+    keys = [enrichment_key(t, model) for t in texts]
+    cached = _enrich_cache.get_many(keys)
+
+    # טקסט לכל מפתח חסר (כפילויות בתוך הריצה עוברות במודל פעם אחת)
+    misses = {k: t for k, t in zip(keys, texts) if k not in cached}
+    miss_keys = list(misses)
+    if miss_keys:
+        miss_texts = list(misses.values())
+        topics = classify_topics(miss_texts)
+        entities = extract_entities_batch(miss_texts)
+        fresh = {
+            k: {"topic": topic, "score": score, "entities": ents}
+            for k, (topic, score), ents in zip(miss_keys, topics, entities)
+        }
+        _enrich_cache.put_many(fresh)
+        cached.update(fresh)
+
+    print(f"🧠 NLP cache: {len(texts) - len(miss_keys)} hits, {len(miss_keys)} inferred")
+    return [cached[k] for k in keys]
+
+
+def enrichment_cache_stats() -> dict:
+    return _enrich_cache.stats()
+
+
+def _content_hash(it: dict) -> str:
+    text = f"{normalize_text(it.get('title') or '')}\x00{normalize_text(it.get('summary') or '')}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _dedup(raw: List[dict]) -> tuple:
+    """
+    מסנן לפני ההעשרה: lookup אחד ($in) לכל ה-URLs של הבאצ', ומשאיר רק כתבות
+    חדשות או כאלה שהתוכן שלהן השתנה (לפי content hash).
+    כתבה חדשה שהיא כמעט-כפילות של כתבה קיימת (אותו סיפור ב-URL אחר) מקושרת
+    לאשכול שלה ומקבלת את ההעשרה שלה – בלי inference. אינדקס ה-LSH בזיכרון הוא
+    לבאצ' הזה בלבד; כתבות מבאצ'ים קודמים (גם באותה ריצה) נמצאות דרך lsh_keys במונגו.
+    מחזיר (items, counts). כל item הוא dict עם raw, content_hash, ref ו-lsh_keys,
+    כאשר ref = {id, cluster_id, nlp} ו-canonical הוא ה-ref של הכתבה המקורית (או None).
+    """
+    by_url: dict = {}
     for it in raw:
-        print("DEBUG RAW ITEM:", it)
-        text = f"{it.get('title','')} {it.get('summary','')}"
-        topic, score = classify_topic(text)
-        ents  = extract_entities(text)
-        
+        # אותו URL פעמיים באותו באצ' – נשאר הראשון
+        by_url.setdefault(it.get("url"), it)
+    stored = _repo.find_by_urls([u for u in by_url if u])
+    index = NearDupIndex(_lsh)
+
+    items, counts = [], {"new": 0, "changed": 0, "unchanged": 0, "near_duplicates": 0}
+    for url, it in by_url.items():
+        h = _content_hash(it)
+        known = stored.get(url)
+        if known is not None and known.get("content_hash") == h:
+            counts["unchanged"] += 1
+            continue
+        sh = shingles(f"{it.get('title') or ''} {it.get('summary') or ''}")
+        # טקסט ריק/קצר מדי: בלי מפתחות LSH – אחרת כל הכתבות הקצרות חולקות מפתחות
+        # וכל אחת חדשה שולפת את כל הקודמות לבדיקת Jaccard
+        keys = _lsh.band_keys(sh) if len(sh) >= NEARDUP_MIN_SHINGLES else []
+        item = {"raw": it, "content_hash": h, "shingles": sh, "lsh_keys": keys, "canonical": None}
+        if known is None:
+            item["ref"] = {"id": None, "cluster_id": None, "nlp": None}
+        else:
+            # כתבה שהשתנתה שומרת על המזהה והאשכול הקיימים שלה
+            counts["changed"] += 1
+            item["ref"] = {"id": known.get("id"), "cluster_id": known.get("cluster_id") or known.get("id"),
+                           "nlp": None}
+        items.append(item)
+
+    fresh = [item for item in items if item["ref"]["id"] is None]
+    candidates = _repo.find_near_duplicates(sorted({k for item in fresh for k in item["lsh_keys"]}),
+                                            limit=NEARDUP_MAX_CANDIDATES)
+    for doc in candidates:
+        ref = {"id": doc.get("id"), "cluster_id": doc.get("cluster_id") or doc.get("id"),
+               "nlp": {"topic": doc.get("topic"), "score": doc.get("score") or 0.0,
+                       "entities": doc.get("entities") or []}}
+        sh = shingles(f"{doc.get('title') or ''} {doc.get('summary') or ''}")
+        index.add(sh, _lsh.band_keys(sh), ref)
+
+    for item in fresh:
+        match = index.query(item["shingles"], item["lsh_keys"])
+        ref = item["ref"]
+        ref["id"] = str(uuid.uuid4())
+        if match is not None:
+            counts["near_duplicates"] += 1
+            item["canonical"] = match
+            ref["cluster_id"] = match["cluster_id"]
+        else:
+            counts["new"] += 1
+            ref["cluster_id"] = ref["id"]
+            index.add(item["shingles"], item["lsh_keys"], ref)
+    for item in items:
+        del item["shingles"]
+    return items, counts
+
+
+def _build_news(items: List[dict]) -> List[tuple]:
+    """
+    שלב ההעשרה: מחזיר (raw, News) לכל item. כמעט-כפילויות מקבלות את ההעשרה
+    של הכתבה המקורית; השאר – cache קודם, ובאצ' אחד למודלים על מה שחסר.
+    """
+    # כתבות מקוריות קודם, כדי שכפילויות באותו באצ' יוכלו להעתיק מהן.
+    # (הסבב השני ריק בדרך כלל – רק אם המקורית עוד לא הועשרה מסיבה כלשהי)
+    for pick in (lambda item: item["canonical"] is None,
+                 lambda item: item["canonical"] is not None and item["canonical"]["nlp"] is None):
+        to_infer = [item for item in items if pick(item)]
+        texts = [f"{item['raw'].get('title','')} {item['raw'].get('summary','')}" for item in to_infer]
+        for item, nlp in zip(to_infer, _enrich(texts) if to_infer else []):
+            item["ref"]["nlp"] = nlp
+
+    out = []
+    for item in items:
+        it, ref = item["raw"], item["ref"]
+        nlp = ref["nlp"] or item["canonical"]["nlp"]
         image_url = it.get("imageUrl") or _pick_image_url(it)
 
-        published_raw = it.get("published_at", "")
+        published_raw = it.get("published_at") or ""
         published_at = published_raw.split("T")[0]
 
         news = News(
-            id=str(uuid.uuid4()),
+            id=ref["id"],
             title=it.get("title",""),
             summary=it.get("summary"),
             url=it.get("url"),
             published_at=published_at,
-            topic=topic,
-            score=score, 
-            entities=ents,
-            imageUrl=image_url # 👈 חדש
+            topic=nlp["topic"],
+            score=nlp["score"], 
+            entities=nlp["entities"],
+            imageUrl=image_url, # 👈 חדש
+            content_hash=item["content_hash"],
+            cluster_id=ref["cluster_id"],
+            lsh_keys=item["lsh_keys"],
         )
-        _repo.save(news)
-        ids.append(news.id)
-    return ids
+        out.append((it, news))
+    return out
+
+
+def pull_and_process(limit: int = 10,
+                     observer: Optional[Callable[[Pipeline], None]] = None) -> IngestReport:
+    """
+    ingestion כצינור streaming: fetch → dedup → enrich → persist → publish.
+    כל שלב ב-thread משלו עם תורים חסומים ביניהם, כך שהשלבים חופפים
+    ושלב איטי (מונגו / מודל) מאט את הקודמים במקום לנפח זיכרון.
+    observer מקבל את הצינור לפני ההרצה – למעקב התקדמות חי (jobs).
+    """
+    _sync_indexes()
+    timings: dict = {}
+    counts = {"new": 0, "changed": 0, "unchanged": 0, "near_duplicates": 0}
+    writes = {"matched": 0, "modified": 0, "upserted": 0}
+    # זיכרון קבוע לריצה: ספירה + דוגמה חסומה של מזהים, לא כל המזהים
+    saved = 0
+    ids: List[str] = []
+
+    def dedup_stage(batch: List[dict]) -> List[dict]:
+        items, c = _dedup(batch)
+        for k, v in c.items():
+            counts[k] += v
+        return items
+
+    def persist_stage(pairs: List[tuple]) -> List[tuple]:
+        nonlocal saved
+        res = _repo.save_many([news for _, news in pairs])
+        for k, v in res.items():
+            writes[k] += v
+        _after_save([news for _, news in pairs])
+        saved += len(pairs)
+        ids.extend(news.id for _, news in pairs[:INGEST_REPORT_MAX_IDS - len(ids)])
+        return pairs
+
+    def publish_stage(pairs: List[tuple]) -> list:
+        publish_batch([it for it, _ in pairs])
+        return []
+
+    pipeline = Pipeline(
+        sources.iter_all(limit, timings),
+        [
+            Stage("dedup", dedup_stage),
+            Stage("enrich", _build_news),
+            Stage("persist", persist_stage),
+            Stage("publish", publish_stage),
+        ],
+        chunk_size=INGEST_CHUNK_SIZE,
+        queue_size=INGEST_QUEUE_SIZE,
+    )
+    if observer is not None:
+        observer(pipeline)
+    padding_before = padding_snapshot()
+    pipeline.run()
+    efficiency = padding_efficiency(padding_before, padding_snapshot())
+
+    stats = pipeline.stats()
+    print("📡 sources:", timings)
+    print(f"🧹 dedup: {counts['new']} new, {counts['changed']} changed, {counts['unchanged']} unchanged, "
+          f"{counts['near_duplicates']} near-duplicates")
+    print(f"💾 writes: {writes}")
+    print(f"📏 padding efficiency: {efficiency}")
+    print("🚰 pipeline:", stats)
+
+    # הכול נשמר – אפשר לקדם את ה-high-water marks של הספק
+    commit_high_water_marks()
+    if saved:
+        save_index_snapshots()
+    return IngestReport(saved=saved, ids=ids, padding_efficiency=efficiency, sources=timings, writes=writes,
+                        stages=stats["stages"], seconds=stats["seconds"], **counts)
+
+def _after_save(items: List[News]) -> None:
+    """אחרי באץ' שנשמר: עדכון ה-hot tier (אם הוא מעודכן לדור הנוכחי) וקידום הדור."""
+    with _hot_lock:
+        in_sync = _hot is not None and _hot.generation == _generation.current()
+        if in_sync:
+            _hot.upsert_many({f: getattr(n, f) for f in LIST_FIELDS} for n in items)
+        gen = _generation.bump()
+        if in_sync:
+            _hot.generation = gen
+    _search.upsert_many({f: getattr(n, f) for f in SEARCH_FIELDS} for n in items)
+    _entities.upsert_many({f: getattr(n, f) for f in ENTITY_FIELDS} for n in items)
+
+def _after_remove(news_ids: List[str]) -> None:
+    """אחרי מחיקה מהאוסף (retention): הכתבות יוצאות מה-hot tier ומהאינדקסים, והדור עולה."""
+    with _hot_lock:
+        in_sync = _hot is not None and _hot.generation == _generation.current()
+        if in_sync:
+            _hot.remove(news_ids)
+        gen = _generation.bump()
+        if in_sync:
+            _hot.generation = gen
+    _search.remove(news_ids)
+    _entities.remove(news_ids)
+
+def apply_retention(days: int = RETENTION_DAYS, archive_dir: Path = RETENTION_ARCHIVE_DIR,
+                    now: Optional[float] = None) -> RetentionReport:
+    """
+    מעביר כתבות שפורסמו לפני יותר מ-days ימים לקובץ ארכיון gzip NDJSON ומוחק אותן
+    מהאוסף, ומוחק כפילויות לפי url. כך האוסף (והאינדקסים שלו ב-RAM) נשאר בגודל
+    הסט הטרי. המחיקה רק אחרי שהקובץ נכתב במלואו – ריצה שנפלה לא מאבדת כתבות.
+    """
+    started = time.perf_counter()
+    _sync_indexes()
+    report = RetentionReport(before=_repo.storage_stats())
+    removed: List[str] = []
+
+    duplicates = _repo.remove_duplicates()
+    if duplicates:
+        report.duplicates = len(duplicates)
+        removed += duplicates
+        # עכשיו url_unique יכול להיבנות (אם נכשל בגלל הכפילויות)
+        _repo.ensure_indexes()
+
+    if days > 0:
+        now = time.time() if now is None else now
+        report.cutoff = time.strftime("%Y-%m-%d", time.gmtime(now - days * 86400))
+        path = archive_dir / f"news-before-{report.cutoff}-{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}.ndjson.gz"
+        tmp = path.with_suffix(".tmp")
+        archived: List[str] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for doc in _repo.scan_older_than(report.cutoff):
+                f.write(json.dumps(doc, ensure_ascii=False, default=str) + "\n")
+                archived.append(doc["id"])
+        if archived:
+            os.replace(tmp, path)
+            report.archive_file = str(path)
+            report.archive_bytes = path.stat().st_size
+            report.archived = _repo.delete_by_ids(archived)
+            removed += archived
+        else:
+            tmp.unlink()
+
+    if removed:
+        _after_remove(removed)
+        save_index_snapshots()
+    report.after = _repo.storage_stats()
+    report.reclaimed_bytes = max(0, report.before.get("data_bytes", 0) - report.after.get("data_bytes", 0))
+    report.seconds = round(time.perf_counter() - started, 3)
+    print(f"🗄️ retention: {report.archived} archived (before {report.cutoff}), "
+          f"{report.duplicates} duplicates removed, {report.reclaimed_bytes} bytes reclaimed")
+    return report
+
+def _hot_tier() -> Optional[HotTier]:
+    """ה-hot tier, טעון מחדש ממונגו אם הדור זז מאז הטעינה (None אם כבוי)."""
+    if _hot is None:
+        return None
+    gen = _generation.current()
+    if _hot.generation != gen:
+        with _hot_lock:
+            if _hot.generation != gen:
+                _hot.load(_repo.list_raw(limit=_hot.capacity))
+                _hot.generation = gen
+    return _hot
+
+async def _ahot_tier() -> Optional[HotTier]:
+    global _ahot_lock
+    if _hot is None:
+        return None
+    gen = _generation.current()
+    if _hot.generation != gen:
+        # טעינה אחת גם כשאלף בקשות מגיעות יחד אחרי ingestion
+        if _ahot_lock is None:
+            _ahot_lock = asyncio.Lock()
+        async with _ahot_lock:
+            if _hot.generation != gen:
+                _hot.load(await _get_async_repo().list_raw(limit=_hot.capacity))
+                _hot.generation = gen
+    return _hot
+
+def load_indexes() -> None:
+    """בעליית השרת: אינדקס החיפוש ואינדקס הישויות מה-snapshot (או בנייה מהמונגו)."""
+    for idx in _snapshotted:
+        idx.load_or_rebuild()
+
+def _sync_indexes() -> None:
+    """לפני עדכון האינדקסים בזיכרון: snapshot חדש יותר של worker אחר נטען קודם (ומחכים לו)."""
+    for idx in _snapshotted:
+        idx.refresh(wait=True)
+
+def save_index_snapshots() -> None:
+    for idx in _snapshotted:
+        idx.save()
+
+def _docs_by_ids(ids: List[str]) -> dict:
+    """payload-ים לפי id: קודם מה-hot tier, את השאר בשאילתה אחת למונגו."""
+    hot = _hot_tier()
+    docs = {i: d for i in ids if hot is not None and (d := hot.get(i)) is not None}
+    missing = [i for i in ids if i not in docs]
+    if missing:
+        docs.update((d["id"], d) for d in _repo.list_by_ids(missing))
+    return docs
+
+def search_news(q: str, topic: str | None = None, offset: int = 0,
+                limit: int = 10) -> Tuple[int, List[Tuple[dict, float]], bool]:
+    """
+    חיפוש BM25 + boost לחדשות; מחזיר (מספר ההתאמות, [(doc גולמי, score)], truncated)
+    – ראו SearchIndex.search.
+    """
+    _search_snapshot.refresh()
+    total, hits, truncated = _search.search(q, topic=topic, offset=offset, limit=limit)
+    docs = _docs_by_ids([i for i, _ in hits])
+    return total, [(docs[i], score) for i, score in hits if i in docs], truncated
+
+def entity_news(name: str, limit: int = 10,
+                cursor: str | None = None) -> Tuple[List[dict], Optional[str]]:
+    """הכתבות על ישות, החדשות קודם, + cursor לעמוד הבא (כמו ב-/news)."""
+    _entity_snapshot.refresh()
+    after = decode_cursor(cursor) if cursor else None
+    ids, more = _entities.news(name, limit=limit, after=after)
+    docs = _docs_by_ids(ids)
+    items = [docs[i] for i in ids if i in docs]
+    next_cursor = encode_cursor(items[-1].get("published_at"), items[-1]["id"]) if more and items else None
+    return items, next_cursor
+
+def trending_entities(window: str = "24h", limit: int = 20) -> List[dict]:
+    _entity_snapshot.refresh()
+    return _entities.trending(window, limit=limit)
+
+def search_index_stats() -> dict:
+    return _search.stats()
+
+def entity_index_stats() -> dict:
+    return _entities.stats()
+
+def ensure_indexes() -> List[str]:
+    names = _repo.ensure_indexes()
+    if _enrich_cache.store is not None:
+        try:
+            names += [f"nlp_cache.{n}" for n in _enrich_cache.store.ensure_indexes()]
+        except Exception as e:
+            print("⚠️ NLP cache store index failed:", e)
+    return names
+
+def read_cache_stats() -> dict:
+    return {**_read_cache.stats(), "hot_tier": _hot.stats() if _hot is not None else None}
+
+def _load_news(news_id: str) -> News | None:
+    hot = _hot_tier()
+    raw = hot.get(news_id) if hot is not None else None
+    return News(**raw) if raw else _repo.get(news_id)
 
 def get_news(news_id: str) -> News | None:
-    return _repo.get(news_id)
+    return _read_cache.get_or_load(("get", news_id), lambda: _load_news(news_id))
 
-def list_news(topic: str | None = None, limit: int = 10) -> List[News]:
+def _load_list(topic: str | None, limit: int, sort_by: str) -> List[News]:
+    hot = _hot_tier()
+    docs = hot.query(topic, limit, order=sort_by) if hot is not None else None
+    if docs is not None:
+        return [News(**d) for d in docs]
     return _repo.list(topic=topic, limit=limit)
 
+def list_news(topic: str | None = None, limit: int = 10, sort_by: str = "published_at") -> List[News]:
+    """
+    הכתבות האחרונות (ב-topic). sort_by="score" – הכי גבוהות ב-score מתוך
+    החלון של ה-hot tier (HOT_TIER_CAPACITY הכתבות החדשות ביותר); בלי hot tier – לפי תאריך.
+    """
+    return _read_cache.get_or_load(("list", topic, limit, sort_by),
+                                   lambda: _load_list(topic, limit, sort_by))
+
+def _get_async_repo() -> AsyncNewsRepository:
+    global _async_repo
+    if _async_repo is None:
+        _async_repo = (AsyncMongoNewsRepository() if isinstance(_repo, MongoNewsRepository)
+                       else AsyncRepositoryAdapter(_repo))
+    return _async_repo
+
+async def aclose() -> None:
+    global _async_repo
+    if _async_repo is not None:
+        await _async_repo.close()
+        _async_repo = None
+
+async def _aload_news(news_id: str) -> News | None:
+    hot = await _ahot_tier()
+    raw = hot.get(news_id) if hot is not None else None
+    return News(**raw) if raw else await _get_async_repo().get(news_id)
+
+async def aget_news(news_id: str) -> News | None:
+    return await _read_cache.aget_or_load(("get", news_id), lambda: _aload_news(news_id))
+
+def encode_cursor(published_at: str | None, news_id: str) -> str:
+    """cursor אטום לעמוד הבא: (published_at, id) של הפריט האחרון, ב-base64."""
+    raw = json.dumps([published_at or "", news_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, news_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(published_at), str(news_id)
+    except Exception:
+        raise ValueError("invalid cursor")
+
+def _load_raw(topic: str | None, limit: int, after: Optional[Tuple[str, str]]) -> List[dict]:
+    # "האחרונות ב-topic X" נענות מה-hot tier; מונגו רק מתחת לחלון שלו
+    hot = _hot_tier()
+    docs = hot.query(topic, limit, after) if hot is not None else None
+    return docs if docs is not None else _repo.list_raw(topic=topic, limit=limit, after=after)
+
+async def _aload_raw(topic: str | None, limit: int, after: Optional[Tuple[str, str]]) -> List[dict]:
+    hot = await _ahot_tier()
+    docs = hot.query(topic, limit, after) if hot is not None else None
+    if docs is not None:
+        return docs
+    return await _get_async_repo().list_raw(topic=topic, limit=limit, after=after)
+
+def _check_limit(limit: int) -> None:
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1 (got {limit})")
+
+def _page(docs: List[dict], limit: int) -> Tuple[List[dict], Optional[str]]:
+    if len(docs) <= limit:
+        return docs, None
+    docs = docs[:limit]
+    return docs, encode_cursor(docs[-1].get("published_at"), docs[-1]["id"])
+
+def list_news_page(topic: str | None = None, limit: int = 10,
+                   cursor: str | None = None) -> Tuple[List[dict], Optional[str]]:
+    """
+    עמוד אחד של כתבות (dict-ים גולמיים, LIST_FIELDS) + cursor לעמוד הבא
+    (None בעמוד האחרון).
+    """
+    _check_limit(limit)
+    after = decode_cursor(cursor) if cursor else None
+    # פריט אחד נוסף רק כדי לדעת אם יש עמוד הבא
+    docs = _read_cache.get_or_load(("list_raw", topic, limit + 1, after),
+                                   lambda: _load_raw(topic, limit + 1, after))
+    return _page(docs, limit)
 
+async def alist_news_page(topic: str | None = None, limit: int = 10,
+                          cursor: str | None = None) -> Tuple[List[dict], Optional[str]]:
+    """הגרסה האסינכרונית של list_news_page (אותו cache ואותו cursor)."""
+    _check_limit(limit)
+    after = decode_cursor(cursor) if cursor else None
+    docs = await _read_cache.aget_or_load(("list_raw", topic, limit + 1, after),
+                                          lambda: _aload_raw(topic, limit + 1, after))
+    return _page(docs, limit)
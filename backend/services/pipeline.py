@@ -0,0 +1,155 @@
+# backend/services/pipeline.py
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional
+
+_END = object()
+
+
+class Stage:
+    """
+    שלב בצינור: מקבל באצ' (list) ומחזיר באצ' לשלב הבא.
+    רץ ב-thread משלו וקורא מתור חסום (bounded) – אם השלב הבא איטי, התור מתמלא
+    והשלב הזה נחסם ב-put, כך שהזיכרון לא גדל (backpressure).
+    """
+
+    def __init__(self, name: str, fn: Callable[[list], list]):
+        self.name = name
+        self.fn = fn
+        self.inbox: Optional[queue.Queue] = None
+        self.items_in = 0
+        self.items_out = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+
+    def stats(self) -> dict:
+        depth = self.inbox.qsize() if self.inbox is not None else 0
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "batches": self.batches,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items_in / self.busy_seconds, 2) if self.busy_seconds else None,
+            "queue_depth": depth,
+            "max_queue_depth": max(self.max_queue_depth, depth),
+        }
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for it in items:
+        batch.append(it)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Pipeline:
+    """
+    מחבר מקור (iterator) לשרשרת שלבים דרך תורים חסומים. כל השלבים רצים במקביל,
+    כך שמשיכה, inference וכתיבה חופפים, והזיכרון תלוי רק ב-chunk_size × queue_size.
+    """
+
+    def __init__(self, source: Iterable, stages: List[Stage], chunk_size: int = 32, queue_size: int = 4):
+        self.source = source
+        self.stages = stages
+        self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.fetched = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._abort = threading.Event()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        # put עם timeout כדי לא להיתקע לנצח אם שלב אחר נכשל
+        while not self._abort.is_set():
+            try:
+                q.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fail(self, e: BaseException) -> None:
+        if self._error is None:
+            self._error = e
+        self._abort.set()
+
+    def _feed(self, out: queue.Queue) -> None:
+        try:
+            for batch in chunked(self.source, self.chunk_size):
+                self.fetched += len(batch)
+                if not self._put(out, batch):
+                    return
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            # מקור שהוא generator (למשל iter_all) נסגר גם כשעוצרים באמצע – משחרר את ה-threads שלו
+            close = getattr(self.source, "close", None)
+            if close is not None:
+                close()
+            self._put(out, _END)
+
+    def _work(self, stage: Stage, out: Optional[queue.Queue]) -> None:
+        while True:
+            try:
+                batch = stage.inbox.get(timeout=0.2)
+            except queue.Empty:
+                if self._abort.is_set():
+                    return
+                continue
+            if batch is _END:
+                if out is not None:
+                    self._put(out, _END)
+                return
+            stage.max_queue_depth = max(stage.max_queue_depth, stage.inbox.qsize() + 1)
+            started = time.perf_counter()
+            try:
+                result = stage.fn(batch) or []
+            except BaseException as e:
+                self._fail(e)
+                if out is not None:
+                    self._put(out, _END)
+                return
+            stage.busy_seconds += time.perf_counter() - started
+            stage.batches += 1
+            stage.items_in += len(batch)
+            stage.items_out += len(result)
+            if out is not None and result:
+                if not self._put(out, result):
+                    return
+
+    def run(self) -> None:
+        """מריץ עד שהמקור נגמר וכל השלבים התרוקנו; שגיאה בשלב כלשהו נזרקת מכאן."""
+        self.started = time.perf_counter()
+        for stage in self.stages:
+            stage.inbox = queue.Queue(maxsize=self.queue_size)
+        threads = [threading.Thread(target=self._feed, args=(self.stages[0].inbox,),
+                                    name="pipeline-source", daemon=True)]
+        for i, stage in enumerate(self.stages):
+            out = self.stages[i + 1].inbox if i + 1 < len(self.stages) else None
+            threads.append(threading.Thread(target=self._work, args=(stage, out),
+                                            name=f"pipeline-{stage.name}", daemon=True))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.finished = time.perf_counter()
+        if self._error is not None:
+            raise self._error
+
+    def stages_by_name(self) -> dict:
+        return {s.name: s for s in self.stages}
+
+    def stats(self) -> dict:
+        end = self.finished or time.perf_counter()
+        return {
+            "fetched": self.fetched,
+            "seconds": round(end - self.started, 3) if self.started else 0.0,
+            "stages": {s.name: s.stats() for s in self.stages},
+        }
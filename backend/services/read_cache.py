@@ -0,0 +1,130 @@
+# backend/services/read_cache.py
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IngestGeneration:
+    """
+    מונה "דורות" של הנתונים: עולה בכל באץ' שנשמר בהצלחה.
+    עם path המונה נשמר גם בקובץ, כך שכל ה-workers של gunicorn על אותה מכונה
+    רואים את הקידום של ה-worker שהריץ את ה-ingestion (stat זול, בלי מונגו).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._value = 0
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def current(self) -> int:
+        if self.path is None:
+            return self._value
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return self._value
+        # כל bump מחליף את הקובץ (inode חדש), כך שגם שני קידומים באותו tick של mtime מזוהים
+        stamp = (st.st_ino, st.st_mtime_ns)
+        if stamp != self._stamp:
+            try:
+                self._value = int(self.path.read_text() or 0)
+                self._stamp = stamp
+            except (OSError, ValueError):
+                pass
+        return self._value
+
+    def bump(self) -> int:
+        with self._lock:
+            value = self.current() + 1
+            self._value = value
+            if self.path is not None:
+                # כתיבה אטומית: קובץ זמני + rename
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(str(value))
+                os.replace(tmp, self.path)
+            return value
+
+
+class ReadThroughCache:
+    """
+    cache לקריאות (list_news / get_news) לפי פרמטרי השאילתה.
+    כל רשומה שייכת לדור שבו נקראה; כשהדור עולה הרשומות הישנות לא מוחזרות יותר
+    ונמחקות, כך שבין ריצות ingestion שאילתה זהה לא מגיעה למונגו בכלל. LRU חסום.
+    """
+
+    def __init__(self, generation: IngestGeneration, max_entries: int = 1024):
+        self.generation = generation
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[tuple, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._seen_generation = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], T]) -> T:
+        if self.max_entries <= 0:
+            return load()
+        hit, value, full_key = self._lookup(key)
+        if hit:
+            return value
+        value = load()
+        self._store(full_key, value)
+        return value
+
+    async def aget_or_load(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """כמו get_or_load, עבור טעינה אסינכרונית (endpoints על ה-event loop)."""
+        if self.max_entries <= 0:
+            return await load()
+        hit, value, full_key = self._lookup(key)
+        if hit:
+            return value
+        value = await load()
+        self._store(full_key, value)
+        return value
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, object, tuple]:
+        # הדור נקרא לפני הטעינה: אם ingestion מסתיים באמצע, התוצאה נשמרת תחת
+        # הדור הישן ולא תוחזר אחרי הקידום
+        gen = self.generation.current()
+        full_key = (gen, key)
+        with self._lock:
+            if gen != self._seen_generation:
+                if self._lru:
+                    self.invalidations += 1
+                self._lru.clear()
+                self._seen_generation = gen
+            if full_key in self._lru:
+                self._lru.move_to_end(full_key)
+                self.hits += 1
+                return True, self._lru[full_key], full_key
+            self.misses += 1
+        return False, None, full_key
+
+    def _store(self, full_key: tuple, value) -> None:
+        with self._lock:
+            self._lru[full_key] = value
+            self._lru.move_to_end(full_key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": len(self._lru),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "generation": self.generation.current(),
+        }
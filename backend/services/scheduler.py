@@ -0,0 +1,204 @@
+# backend/services/scheduler.py
+import fcntl
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from backend.config import (INGEST_INITIAL_DELAY_SECONDS, INGEST_INTERVAL_MINUTES, INGEST_LIMIT,
+                            NEWS_CACHE_DIR, RETENTION_INITIAL_DELAY_SECONDS, RETENTION_INTERVAL_HOURS)
+from backend.models.schemas import IngestReport, RetentionReport
+
+
+class SingleFlight:
+    """
+    מנעול "ריצה אחת בכל רגע": thread lock בתוך התהליך + flock על קובץ,
+    כך שגם כמה workers של אותו שרת לא מריצים ingestion במקביל.
+    """
+
+    def __init__(self, lock_path: Path):
+        self._thread_lock = threading.Lock()
+        self._path = Path(lock_path)
+        self._fh = None
+
+    def acquire(self) -> bool:
+        if not self._thread_lock.acquire(blocking=False):
+            return False
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self._path, "w")
+            fcntl.flock(self._fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            self._thread_lock.release()
+            return False
+
+    def release(self) -> None:
+        if self._fh is not None:
+            fcntl.flock(self._fh, fcntl.LOCK_UN)
+            self._fh.close()
+            self._fh = None
+        self._thread_lock.release()
+
+
+class AlreadyRunning(Exception):
+    """ריצה אחרת (בתהליך הזה או ב-worker אחר) מחזיקה את המנעול."""
+
+
+class PeriodicTask:
+    """
+    מריץ פעולה מחזורית בתוך התהליך (קריאה ישירה לשכבת ה-service, בלי HTTP לעצמנו).
+    ריצה שמתחילה כשהקודמת עוד רצה (גם ב-worker אחר) – מדולגת. stop() מחכה לסיום מסודר.
+    """
+
+    name = "task"
+
+    def __init__(self, run: Callable[[], Any], interval_seconds: float,
+                 initial_delay: float = 5, lock_path: Optional[Path] = None,
+                 flight: Optional[SingleFlight] = None):
+        self._run = run
+        self.interval = interval_seconds
+        self.initial_delay = initial_delay
+        # flight משותף: משימות שכותבות לאותם snapshots לא רצות במקביל
+        self._flight = flight or SingleFlight(lock_path or NEWS_CACHE_DIR / f"{self.name}.lock")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.next_run_at: Optional[float] = None
+        self.skipped = 0
+        self.last_run: Optional[dict] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=f"{self.name}-scheduler", daemon=True)
+        self._thread.start()
+        print(f"🕒 Scheduler started ({self.name} every {self.interval / 60:g} minutes)")
+
+    def stop(self, timeout: float = 30) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        delay = self.initial_delay
+        while True:
+            self.next_run_at = time.time() + delay
+            if self._stop.wait(delay):
+                return
+            self.run_once()
+            delay = self.interval
+
+    def summarize(self, report: Any) -> dict:
+        """השדות מתוך תוצאת הריצה שנשמרים ב-last_run."""
+        return {}
+
+    def run_exclusive(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        מריץ fn תחת אותו מנעול של הריצות המתוזמנות (למשל job ידני), כך שלא
+        חופף לריצה מתוזמנת; AlreadyRunning אם ריצה אחרת בעיצומה.
+        """
+        if not self._flight.acquire():
+            raise AlreadyRunning(f"{self.name} already running")
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._flight.release()
+
+    def run_once(self) -> Any:
+        """ריצה אחת; מחזיר None אם ריצה אחרת כבר בעיצומה."""
+        if not self._flight.acquire():
+            self.skipped += 1
+            print(f"⏭️ {self.name.capitalize()}: another run is in progress – skipping this run")
+            return None
+        started = time.time()
+        try:
+            report = self._run()
+            self.last_run = {
+                "started_at": started,
+                "duration_seconds": round(time.time() - started, 3),
+                **self.summarize(report),
+                "error": None,
+            }
+            print(f"✅ Scheduled {self.name} finished:", self.last_run)
+            return report
+        except Exception as e:
+            self.last_run = {"started_at": started, "duration_seconds": round(time.time() - started, 3),
+                             "error": str(e)}
+            print(f"❌ Error in scheduled {self.name}:", e)
+            return None
+        finally:
+            self._flight.release()
+
+    def status(self) -> dict:
+        return {
+            "running": self._thread is not None,
+            "interval_seconds": self.interval,
+            "next_run_at": self.next_run_at,
+            "skipped_runs": self.skipped,
+            "last_run": self.last_run,
+        }
+
+
+class IngestScheduler(PeriodicTask):
+    """ingestion מחזורי של limit כתבות לכל ריצה."""
+
+    name = "ingest"
+
+    def __init__(self, run: Callable[[int], IngestReport], interval_seconds: float,
+                 initial_delay: float = 5, limit: int = 50, lock_path: Optional[Path] = None):
+        super().__init__(lambda: run(self.limit), interval_seconds, initial_delay, lock_path)
+        self.limit = limit
+
+    def summarize(self, report: IngestReport) -> dict:
+        return {
+            "inserted": report.saved,
+            "new": report.new,
+            "changed": report.changed,
+            "unchanged": report.unchanged,
+            "near_duplicates": report.near_duplicates,
+        }
+
+
+class RetentionScheduler(PeriodicTask):
+    """
+    ארכוב ומחיקה מחזוריים של כתבות ישנות (ראו news_service.apply_retention).
+    רץ תחת ה-SingleFlight של ה-ingestion: שתיהן מסתיימות ב-save_index_snapshots
+    מהאינדקס שבזיכרון של התהליך שלהן, וריצות חופפות (גם ב-workers שונים) היו
+    דורסות אחת את השינויים של השנייה ב-snapshot.
+    """
+
+    name = "retention"
+
+    def summarize(self, report: RetentionReport) -> dict:
+        return report.dict()
+
+
+def _run_ingestion(limit: int) -> IngestReport:
+    from backend.services import news_service
+    return news_service.pull_and_process(limit=limit)
+
+
+scheduler = IngestScheduler(
+    _run_ingestion,
+    interval_seconds=INGEST_INTERVAL_MINUTES * 60,
+    initial_delay=INGEST_INITIAL_DELAY_SECONDS,
+    limit=INGEST_LIMIT,
+)
+
+
+def _run_retention() -> RetentionReport:
+    from backend.services import news_service
+    return news_service.apply_retention()
+
+
+retention = RetentionScheduler(
+    _run_retention,
+    interval_seconds=RETENTION_INTERVAL_HOURS * 3600,
+    initial_delay=RETENTION_INITIAL_DELAY_SECONDS,
+    flight=scheduler._flight,
+)
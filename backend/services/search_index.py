@@ -0,0 +1,204 @@
+# backend/services/search_index.py
+import calendar
+import gzip
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.ai.cache import normalize_text
+
+# משקל לכל שדה ב-tf (BM25F מפושט): מילה בכותרת שווה יותר ממילה בתקציר
+FIELD_WEIGHTS = {"title": 2.0, "summary": 1.0, "entities": 1.5}
+SNAPSHOT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or that the to was were "
+    "will with this after over into new says said".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """טוקנים לאינדקס ולשאילתה: NFKC + lowercase, מילים (כולל עברית), בלי stopwords."""
+    return [t for t in _TOKEN_RE.findall(normalize_text(text).lower())
+            if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _days(published_at: Optional[str]) -> Optional[int]:
+    try:
+        return calendar.timegm(time.strptime((published_at or "")[:10], "%Y-%m-%d")) // 86400
+    except ValueError:
+        return None
+
+
+class SearchIndex:
+    """
+    אינדקס הפוך לחיפוש טקסט חופשי על title / summary / entities, עם דירוג
+    BM25 כפול boost לכתבות חדשות. מתעדכן כתבה-כתבה (upsert / remove).
+
+    כל posting list היא dict לפי סדר הכנסה (כתבה שמתעדכנת עוברת לסוף), כך
+    שאפשר לסרוק אותה מהחדש לישן ולעצור אחרי max_postings – מילים נפוצות מאוד
+    לא גורמות לזמן החיפוש לגדול עם האוסף (וה-idf שלהן נמוך ממילא). חיפוש כזה
+    מסומן כ-truncated: הדירוג הוא מתוך הכתבות החדשות, וה-total הוא הערכה.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, recency_weight: float = 0.5,
+                 half_life_days: float = 7.0, max_postings: int = 5000):
+        self.k1, self.b = k1, b
+        self.recency_weight = recency_weight
+        self.half_life_days = half_life_days
+        self.max_postings = max_postings
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # id → (topic, published_days, doc_len, {term: tf})
+        self._docs: Dict[str, Tuple[Optional[str], Optional[int], float, Dict[str, float]]] = {}
+        self._total_len = 0.0
+        # topic → ids, לתקרת ה-total המוערך בחיפוש שנחתך עם סינון topic
+        self._by_topic: Dict[Optional[str], set] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---- עדכון ----
+
+    @staticmethod
+    def _term_freqs(doc: dict) -> Dict[str, float]:
+        tf: Dict[str, float] = {}
+        fields = {"title": doc.get("title") or "", "summary": doc.get("summary") or "",
+                  "entities": " ".join(doc.get("entities") or [])}
+        for field, text in fields.items():
+            w = FIELD_WEIGHTS[field]
+            for tok in tokenize(text):
+                tf[tok] = tf.get(tok, 0.0) + w
+        return tf
+
+    def upsert_many(self, docs: Iterable[dict]) -> None:
+        with self._lock:
+            for doc in docs:
+                self._add(doc["id"], doc.get("topic"), _days(doc.get("published_at")),
+                          self._term_freqs(doc))
+
+    def _add(self, news_id: str, topic: Optional[str], days: Optional[int],
+             tf: Dict[str, float]) -> None:
+        self._remove(news_id)
+        length = sum(tf.values())
+        self._docs[news_id] = (topic, days, length, tf)
+        self._by_topic.setdefault(topic, set()).add(news_id)
+        self._total_len += length
+        for term, freq in tf.items():
+            self._postings.setdefault(term, {})[news_id] = freq
+
+    def remove(self, news_ids: Iterable[str]) -> int:
+        with self._lock:
+            return sum(self._remove(i) for i in news_ids)
+
+    def _remove(self, news_id: str) -> bool:
+        old = self._docs.pop(news_id, None)
+        if old is None:
+            return False
+        self._total_len -= old[2]
+        ids = self._by_topic.get(old[0])
+        if ids is not None:
+            ids.discard(news_id)
+            if not ids:
+                del self._by_topic[old[0]]
+        for term in old[3]:
+            plist = self._postings.get(term)
+            if plist is not None:
+                plist.pop(news_id, None)
+                if not plist:
+                    del self._postings[term]
+        return True
+
+    # ---- חיפוש ----
+
+    def search(self, q: str, topic: Optional[str] = None, offset: int = 0,
+               limit: int = 10) -> Tuple[int, List[Tuple[str, float]], bool]:
+        """
+        מחזיר (מספר ההתאמות, [(id, score)] לעמוד offset..offset+limit, truncated).
+        truncated: מילה כלשהי נסרקה רק ל-max_postings הכתבות החדשות שלה, כך שכתבות
+        ישנות יותר שמתאימות לא דורגו, וה-total הוא הערכה ולא ספירה (וייתכן שעמודים
+        מאוחרים יחזרו קצרים ממנו).
+        """
+        terms = list(dict.fromkeys(tokenize(q)))
+        with self._lock:
+            n_docs = len(self._docs)
+            if not terms or not n_docs:
+                return 0, [], False
+            avg_len = self._total_len / n_docs
+            today = time.time() // 86400
+            scores: Dict[str, float] = {}
+            plists = []
+            for term in terms:
+                plist = self._postings.get(term)
+                if not plist:
+                    continue
+                plists.append(plist)
+                df = len(plist)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for news_id in islice(reversed(plist), self.max_postings):
+                    doc_topic, _, length, _ = self._docs[news_id]
+                    if topic and topic != "all" and doc_topic != topic:
+                        continue
+                    freq = plist[news_id]
+                    norm = self.k1 * (1 - self.b + self.b * length / avg_len)
+                    scores[news_id] = scores.get(news_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+            for news_id, score in scores.items():
+                days = self._docs[news_id][1]
+                if days is not None:
+                    age = max(0.0, today - days)
+                    scores[news_id] = score * (1 + self.recency_weight * 0.5 ** (age / self.half_life_days))
+
+            top = heapq.nlargest(offset + limit, scores.items(), key=lambda kv: (kv[1], kv[0]))
+            hits = [(i, round(s, 4)) for i, s in top[offset:]]
+            truncated = any(len(plist) > self.max_postings for plist in plists)
+            if not truncated:
+                return len(scores), hits, False
+            # הערכה ב-O(מספר המילים): ה-posting list הארוכה (חסם תחתון בלי topic),
+            # עד גודל ה-topic. איחוד ה-postings היה מעתיק את כולן בכל שאילתה, תחת ה-lock
+            estimate = max(len(plist) for plist in plists)
+            if topic and topic != "all":
+                estimate = min(estimate, len(self._by_topic.get(topic, ())))
+            return max(estimate, len(scores)), hits, True
+
+    # ---- snapshot ----
+
+    def save(self, path: Path) -> None:
+        """snapshot ל-JSON מכווץ (כתיבה אטומית). ה-postings נבנים מחדש בטעינה מתוך ה-tf."""
+        with self._lock:
+            docs = [[i, topic, days, tf] for i, (topic, days, _, tf) in self._docs.items()]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "fields": FIELD_WEIGHTS, "docs": docs}, f)
+        os.replace(tmp, path)
+
+    def load(self, path: Path) -> bool:
+        """טוען snapshot; False אם אין קובץ או שהפורמט / משקלי השדות השתנו."""
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != SNAPSHOT_VERSION or data.get("fields") != FIELD_WEIGHTS:
+            return False
+        # בונים אינדקס חדש בצד ומחליפים בבת אחת – חיפושים ממשיכים על הישן בזמן הטעינה
+        fresh = SearchIndex(self.k1, self.b, self.recency_weight, self.half_life_days, self.max_postings)
+        for news_id, topic, days, tf in data["docs"]:
+            fresh._add(news_id, topic, days, tf)
+        with self._lock:
+            self._postings, self._docs = fresh._postings, fresh._docs
+            self._total_len, self._by_topic = fresh._total_len, fresh._by_topic
+        return True
+
+    def stats(self) -> dict:
+        return {"docs": len(self._docs), "terms": len(self._postings),
+                "avg_doc_len": round(self._total_len / len(self._docs), 2) if self._docs else 0.0}
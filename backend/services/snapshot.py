@@ -0,0 +1,80 @@
+# backend/services/snapshot.py
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def file_stamp(path: Path) -> Optional[tuple]:
+    """(inode, mtime) של קובץ – משתנה בכל החלפה אטומית שלו; None אם אין קובץ."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+class SnapshottedIndex:
+    """
+    אינדקס בזיכרון (עם save(path) / load(path)) שנשמר כ-snapshot בקובץ:
+    בעליית השרת נטען מה-snapshot, ואם אין – נבנה מחדש ע"י rebuild ונשמר.
+    refresh מזהה snapshot חדש יותר שנכתב ע"י worker אחר (stat זול בכל קריאה)
+    וטוען אותו ב-thread ברקע – הבקשה לא מחכה לטעינה של כל האוסף.
+    """
+
+    def __init__(self, name: str, index, path: Path, rebuild: Callable[[], None]):
+        self.name = name
+        self.index = index
+        self.path = path
+        self._rebuild = rebuild
+        self._stamp: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self._reloading: Optional[threading.Thread] = None
+
+    def load_or_rebuild(self) -> None:
+        started = time.perf_counter()
+        if self.index.load(self.path):
+            source = "snapshot"
+        else:
+            self._rebuild()
+            self.save()
+            source = "rebuilt from Mongo"
+        self._stamp = file_stamp(self.path)
+        print(f"🔎 {self.name} index {source}: {self.index.stats()} in {time.perf_counter() - started:.2f}s")
+
+    def save(self) -> None:
+        # שמירה מכמה threads באותו תהליך (למשל rebuild בעלייה וריצה ידנית) – אותו קובץ tmp
+        with self._lock:
+            try:
+                self.index.save(self.path)
+                self._stamp = file_stamp(self.path)
+            except OSError as e:
+                print(f"⚠️ {self.name} snapshot not saved:", e)
+
+    def refresh(self, wait: bool = False) -> None:
+        """
+        מתחיל טעינה ברקע אם ה-snapshot בקובץ חדש מזה שבזיכרון; עד שהיא מסתיימת
+        ממשיכים עם האינדקס הנוכחי. wait=True מחכה לטעינה (לפני ingestion, כדי
+        לא להחיל עדכונים על אינדקס שעומד להתחלף).
+        """
+        stamp = file_stamp(self.path)
+        with self._lock:
+            if stamp is not None and stamp != self._stamp and self._reloading is None:
+                self._reloading = threading.Thread(target=self._reload, args=(stamp,),
+                                                   name=f"{self.name}-index-reload", daemon=True)
+                self._reloading.start()
+            reloading = self._reloading
+        if wait and reloading is not None:
+            reloading.join()
+
+    def _reload(self, stamp: tuple) -> None:
+        started = time.perf_counter()
+        try:
+            loaded = self.index.load(self.path)
+        finally:
+            with self._lock:
+                # גם טעינה שנכשלה לא מנוסה שוב עד שה-snapshot ישתנה
+                self._stamp = stamp
+                self._reloading = None
+        print(f"🔄 {self.name} index reloaded={loaded}: {self.index.stats()} in {time.perf_counter() - started:.2f}s")
@@ -59,3 +59,25 @@ def render_news(item: Any) -> dict:
 
 def render_list(items: list[Any]) -> list[dict]:
     return [render_news(i) for i in items]
+
+
+def render_raw(doc: dict) -> dict:
+    """
+    מסלול מהיר ל-dict גולמי ממונגו (LIST_FIELDS בלבד): מיפוי ישיר למבנה
+    של render_news, בלי מודל ביניים ובלי לנסות שמות חלופיים.
+    """
+    return {
+        "id": doc["id"],
+        "title": doc.get("title", ""),
+        "summary": doc.get("summary", ""),
+        "url": doc.get("url", ""),
+        "publishedAt": doc.get("published_at") or "",
+        "category": doc.get("topic") or "",
+        "entities": doc.get("entities") or [],
+        "score": doc.get("score") or 0.0,
+        "imageUrl": doc.get("imageUrl"),
+    }
+
+
+def render_raw_list(docs: list[dict]) -> list[dict]:
+    return [render_raw(d) for d in docs]
@@ -0,0 +1,14 @@
+# backend/views/responses.py
+import orjson
+from fastapi.responses import Response
+
+
+class OrjsonResponse(Response):
+    """
+    תשובת JSON שמסודרת ב-orjson. מיועדת לתוכן שכבר בצורת התשובה
+    (dict / list של טיפוסים בסיסיים) – בלי jsonable_encoder של FastAPI.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
@@ -1,6 +1,9 @@
 import json
+import time
+from datetime import datetime, timezone
 from kafka import KafkaConsumer
-from pymongo import MongoClient
+from pymongo import InsertOne, MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure, PyMongoError
 import os
 
 # ---- הגדרות סביבה ----
@@ -9,6 +12,13 @@ TOPIC = os.getenv("TOPIC_NEWS_CLASSIFIED", "news.classified")
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 DB_NAME = os.getenv("MONGO_DB_NAME", "cloud_news")
 COLLECTION_NAME = os.getenv("MONGO_COLLECTION", "articles")
+# הודעות שלא ניתן לכתוב (poison) נשמרות כאן עם השגיאה, במקום לחסום את התור
+DEAD_LETTER_COLLECTION = os.getenv("MONGO_DEAD_LETTER_COLLECTION", f"{COLLECTION_NAME}_failed")
+# כמה הודעות לאסוף ל-bulk_write אחד, וכמה זמן לחכות להודעות לפני כתיבה חלקית
+BATCH_SIZE = int(os.getenv("CONSUMER_BATCH_SIZE", "200"))
+POLL_TIMEOUT_MS = int(os.getenv("CONSUMER_POLL_TIMEOUT_MS", "1000"))
+# כמה ימים כתבה נשמרת מהפעם הראשונה שנכתבה (TTL של מונגו); 0 = לתמיד
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "0"))
 
 # ---- פונקציית עזר לפענוח JSON ----
 def safe_json_load(msg):
@@ -25,35 +35,148 @@ try:
     mongo_client = MongoClient(MONGO_URL)
     db = mongo_client[DB_NAME]
     collection = db[COLLECTION_NAME]
+    dead_letter = db[DEAD_LETTER_COLLECTION]
     print(f"✅ Connected to MongoDB at {MONGO_URL}, using DB '{DB_NAME}', collection '{COLLECTION_NAME}'")
 except Exception as e:
     print(f"❌ Failed to connect to MongoDB: {e}")
     exit(1)
 
+# ---- כפילויות ו-retention ----
+def dedupe_articles():
+    # עותקים כפולים לפי url (מהתקופה של insert_one): נשאר האחרון שנכתב, ואז אינדקס unique
+    groups = collection.aggregate([
+        {"$match": {"url": {"$type": "string"}}},
+        {"$sort": {"_id": -1}},
+        {"$group": {"_id": "$url", "ids": {"$push": "$_id"}, "n": {"$sum": 1}}},
+        {"$match": {"n": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    extra = [i for g in groups for i in g["ids"][1:]]
+    for start in range(0, len(extra), 1000):
+        collection.delete_many({"_id": {"$in": extra[start:start + 1000]}})
+    collection.create_index("url", name="url_unique", unique=True,
+                            partialFilterExpression={"url": {"$type": "string"}})
+    print(f"🧹 Removed {len(extra)} duplicate articles")
+
+def ensure_ttl():
+    # מונגו מוחק לבד כתבות שנכתבו לראשונה לפני יותר מ-RETENTION_DAYS ימים;
+    # כתבות ישנות בלי ingested_at מקבלות את זמן ההפעלה
+    ttl = RETENTION_DAYS * 86400
+    collection.update_many({"ingested_at": {"$exists": False}},
+                           {"$set": {"ingested_at": datetime.now(timezone.utc)}})
+    try:
+        collection.create_index("ingested_at", name="ingested_at_ttl", expireAfterSeconds=ttl)
+    except OperationFailure:
+        # האינדקס כבר קיים עם תקופה אחרת – מעדכנים אותו במקום
+        db.command("collMod", COLLECTION_NAME, index={"name": "ingested_at_ttl", "expireAfterSeconds": ttl})
+    print(f"⏳ Articles expire {RETENTION_DAYS} days after first write")
+
+try:
+    dedupe_articles()
+    if RETENTION_DAYS > 0:
+        ensure_ttl()
+except Exception as e:
+    print(f"⚠️ Retention setup failed: {e}")
+
 # ---- חיבור לקפקה ----
 consumer = KafkaConsumer(
     TOPIC,
     bootstrap_servers=BOOTSTRAP,
     auto_offset_reset="earliest",
-    enable_auto_commit=True,
+    # commit ידני אחרי כל כתיבה למונגו – לא מאבדים הודעות אם הכתיבה נכשלת
+    enable_auto_commit=False,
     group_id="cloud-news-consumer",
     value_deserializer=safe_json_load,
 )
 
 print(f"📥 Listening to Kafka topic: {TOPIC}")
 
-# ---- לולאת קריאה ----
-for msg in consumer:
-    data = msg.value
-    if not data:
-        continue
+# ---- כתיבה באצ'ים ----
+def to_write(data):
+    # upsert לפי url – הודעה שנקראה פעמיים לא יוצרת מסמך כפול.
+    # ingested_at נקבע רק ביצירה, כך שפרסום חוזר של אותה כתבה לא מאריך את ה-TTL שלה
+    now = datetime.now(timezone.utc)
+    if data.get("url"):
+        return UpdateOne({"url": data["url"]}, {"$set": data, "$setOnInsert": {"ingested_at": now}}, upsert=True)
+    return InsertOne({**data, "ingested_at": now})
+
+def is_transient(e):
+    # מונגו לא זמין / failover – שווה לנסות שוב את כל הבאץ'
+    return isinstance(e, ConnectionFailure) or (isinstance(e, PyMongoError) and e.has_error_label("RetryableWriteError"))
+
+def skip_failed(data, error):
+    # הודעה שלא תצליח גם בניסיון חוזר (שדה immutable, מסמך לא תקין...) – מדלגים ושומרים בצד
+    print(f"⚠️ Skipping article {data.get('url') or data.get('title')}: {error}")
+    try:
+        dead_letter.insert_one({"data": json.loads(json.dumps(data, default=str)), "error": str(error),
+                                "failed_at": datetime.now(timezone.utc)})
+    except Exception as e:
+        print(f"❌ Dead-letter write failed: {e}")
+
+def write_one(data):
+    try:
+        collection.bulk_write([to_write(data)])
+        return True
+    except Exception as e:
+        if is_transient(e):
+            raise
+        skip_failed(data, e)
+        return False
 
-    title = data.get("title", "ללא כותרת")
-    category = data.get("category", "?")
-    print(f"✅ כתבה חדשה: {title} | קטגוריה: {category}")
+def write_batch(batch):
+    try:
+        res = collection.bulk_write([to_write(d) for d in batch], ordered=False)
+    except BulkWriteError as e:
+        if e.details.get("writeConcernErrors"):
+            raise
+        # unordered: שאר המסמכים נכתבו; מטפלים רק בכושלים
+        skipped = 0
+        for err in e.details.get("writeErrors", []):
+            data = batch[err["index"]]
+            if err.get("code") == 11000:
+                # duplicate key מ-upsert מקביל על אותו url – ניסיון חוזר אחד בדרך כלל מצליח
+                skipped += not write_one(data)
+            else:
+                skip_failed(data, err.get("errmsg"))
+                skipped += 1
+        print(f"💾 Saved {len(batch) - skipped} of {len(batch)} to MongoDB ({skipped} skipped)\n")
+        return
+    except Exception as e:
+        if is_transient(e):
+            raise
+        # נכשל לפני הכתיבה (למשל מסמך שלא ניתן לקודד ל-BSON) – אחד-אחד, כדי לבודד את ההודעה הבעייתית
+        for data in batch:
+            write_one(data)
+        return
+    print(f"💾 Saved {len(batch)} to MongoDB: {res.upserted_count} new, "
+          f"{res.modified_count} updated, {res.inserted_count} inserted\n")
 
+# ---- לולאת קריאה ----
+retry_delay = 1
+while True:
+    records = consumer.poll(timeout_ms=POLL_TIMEOUT_MS, max_records=BATCH_SIZE)
+    batch = []
+    for msgs in records.values():
+        for msg in msgs:
+            data = msg.value
+            if not data:
+                continue
+            title = data.get("title", "ללא כותרת")
+            category = data.get("category", "?")
+            print(f"✅ כתבה חדשה: {title} | קטגוריה: {category}")
+            batch.append(data)
+
+    if not records:
+        continue
     try:
-        collection.insert_one(data)
-        print("💾 Saved to MongoDB!\n")
+        if batch:
+            write_batch(batch)
+        consumer.commit()
+        retry_delay = 1
     except Exception as e:
-        print(f"❌ Error saving to MongoDB: {e}")
+        # רק שגיאות זמניות (חיבור / failover) מגיעות לכאן – הודעות פגומות כבר דולגו
+        print(f"❌ Error saving to MongoDB: {e} – retrying in {retry_delay}s")
+        # חוזרים לתחילת הבאץ' שנכשל כדי לנסות שוב ב-poll הבא, עם backoff
+        for tp, msgs in records.items():
+            consumer.seek(tp, msgs[0].offset)
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 30)
@@ -71,9 +71,15 @@ def _fetch(category: str = "all", limit: int = 50, q: str = "",
     מביא כתבות מהשרת → מסנן בפרונט → ממיין → מחזיר ל-UI.
     """
 
-    # 1) שליפה מהבקאנד (ללא category — תמיד מחזירים הכל)
+    # 1) שליפה מהבקאנד (ללא category — תמיד מחזירים הכל).
+    #    עם חיפוש ושרת אמיתי – החיפוש רץ בשרת על כל הכתבות, לא רק על limit האחרונות
+    searched = False
     try:
-        data = (client or mock_client).list_news(limit=limit)
+        if q and http_client is not None:
+            data = http_client.search(q, limit=limit)
+            searched = True
+        else:
+            data = (client or mock_client).list_news(limit=limit)
     except Exception:
         data = mock_client.list_news(limit=limit)
 
@@ -100,8 +106,8 @@ def _fetch(category: str = "all", limit: int = 50, q: str = "",
         cat_l = category.lower()
         data = [a for a in data if a.get("category", "").lower() == cat_l]
 
-    # 4) חיפוש טקסטואלי
-    if q:
+    # 4) חיפוש טקסטואלי (רק אם השרת לא חיפש כבר)
+    if q and not searched:
         ql = q.lower()
         data = [
             a for a in data
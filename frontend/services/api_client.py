@@ -1,7 +1,7 @@
 import os, json
 from pathlib import Path
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 # 👈 שימי לב: schema נמצא עכשיו מתחת models, ולכן שני נקודות
 from ..models.schema import Article  # אם אין לך שימוש ב-Article פה, אפשר גם להסיר
@@ -29,32 +29,62 @@ class MockNewsClient(NewsClient):
 
 
 class HttpNewsClient(NewsClient):
+    # גודל עמוד מקסימלי לבקשה אחת; limit גדול יותר נאסף בכמה עמודים לפי ה-cursor
+    PAGE_SIZE = 50
+
     def __init__(self, base_url: str):
         self.base_url = (base_url or "").rstrip("/")
+        # ה-cursor שהשרת החזיר אחרי הקריאה האחרונה (None = אין עוד כתבות)
+        self.next_cursor: Optional[str] = None
 
-    def list_news(self, category: Optional[str]=None, limit: int=20) -> Articles:
+    def list_news(self, category: Optional[str]=None, limit: int=20,
+                  cursor: Optional[str]=None) -> Articles:
+        """
+        מביא עד limit כתבות, החל מ-cursor (אם ניתן), ועובר עמוד-עמוד לפי
+        X-Next-Cursor. אחרי הקריאה self.next_cursor מצביע על ההמשך.
+        """
+        raw_list = []
+        while len(raw_list) < limit:
+            page, cursor = self._get_page(category, min(self.PAGE_SIZE, limit - len(raw_list)), cursor)
+            raw_list.extend(page)
+            if not cursor:
+                break
+        self.next_cursor = cursor
+        return [self._normalize(a) for a in raw_list]
+
+    def search(self, q: str, category: Optional[str]=None, limit: int=50, offset: int=0) -> Articles:
+        """חיפוש בצד השרת (GET /search) – על כל הכתבות, לא רק על מה שנטען לדף."""
+        params = {"q": q, "limit": limit, "offset": offset}
+        if category and category != "all":
+            params["topic"] = category
+        r = requests.get(f"{self.base_url}/search", params=params, timeout=10)
+        r.raise_for_status()
+        return [self._normalize(a) for a in r.json().get("items", [])]
+
+    def _get_page(self, category: Optional[str], limit: int,
+                  cursor: Optional[str]) -> Tuple[list, Optional[str]]:
         params = {"limit": limit}
         if category and category != "all":
             params["category"] = category
-        
+        if cursor:
+            params["cursor"] = cursor
+
         r = requests.get(f"{self.base_url}/news", params=params, timeout=10)
         r.raise_for_status()
-        raw_list = r.json()
-
-        normalized = []
-        for a in raw_list:
-            normalized.append({
-                "title": a.get("title", ""),
-                "summary": a.get("summary", ""),
-                "url": a.get("url", ""),
-                "publishedAt": a.get("publishedAt") or a.get("published_at") or "",
-                "category": a.get("category", ""),
-                "entities": a.get("entities", []),
-                "score": a.get("score", 0),
-                
-                # 👇 זה הכי חשוב
-                "imageUrl": a.get("imageUrl") or a.get("image") or a.get("urlToImage") or "",
-            })
-
-        return normalized
+        return r.json(), r.headers.get("X-Next-Cursor")
+
+    @staticmethod
+    def _normalize(a: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "title": a.get("title", ""),
+            "summary": a.get("summary", ""),
+            "url": a.get("url", ""),
+            "publishedAt": a.get("publishedAt") or a.get("published_at") or "",
+            "category": a.get("category", ""),
+            "entities": a.get("entities", []),
+            "score": a.get("score", 0),
+
+            # 👇 זה הכי חשוב
+            "imageUrl": a.get("imageUrl") or a.get("image") or a.get("urlToImage") or "",
+        }
 
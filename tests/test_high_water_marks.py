@@ -0,0 +1,42 @@
+# tests/test_high_water_marks.py
+# ה-high-water mark של NewsAPI חייב להתקדם גם כשהעמוד הראשון ממלא את ה-limit
+from backend.providers import news_provider
+from backend.providers.http_cache import HighWaterMarks
+
+
+def _pages(total_pages: int, page_size: int):
+    """תשובות מזויפות של everything: ממוינות מהחדש לישן, total_pages עמודים מלאים."""
+    stamps = [f"2026-10-18T{23 - i // 60:02d}:{59 - i % 60:02d}:00Z" for i in range(total_pages * page_size)]
+    calls = []
+
+    def fake_call(url, params):
+        if url == news_provider._TOP_HEADLINES_URL:
+            # top-headlines ריק – fetch_latest עובר ל-everything, שממוין לפי publishedAt
+            return {"articles": []}
+        calls.append(params["page"])
+        start = (params["page"] - 1) * params["pageSize"]
+        return {
+            "totalResults": len(stamps),
+            "articles": [{"url": f"https://example.com/{i}", "publishedAt": stamps[i]}
+                         for i in range(start, start + params["pageSize"])],
+        }
+
+    return stamps, calls, fake_call
+
+
+def test_limit_cut_on_date_sorted_pages_advances_mark(tmp_path, monkeypatch):
+    page_size = 5
+    stamps, calls, fake_call = _pages(3, page_size)
+    marks = HighWaterMarks(tmp_path / "marks.json")
+    monkeypatch.setattr(news_provider, "_safe_call", fake_call)
+    monkeypatch.setattr(news_provider, "_marks", marks)
+    monkeypatch.setattr(news_provider, "NEWSAPI_KEY", "test-key")
+    monkeypatch.setattr(news_provider, "NEWS_FETCH_MODE", "single")
+
+    out = news_provider.fetch_latest(limit=page_size)
+    news_provider.commit_high_water_marks()
+
+    assert [a["published_at"] for a in out] == stamps[:page_size]
+    assert calls == [1]
+    query = f"everything:{news_provider._EVERYTHING_QUERY}"
+    assert HighWaterMarks(tmp_path / "marks.json").get(query) == stamps[0]